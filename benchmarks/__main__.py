@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import argparse
+import sys
+
+from pathlib import Path
+from typing import Dict, List
+
+from .checks import run_checks
+from .runner import BASELINE_PATH, BenchmarkResult, Regression, compare, load_baseline, run, save_baseline
+
+
+def format_row(result: BenchmarkResult, baseline: Dict[str, Dict[str, float]], width: int) -> str:
+    change: str = ""
+
+    if result.key in baseline:
+        ratio: float = result.ops_per_sec / baseline[result.key]["ops_per_sec"]
+        change = f"{ratio:>7.2f}x"
+
+    return (
+        f"{result.key:<{width}} {result.ops_per_sec:>12.1f} {result.alloc_kib:>10.1f} "
+        f"{result.alloc_blocks:>8d} {result.peak_kib:>10.1f} {change:>8}"
+    )
+
+
+def check() -> int:
+    failed: int = 0
+
+    for name, failures in run_checks().items():
+        print(f"{name}: {'FAIL' if failures else 'ok'}")
+
+        for failure in failures:
+            print(f"  {failure}")
+
+        failed += bool(failures)
+
+    return 1 if failed else 0
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmarks the objective templates of every game in this repository",
+    )
+
+    parser.add_argument("--game", action="append", help="Only run cases for this game class (repeatable)")
+    parser.add_argument("--op", action="append", help="Only run this operation, or import for module import time (repeatable)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Minimum seconds per timing round")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing rounds per operation, best is kept")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="Baseline file to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative regression")
+    parser.add_argument("--strict", action="store_true", help="Exit with an error when regressions are found")
+    parser.add_argument("--check", action="store_true", help="Run the consistency checks instead of timing")
+
+    args = parser.parse_args(argv)
+
+    if args.check:
+        return check()
+
+    baseline: Dict[str, Dict[str, float]] = load_baseline(args.baseline)
+    results: List[BenchmarkResult] = run(args.game, args.op, args.min_time, args.repeat)
+
+    width: int = max((len(result.key) for result in results), default=4)
+
+    print(f"{'case':<{width}} {'ops/sec':>12} {'alloc KiB':>10} {'blocks':>8} {'peak KiB':>10} {'vs base':>8}")
+
+    for result in results:
+        print(format_row(result, baseline, width))
+
+    if args.save_baseline:
+        save_baseline(results, args.baseline)
+        print(f"\nBaseline saved to {args.baseline}")
+
+        return 0
+
+    regressions: List[Regression] = compare(results, baseline, args.tolerance)
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.tolerance:.0%}:")
+
+        for regression in regressions:
+            print(f"  {regression.key} {regression.metric}: {regression.baseline:.1f} -> {regression.current:.1f}")
+
+    return 1 if regressions and args.strict else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
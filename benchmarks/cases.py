@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import itertools
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    game: str
+    variant: str
+    options: Dict[str, Any] = field(default_factory=dict)
+
+
+def toggle_matrix(game: str, option_prefix: str, *toggles: str) -> Iterator[BenchmarkCase]:
+    for values in itertools.product((1, 0), repeat=len(toggles)):
+        variant: str = ",".join(f"{toggle}={value}" for toggle, value in zip(toggles, values))
+        options: Dict[str, Any] = {f"{option_prefix}{toggle}": value for toggle, value in zip(toggles, values)}
+
+        yield BenchmarkCase(game, variant, options)
+
+
+def song_catalog(count: int) -> List[str]:
+    return [f"Song {i:04d}" for i in range(count)]
+
+
+MONSTER_RANCHER_2_DX_CASES: List[BenchmarkCase] = [
+    BenchmarkCase("MonsterRancher2DXGame", "all_unlocked"),
+    BenchmarkCase("MonsterRancher2DXGame", "all_unlocked,stable_tech_sets", {"monster_rancher_2_dx_stable_tech_sets": 1}),
+    BenchmarkCase(
+        "MonsterRancher2DXGame",
+        "none_unlocked",
+        {
+            "monster_rancher_2_dx_unlocked_main_breeds": [],
+            "monster_rancher_2_dx_unlocked_sub_breeds": [],
+        },
+    ),
+    BenchmarkCase(
+        "MonsterRancher2DXGame",
+        "some_unlocked",
+        {
+            "monster_rancher_2_dx_unlocked_main_breeds": ["Bajarl", "Durahan", "Joker", "Mock", "Metalner"],
+            "monster_rancher_2_dx_unlocked_sub_breeds": ["King Ape", "Magma Heart", "Sand Golem"],
+        },
+    ),
+]
+
+MONSTER_HUNTER_CASES: List[BenchmarkCase] = [
+    *toggle_matrix(
+        "MonsterHunter3UltimateGame",
+        "monster_hunter_3_ultimate_",
+        "aged_text_monsters",
+        "include_dlcs",
+    ),
+    *toggle_matrix(
+        "MonsterHunter4UltimateGame",
+        "monster_hunter_4_ultimate_",
+        "aged_text_monsters",
+        "include_apex",
+        "include_dlcs",
+    ),
+    *toggle_matrix(
+        "MonsterHunterGenerationsUltimateGame",
+        "monster_hunter_generations_ultimate_",
+        "include_rank_dependent_monsters",
+        "include_dlc",
+    ),
+    *toggle_matrix(
+        "MonsterHunterWorldGame",
+        "monster_hunter_world_",
+        "iceborne",
+        "include_rank",
+        "include_events",
+    ),
+]
+
+# Games are registered under their name with platforms, which is also how medleys refer to them
+MEDLEY_GAMES: List[str] = [
+    "Monster Rancher 2 DX (PC/IOS/PS1/SW)",
+    "Monster Hunter 3 Ultimate (WIIU/3DS)",
+    "Monster Hunter 4 Ultimate (3DS)",
+    "Monster Hunter Generations Ultimate (SW/3DS)",
+    "Monster Hunter World (PC/PS4/XONE)",
+    "Project Sekai: Colorful Stage (AND/IOS)",
+    "Shiny Pokémon Hunt (META)",
+    "Rabbit & Steel (PC)",
+    "NiGHTS into Dreams... (SAT/PC/PS2/PS3/X360)",
+]
+
+CUSTOM_MEDLEY_CASES: List[BenchmarkCase] = [
+    BenchmarkCase(
+        "CustomMedleyGame",
+        "small_medley",
+        {
+            "custom_medleys": [
+                {"name": "Small", "games": ["Rabbit & Steel (PC)", "NiGHTS into Dreams... (SAT/PC/PS2/PS3/X360)"]},
+            ],
+        },
+    ),
+    BenchmarkCase(
+        "CustomMedleyGame",
+        "large_medley",
+        {
+            "custom_medleys": [
+                {
+                    "name": "Large",
+                    "games": MEDLEY_GAMES,
+                    "exclude_difficult": ["Monster Hunter World (PC/PS4/XONE)"],
+                    "exclude_time_consuming": ["Shiny Pokémon Hunt (META)"],
+                },
+            ],
+        },
+    ),
+]
+
+PROJECT_SEKAI_CASES: List[BenchmarkCase] = [
+    BenchmarkCase("ProjectSekaiColorfulStageGame", "default"),
+    BenchmarkCase(
+        "ProjectSekaiColorfulStageGame",
+        "master,songs=50",
+        {
+            "project_sekai_colorful_stage_maximum_difficulty": 4,
+            "project_sekai_colorful_stage_additional_songs": song_catalog(50),
+        },
+    ),
+    BenchmarkCase(
+        "ProjectSekaiColorfulStageGame",
+        "master,songs=2000",
+        {
+            "project_sekai_colorful_stage_maximum_difficulty": 4,
+            "project_sekai_colorful_stage_additional_songs": song_catalog(2000),
+        },
+    ),
+]
+
+SHINY_POKEMON_HUNT_CASES: List[BenchmarkCase] = [
+    BenchmarkCase("ShinyPokemonHuntGame", "all_owned"),
+    BenchmarkCase("ShinyPokemonHuntGame", "all_owned,no_modern", {"include_modern_console_games": 0}),
+    BenchmarkCase("ShinyPokemonHuntGame", "none_owned", {"shiny_pokemon_hunt_owned_games": []}),
+    BenchmarkCase("ShinyPokemonHuntGame", "xy_owned", {"shiny_pokemon_hunt_owned_games": ["X/Y"]}),
+]
+
+RABBIT_AND_STEEL_CASES: List[BenchmarkCase] = [
+    BenchmarkCase("RabbitAndSteelGame", "default"),
+    BenchmarkCase("RabbitAndSteelGame", "lunar", {"rabbit_and_steel_allow_lunar": 1}),
+    BenchmarkCase("RabbitAndSteelGame", "no_unlocks", {"rabbit_and_steel_unlocked_characters": []}),
+]
+
+NIGHTS_INTO_DREAMS_CASES: List[BenchmarkCase] = [
+    *toggle_matrix("NightsIntoDreamsGame", "nights_into_dreams_", "enable_christmas"),
+]
+
+CASES: List[BenchmarkCase] = [
+    *MONSTER_RANCHER_2_DX_CASES,
+    *MONSTER_HUNTER_CASES,
+    *CUSTOM_MEDLEY_CASES,
+    *PROJECT_SEKAI_CASES,
+    *SHINY_POKEMON_HUNT_CASES,
+    *RABBIT_AND_STEEL_CASES,
+    *NIGHTS_INTO_DREAMS_CASES,
+]
+
+
+def resolve_objective_data(game: Any) -> int:
+    resolved: int = 0
+
+    for template in game.game_objective_templates():
+        for collection_callable, _ in template.data.values():
+            resolved += len(collection_callable())
+
+    return resolved
+
+
+def fresh_instance_templates(game: Any) -> Any:
+    fresh = type(game)(random=game.random, archipelago_options=game.archipelago_options)
+    fresh.optional_game_constraint_templates()
+
+    return fresh.game_objective_templates()
+
+
+# An operation is timed against a warm game instance that already had its constraints rolled
+Operation = Callable[[Any], Any]
+
+OPERATIONS: Dict[str, Operation] = {
+    "game_objective_templates": lambda game: game.game_objective_templates(),
+    "optional_game_constraint_templates": lambda game: game.optional_game_constraint_templates(),
+    "objective_data": resolve_objective_data,
+    "fresh_instance": fresh_instance_templates,
+}
+
+# Game class name -> extra operations only meaningful for that game
+GAME_OPERATIONS: Dict[str, Dict[str, Operation]] = {
+    "MonsterRancher2DXGame": {
+        "monsters": lambda game: game.monsters(),
+    },
+}
+
+
+def operations_for(game: str) -> List[Tuple[str, Operation]]:
+    return [*OPERATIONS.items(), *GAME_OPERATIONS.get(game, dict()).items()]
@@ -0,0 +1,436 @@
+from __future__ import annotations
+
+import collections
+import gc
+import importlib
+import itertools
+import math
+import sys
+import weakref
+
+from random import Random
+from typing import Any, Callable, Dict, Iterator, List, Optional, Type
+
+from .cases import BenchmarkCase, CASES
+from .harness import GAMES_PACKAGE, build_options, load_games, option_classes
+
+
+# A check returns a description of every failure it found
+Check = Callable[[Dict[str, Type[Any]]], List[str]]
+
+# Draws per sampler, and how many standard deviations a template's draw count may stray from its weight
+SAMPLER_DRAWS: int = 20000
+SAMPLER_DEVIATIONS: float = 5.0
+
+MONSTER_HUNTER_GAMES: List[str] = [
+    "MonsterHunter3UltimateGame",
+    "MonsterHunter4UltimateGame",
+    "MonsterHunterGenerationsUltimateGame",
+    "MonsterHunterWorldGame",
+]
+
+
+def toggle_combinations(game_cls: Type[Any]) -> Iterator[Dict[str, int]]:
+    options: List[str] = list(option_classes(game_cls))
+
+    for values in itertools.product((1, 0), repeat=len(options)):
+        yield dict(zip(options, values))
+
+
+def check_monster_hunter_capturable(games: Dict[str, Type[Any]]) -> List[str]:
+    """
+    The capturable index matches the set difference it replaced: every monster not in the title's
+    non-capture list, sorted and without duplicates.
+    """
+
+    failures: List[str] = list()
+
+    for class_name in MONSTER_HUNTER_GAMES:
+        game_cls: Type[Any] = games[class_name]
+        non_capture: Any = sys.modules[game_cls.__module__].non_capture
+
+        for options in toggle_combinations(game_cls):
+            game: Any = game_cls(random=Random(0), archipelago_options=build_options(games, **options))
+            expected: List[str] = sorted(set(game.monsters()).difference(non_capture))
+
+            if list(game.capturable()) != expected:
+                failures.append(f"{class_name} {options}: capturable differs from monsters minus non-capture")
+
+            if not isinstance(game.capturable(), tuple):
+                failures.append(f"{class_name} {options}: capturable is not a tuple")
+
+    return failures
+
+
+def first_cases() -> Iterator[BenchmarkCase]:
+    seen: set = set()
+
+    for case in CASES:
+        if case.game not in seen:
+            seen.add(case.game)
+            yield case
+
+
+def check_catalog_isolation(games: Dict[str, Type[Any]]) -> List[str]:
+    """
+    Games sharing a catalog get no data bound to the instance that built it, and that instance can still be collected
+    """
+
+    failures: List[str] = list()
+
+    for case in first_cases():
+        first: Any = games[case.game](random=Random(0), archipelago_options=build_options(games, **case.options))
+        first.optional_game_constraint_templates()
+        first.game_objective_templates()
+
+        second: Any = games[case.game](random=Random(0), archipelago_options=build_options(games, **case.options))
+        second.optional_game_constraint_templates()
+
+        for template in second.game_objective_templates():
+            for collection_callable, _ in template.data.values():
+                owner: Any = getattr(getattr(collection_callable, "func", collection_callable), "__self__", None)
+
+                if owner is first:
+                    failures.append(f"{case.game}/{case.variant}: '{template.label}' data bound to another instance")
+
+        reference: weakref.ref = weakref.ref(first)
+        del first
+        gc.collect()
+
+        if reference() is not None:
+            failures.append(f"{case.game}/{case.variant}: the instance that built the catalog is kept alive")
+
+    return failures
+
+
+def check_template_sampler(games: Dict[str, Type[Any]]) -> List[str]:
+    """
+    The template sampler draws every template as often as its weight says, within SAMPLER_DEVIATIONS standard
+    deviations of a binomial draw count, and never draws templates filtered out of the game.
+    """
+
+    objective_catalog: Any = importlib.import_module(f"{GAMES_PACKAGE}.objective_catalog")
+    failures: List[str] = list()
+
+    for case in first_cases():
+        for include in (True, False):
+            game: Any = games[case.game](
+                random=Random(0),
+                include_time_consuming_objectives=include,
+                include_difficult_objectives=include,
+                archipelago_options=build_options(games, **case.options),
+            )
+
+            expected: List[Any] = game.filter_game_objective_templates()
+            sampler: Any = objective_catalog.sampler_for(game)
+
+            if [id(template) for template in sampler.templates] != [id(template) for template in expected]:
+                failures.append(f"{case.game}/{case.variant} include={include}: sampler templates differ from filter")
+                continue
+
+            if not expected:
+                continue
+
+            random: Random = Random(0)
+            draws: collections.Counter = collections.Counter(
+                id(sampler.sample(random)) for _ in range(SAMPLER_DRAWS)
+            )
+
+            total: int = sum(template.weight for template in expected)
+
+            for template in expected:
+                p: float = template.weight / total
+                mean: float = SAMPLER_DRAWS * p
+                deviation: float = math.sqrt(SAMPLER_DRAWS * p * (1 - p)) or 1.0
+
+                if abs(draws[id(template)] - mean) > SAMPLER_DEVIATIONS * deviation:
+                    failures.append(
+                        f"{case.game}/{case.variant} include={include}: '{template.label}' drawn "
+                        f"{draws[id(template)]} times, expected {mean:.0f}"
+                    )
+
+            if sum(draws.values()) != sum(draws[id(template)] for template in expected):
+                failures.append(f"{case.game}/{case.variant} include={include}: drew a filtered template")
+
+    return failures
+
+
+def check_batch_generation(games: Dict[str, Type[Any]]) -> List[str]:
+    """
+    Batch generation draws the same objectives as Game.generate_objectives from the same random, including later
+    batches of a session reusing data from earlier ones
+    """
+
+    objective_generation: Any = importlib.import_module(f"{GAMES_PACKAGE}.objective_generation")
+    failures: List[str] = list()
+
+    for case in CASES:
+        games_from_seed: List[Any] = [
+            games[case.game](
+                random=Random(0),
+                include_time_consuming_objectives=True,
+                include_difficult_objectives=True,
+                archipelago_options=build_options(games, **case.options),
+            )
+            for _ in range(2)
+        ]
+
+        session: Any = objective_generation.GenerationSession()
+
+        for batch in range(2):
+            if games_from_seed[0].generate_objectives(200) != session.generate_objectives(games_from_seed[1], 200):
+                failures.append(
+                    f"{case.game}/{case.variant}: batch {batch} objectives differ from Game.generate_objectives"
+                )
+
+    return failures
+
+
+def check_volatile_data(games: Dict[str, Type[Any]]) -> List[str]:
+    """
+    Data callables of every kind, bound methods included, can be marked volatile. Marked callables give the same
+    results and are never kept in a session's pools.
+    """
+
+    objective_generation: Any = importlib.import_module(f"{GAMES_PACKAGE}.objective_generation")
+    failures: List[str] = list()
+
+    for case in first_cases():
+        game: Any = games[case.game](random=Random(0), archipelago_options=build_options(games, **case.options))
+        game.optional_game_constraint_templates()
+
+        for template in game.game_objective_templates():
+            for collection_callable, _ in template.data.values():
+                try:
+                    marked: Any = objective_generation.volatile(collection_callable)
+                except Exception as error:
+                    failures.append(f"{case.game}/{case.variant}: can't mark '{template.label}' data: {error}")
+                    continue
+
+                pools: Dict[Any, Any] = dict()
+
+                if not getattr(marked, "volatile", False):
+                    failures.append(f"{case.game}/{case.variant}: marked '{template.label}' data isn't volatile")
+
+                if not getattr(collection_callable, "volatile", False):
+                    if list(objective_generation.pool_for(marked, pools)) != list(collection_callable()):
+                        failures.append(f"{case.game}/{case.variant}: marked '{template.label}' data differs")
+
+                if pools:
+                    failures.append(f"{case.game}/{case.variant}: marked '{template.label}' data kept in pools")
+
+    return failures
+
+
+def check_objective_stream(games: Dict[str, Type[Any]]) -> List[str]:
+    """
+    Streamed objectives never repeat within the stream's window
+    """
+
+    objective_generation: Any = importlib.import_module(f"{GAMES_PACKAGE}.objective_generation")
+    failures: List[str] = list()
+
+    window: int = 20
+
+    for case in first_cases():
+        game: Any = games[case.game](
+            random=Random(0),
+            include_time_consuming_objectives=True,
+            include_difficult_objectives=True,
+            archipelago_options=build_options(games, **case.options),
+        )
+
+        objectives: List[str] = list(itertools.islice(objective_generation.stream_objectives(game, window), 500))
+
+        for i in range(len(objectives)):
+            if objectives[i] in objectives[max(0, i - window):i]:
+                failures.append(f"{case.game}/{case.variant}: '{objectives[i]}' repeated within the window")
+                break
+
+    return failures
+
+
+def check_objective_space(games: Dict[str, Type[Any]]) -> List[str]:
+    """
+    Rolling a small template long enough renders exactly as many distinct labels as the objective space counts.
+    Templates with repeated pool values or volatile data only have a lower bound and are skipped.
+    """
+
+    objective_generation: Any = importlib.import_module(f"{GAMES_PACKAGE}.objective_generation")
+    objective_space: Any = importlib.import_module(f"{GAMES_PACKAGE}.objective_space")
+    failures: List[str] = list()
+
+    for case in first_cases():
+        game: Any = games[case.game](
+            random=Random(0),
+            include_time_consuming_objectives=True,
+            include_difficult_objectives=True,
+            archipelago_options=build_options(games, **case.options),
+        )
+
+        game.optional_game_constraint_templates()
+
+        random: Random = Random(0)
+        pools: Dict[Any, Any] = dict()
+
+        for space in objective_space.objective_space(game):
+            if space.renderings > 1000:
+                continue
+
+            data: List[Any] = [collection_callable for collection_callable, _ in space.template.data.values()]
+
+            if any(getattr(collection_callable, "volatile", False) for collection_callable in data):
+                continue
+
+            if any(len(set(collection_callable())) != len(collection_callable()) for collection_callable in data):
+                continue
+
+            labels: set = {
+                objective_generation.render_objective(space.template, random, pools)
+                for _ in range(20 * space.renderings)
+            }
+
+            if len(labels) != space.renderings:
+                failures.append(
+                    f"{case.game}/{case.variant}: '{space.template.label}' rendered {len(labels)} labels, "
+                    f"counted {space.renderings}"
+                )
+
+    return failures
+
+
+def check_unique_objectives(games: Dict[str, Type[Any]]) -> List[str]:
+    """
+    The unique objective roller rolls every objective of a small game exactly once before running out, the same
+    values in another order counting as the same objective
+    """
+
+    objective_space: Any = importlib.import_module(f"{GAMES_PACKAGE}.objective_space")
+    unique_objectives: Any = importlib.import_module(f"{GAMES_PACKAGE}.unique_objectives")
+    failures: List[str] = list()
+
+    for case in first_cases():
+        game: Any = games[case.game](
+            random=Random(0),
+            include_time_consuming_objectives=True,
+            include_difficult_objectives=True,
+            archipelago_options=build_options(games, **case.options),
+        )
+
+        game.optional_game_constraint_templates()
+
+        spaces: List[Any] = objective_space.objective_space(game)
+
+        if any(space.combinations > unique_objectives.ENUMERATION_LIMIT for space in spaces):
+            continue
+
+        roller: Any = unique_objectives.UniqueObjectiveRoller(game)
+        objectives: List[str] = roller.roll_objectives(100000)
+
+        expected: set = {
+            key for space in spaces
+            for key in unique_objectives.enumerate_objectives(space.template, roller.session.pools)
+        }
+
+        if len(objectives) != len(roller.seen):
+            failures.append(f"{case.game}/{case.variant}: rolled a repeated objective")
+
+        if roller.seen != expected:
+            failures.append(f"{case.game}/{case.variant}: rolled {len(roller.seen)} of {len(expected)} objectives")
+
+    return failures
+
+
+def check_instrumentation(games: Dict[str, Type[Any]]) -> List[str]:
+    """
+    Instrumented games generate the same objectives, every template method is recorded, the data of constraint
+    templates is instrumented too, allocations are never negative, and disabling puts every game back as it was
+    """
+
+    instrumentation: Any = importlib.import_module(f"{GAMES_PACKAGE}.instrumentation")
+    failures: List[str] = list()
+
+    template_methods: List[str] = ["game_objective_templates", "optional_game_constraint_templates"]
+
+    def create(case: BenchmarkCase) -> Any:
+        return games[case.game](
+            random=Random(0),
+            include_time_consuming_objectives=True,
+            include_difficult_objectives=True,
+            archipelago_options=build_options(games, **case.options),
+        )
+
+    def methods() -> Dict[Any, Any]:
+        return {
+            (name, method): vars(game_cls).get(method)
+            for name, game_cls in games.items()
+            for method in template_methods
+        }
+
+    originals: Dict[Any, Any] = methods()
+
+    for case in first_cases():
+        expected: Any = create(case).generate_objectives(50)
+
+        instrumentation.enable(trace_allocations=True)
+
+        try:
+            game: Any = create(case)
+            objectives: Any = game.generate_objectives(50)
+            constraint_templates: List[Any] = game.optional_game_constraint_templates()
+        finally:
+            recorded: Any = instrumentation.disable()
+
+        if objectives != expected:
+            failures.append(f"{case.game}/{case.variant}: instrumented objectives differ")
+
+        for method in template_methods:
+            if not any(stack[-1] == f"{case.game}.{method}" for stack in recorded.records):
+                failures.append(f"{case.game}/{case.variant}: {method} not recorded")
+
+        for template in constraint_templates:
+            for collection_callable, _ in template.data.values():
+                if not getattr(collection_callable, "instrumented", False):
+                    failures.append(f"{case.game}/{case.variant}: constraint '{template.label}' data not instrumented")
+
+        if any(record.peak_allocated < 0 for record in recorded.records.values()):
+            failures.append(f"{case.game}/{case.variant}: negative allocations recorded")
+
+    # Games sharing a base class record their data under their own names
+    instrumentation.enable()
+
+    try:
+        for class_name in MONSTER_HUNTER_GAMES:
+            games[class_name](random=Random(0), archipelago_options=build_options(games)).generate_objectives(50)
+    finally:
+        recorded = instrumentation.disable()
+
+    for stack in recorded.records:
+        if not stack[-1].startswith(tuple(f"{class_name}." for class_name in MONSTER_HUNTER_GAMES)):
+            failures.append(f"{stack[-1]} isn't named after the game it was recorded for")
+
+    if methods() != originals:
+        failures.append("disabling instrumentation didn't restore the template methods")
+
+    return failures
+
+
+CHECKS: Dict[str, Check] = {
+    "monster_hunter_capturable": check_monster_hunter_capturable,
+    "catalog_isolation": check_catalog_isolation,
+    "template_sampler": check_template_sampler,
+    "batch_generation": check_batch_generation,
+    "volatile_data": check_volatile_data,
+    "objective_stream": check_objective_stream,
+    "objective_space": check_objective_space,
+    "unique_objectives": check_unique_objectives,
+    "instrumentation": check_instrumentation,
+}
+
+
+def run_checks(selected: Optional[List[str]] = None) -> Dict[str, List[str]]:
+    games: Dict[str, Type[Any]] = load_games()
+
+    return {
+        name: check(games) for name, check in CHECKS.items() if not selected or name in selected
+    }
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import importlib
+import sys
+import types
+import typing
+
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List, Type
+
+
+REPO_ROOT: Path = Path(__file__).resolve().parent.parent
+STUBS_ROOT: Path = Path(__file__).resolve().parent / "stubs"
+
+GAMES_PACKAGE: str = "keymasters_keep.games"
+
+# Game class name -> module, in the order they are reported
+GAME_MODULES: Dict[str, str] = {
+    "MonsterRancher2DXGame": "monster_rancher_2_dx_game",
+    "MonsterHunter3UltimateGame": "monster_hunter_3_ultimate_game",
+    "MonsterHunter4UltimateGame": "monster_hunter_4_ultimate_game",
+    "MonsterHunterGenerationsUltimateGame": "monster_hunter_generations_ultimate_game",
+    "MonsterHunterWorldGame": "monster_hunter_world_game",
+    "CustomMedleyGame": "custom_medley_game",
+    "ProjectSekaiColorfulStageGame": "project_sekai_colorful_stage_game",
+    "ShinyPokemonHuntGame": "shiny_pokemon_hunt_game",
+    "RabbitAndSteelGame": "rabbit_and_steel_game",
+    "NightsIntoDreamsGame": "nights_into_dreams_game",
+}
+
+# Options that live on the Keymaster's Keep options themselves rather than on a game
+GLOBAL_OPTION_DEFAULTS: Dict[str, int] = {
+    "include_adult_only_or_unrated_games": 0,
+    "include_modern_console_games": 1,
+}
+
+
+def install_stubs() -> types.ModuleType:
+    """
+    Makes the stand-in host modules importable and mounts the repository root as the games package
+    """
+
+    if str(STUBS_ROOT) not in sys.path:
+        sys.path.insert(0, str(STUBS_ROOT))
+
+    keymasters_keep = importlib.import_module("keymasters_keep")
+
+    if GAMES_PACKAGE not in sys.modules:
+        games = types.ModuleType(GAMES_PACKAGE)
+        games.__path__ = [str(REPO_ROOT)]
+        games.__package__ = GAMES_PACKAGE
+
+        sys.modules[GAMES_PACKAGE] = games
+        keymasters_keep.games = games
+
+    return sys.modules[GAMES_PACKAGE]
+
+
+def load_games() -> Dict[str, Type[Any]]:
+    install_stubs()
+
+    return {
+        class_name: getattr(importlib.import_module(f"{GAMES_PACKAGE}.{module_name}"), class_name)
+        for class_name, module_name in GAME_MODULES.items()
+    }
+
+
+def option_classes(game_cls: Type[Any]) -> Dict[str, Type[Any]]:
+    if game_cls.options_cls is None:
+        return dict()
+
+    module_globals: Dict[str, Any] = vars(sys.modules[game_cls.__module__])
+    return typing.get_type_hints(game_cls.options_cls, globalns=module_globals)
+
+
+def build_options(games: Dict[str, Type[Any]], **overrides: Any) -> SimpleNamespace:
+    """
+    Builds an archipelago_options stand-in holding every option of every game, at default unless overridden
+    """
+
+    Toggle = importlib.import_module("Options").Toggle
+
+    values: Dict[str, Any] = dict()
+
+    for option_name, default in GLOBAL_OPTION_DEFAULTS.items():
+        values[option_name] = Toggle(overrides.get(option_name, default))
+
+    for game_cls in games.values():
+        for option_name, option_cls in option_classes(game_cls).items():
+            values[option_name] = option_cls(overrides.get(option_name))
+
+    unknown: List[str] = sorted(set(overrides).difference(values))
+
+    if unknown:
+        raise KeyError(f"Unknown options: {', '.join(unknown)}")
+
+    return SimpleNamespace(**values)
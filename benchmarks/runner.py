@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import gc
+import importlib
+import importlib.util
+import json
+import sys
+import time
+import tracemalloc
+
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from random import Random
+from typing import Any, Dict, List, Optional, Type
+
+from .cases import BenchmarkCase, CASES, Operation, operations_for
+from .harness import GAME_MODULES, GAMES_PACKAGE, build_options, load_games
+
+
+BASELINE_PATH: Path = Path(__file__).resolve().parent / "baseline.json"
+
+
+@dataclass
+class BenchmarkResult:
+    key: str
+    ops_per_sec: float
+    alloc_kib: float
+    alloc_blocks: int
+    peak_kib: float
+
+
+@dataclass
+class Regression:
+    key: str
+    metric: str
+    baseline: float
+    current: float
+
+
+def time_operation(operation: Operation, game: Any, min_time: float, repeat: int) -> float:
+    """
+    Returns the best ops/sec over `repeat` rounds, each round running for at least `min_time` seconds
+    """
+
+    operation(game)
+
+    best: float = 0.0
+
+    for _ in range(repeat):
+        calls: int = 0
+        start: float = time.perf_counter()
+        elapsed: float = 0.0
+
+        while elapsed < min_time:
+            operation(game)
+            calls += 1
+            elapsed = time.perf_counter() - start
+
+        best = max(best, calls / elapsed)
+
+    return best
+
+
+def measure_memory(operation: Operation, game: Any) -> Dict[str, float]:
+    """
+    Traces a single call, reporting what its result keeps alive and the peak it reached while running
+    """
+
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        before: tracemalloc.Snapshot = tracemalloc.take_snapshot()
+        start_current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+
+        result: Any = operation(game)
+
+        current, peak = tracemalloc.get_traced_memory()
+        after: tracemalloc.Snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    alloc_blocks: int = sum(
+        max(0, stat.count_diff) for stat in after.compare_to(before, "lineno")
+    )
+
+    del result
+
+    return {
+        "alloc_kib": max(0, current - start_current) / 1024,
+        "alloc_blocks": alloc_blocks,
+        "peak_kib": max(0, peak - start_current) / 1024,
+    }
+
+
+def run_case(
+    case: BenchmarkCase,
+    games: Dict[str, Type[Any]],
+    operations: Optional[List[str]],
+    min_time: float,
+    repeat: int,
+) -> List[BenchmarkResult]:
+    game_cls: Type[Any] = games[case.game]
+    results: List[BenchmarkResult] = list()
+
+    for name, operation in operations_for(case.game):
+        if operations and name not in operations:
+            continue
+
+        game: Any = game_cls(random=Random(0), archipelago_options=build_options(games, **case.options))
+        game.optional_game_constraint_templates()
+
+        ops_per_sec: float = time_operation(operation, game, min_time, repeat)
+        memory: Dict[str, float] = measure_memory(operation, game)
+
+        results.append(
+            BenchmarkResult(
+                key=f"{case.game}/{case.variant}/{name}",
+                ops_per_sec=ops_per_sec,
+                alloc_kib=memory["alloc_kib"],
+                alloc_blocks=int(memory["alloc_blocks"]),
+                peak_kib=memory["peak_kib"],
+            )
+        )
+
+    return results
+
+
+def run_imports(selected_games: Optional[List[str]], min_time: float, repeat: int) -> List[BenchmarkResult]:
+    """
+    Times executing each game module's compiled code in a fresh module, the cost every process importing
+    the game registry pays. Compilation is left out, installed packages import from bytecode.
+    """
+
+    registered: Dict[str, Type[Any]] = importlib.import_module("keymasters_keep.game").AutoGameRegister.games
+    results: List[BenchmarkResult] = list()
+
+    for class_name, module_name in GAME_MODULES.items():
+        if selected_games and class_name not in selected_games:
+            continue
+
+        spec: Any = sys.modules[f"{GAMES_PACKAGE}.{module_name}"].__spec__
+        code: Any = spec.loader.get_code(spec.name)
+
+        # the registry refuses a second class under the same name, keep the loaded one aside meanwhile
+        game_name: str = load_games()[class_name].game_name_with_platforms()
+        loaded: Type[Any] = registered.pop(game_name)
+
+        def operation(_: Any) -> Any:
+            module: Any = importlib.util.module_from_spec(spec)
+            exec(code, vars(module))
+            registered.pop(game_name)
+
+            return module
+
+        try:
+            ops_per_sec: float = time_operation(operation, None, min_time, repeat)
+            memory: Dict[str, float] = measure_memory(operation, None)
+        finally:
+            registered[game_name] = loaded
+
+        results.append(
+            BenchmarkResult(
+                key=f"{class_name}/module/import",
+                ops_per_sec=ops_per_sec,
+                alloc_kib=memory["alloc_kib"],
+                alloc_blocks=int(memory["alloc_blocks"]),
+                peak_kib=memory["peak_kib"],
+            )
+        )
+
+    return results
+
+
+def run(
+    selected_games: Optional[List[str]] = None,
+    operations: Optional[List[str]] = None,
+    min_time: float = 0.2,
+    repeat: int = 3,
+) -> List[BenchmarkResult]:
+    games: Dict[str, Type[Any]] = load_games()
+    results: List[BenchmarkResult] = list()
+
+    for case in CASES:
+        if selected_games and case.game not in selected_games:
+            continue
+
+        results.extend(run_case(case, games, operations, min_time, repeat))
+
+    if not operations or "import" in operations:
+        results.extend(run_imports(selected_games, min_time, repeat))
+
+    return results
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> Dict[str, Dict[str, float]]:
+    if not path.exists():
+        return dict()
+
+    with path.open("r", encoding="utf-8") as baseline_file:
+        return json.load(baseline_file)["results"]
+
+
+def save_baseline(results: List[BenchmarkResult], path: Path = BASELINE_PATH) -> None:
+    baseline: Dict[str, Dict[str, float]] = load_baseline(path)
+
+    for result in results:
+        entry: Dict[str, Any] = asdict(result)
+        del entry["key"]
+
+        baseline[result.key] = {metric: round(value, 1) for metric, value in entry.items()}
+
+    with path.open("w", encoding="utf-8") as baseline_file:
+        json.dump({"results": dict(sorted(baseline.items()))}, baseline_file, indent=2, ensure_ascii=False)
+        baseline_file.write("\n")
+
+
+def compare(
+    results: List[BenchmarkResult],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float,
+) -> List[Regression]:
+    """
+    Flags throughput drops and peak memory growth beyond `tolerance`, relative to the stored baseline.
+    Peak memory gets a 4 KiB floor so tiny cases are not flagged on allocator noise.
+    """
+
+    regressions: List[Regression] = list()
+
+    for result in results:
+        if result.key not in baseline:
+            continue
+
+        entry: Dict[str, float] = baseline[result.key]
+
+        if result.ops_per_sec < entry["ops_per_sec"] * (1 - tolerance):
+            regressions.append(Regression(result.key, "ops_per_sec", entry["ops_per_sec"], result.ops_per_sec))
+
+        if result.peak_kib > max(entry["peak_kib"] * (1 + tolerance), entry["peak_kib"] + 4):
+            regressions.append(Regression(result.key, "peak_kib", entry["peak_kib"], result.peak_kib))
+
+    return regressions
@@ -0,0 +1,130 @@
+"""
+Stand-in for the subset of Archipelago's Options module used by the game modules in this repository
+"""
+
+from __future__ import annotations
+
+from typing import Any, ClassVar, Dict, Iterable, Iterator, List, Set
+
+
+class Option:
+    default: ClassVar[Any] = 0
+    display_name: ClassVar[str] = ""
+
+    value: Any
+
+    def __init__(self, value: Any = None) -> None:
+        self.value = self.default if value is None else value
+
+    @classmethod
+    def from_any(cls, data: Any) -> Option:
+        return cls(data)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.value!r})"
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
+
+class Toggle(Option):
+    default = 0
+
+    def __init__(self, value: Any = None) -> None:
+        super().__init__(int(bool(self.default if value is None else value)))
+
+    def __bool__(self) -> bool:
+        return bool(self.value)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Toggle):
+            return self.value == other.value
+
+        return self.value == other
+
+    __hash__ = Option.__hash__
+
+
+class DefaultOnToggle(Toggle):
+    default = 1
+
+
+class Choice(Option):
+    default = 0
+
+    @classmethod
+    def options(cls) -> Dict[str, int]:
+        return {key[len("option_"):]: getattr(cls, key) for key in dir(cls) if key.startswith("option_")}
+
+    @classmethod
+    def from_any(cls, data: Any) -> Choice:
+        if isinstance(data, str):
+            return cls(cls.options()[data])
+
+        return cls(data)
+
+    @property
+    def current_key(self) -> str:
+        for key, value in self.options().items():
+            if value == self.value:
+                return key
+
+        raise KeyError(self.value)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, str):
+            return other == self.current_key
+
+        if isinstance(other, Choice):
+            return self.value == other.value
+
+        return self.value == other
+
+    __hash__ = Option.__hash__
+
+
+class OptionSet(Option):
+    default: ClassVar[Iterable[str]] = frozenset()
+    valid_keys: ClassVar[Iterable[str]] = frozenset()
+
+    value: Set[str]
+
+    def __init__(self, value: Iterable[str] = None) -> None:
+        super().__init__(set(self.default if value is None else value))
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self.value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.value)
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    def __bool__(self) -> bool:
+        return bool(self.value)
+
+    def __hash__(self) -> int:
+        return hash(frozenset(self.value))
+
+
+class OptionList(Option):
+    default: ClassVar[List[Any]] = list()
+    schema: ClassVar[Any] = None
+
+    value: List[Any]
+
+    def __init__(self, value: Iterable[Any] = None) -> None:
+        super().__init__(list(self.default if value is None else value))
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.value)
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    def __bool__(self) -> bool:
+        return bool(self.value)
+
+    def __hash__(self) -> int:
+        return hash(repr(self.value))
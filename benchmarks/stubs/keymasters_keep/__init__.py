@@ -0,0 +1 @@
+# Stand-in for the Keymaster's Keep world package, only what the game modules in this repository import
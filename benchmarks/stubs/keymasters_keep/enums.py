@@ -0,0 +1,20 @@
+from enum import Enum
+
+
+class KeymastersKeepGamePlatforms(Enum):
+    _3DS = "3DS"
+    AND = "AND"
+    IOS = "IOS"
+    META = "META"
+    PC = "PC"
+    PS1 = "PS1"
+    PS2 = "PS2"
+    PS3 = "PS3"
+    PS4 = "PS4"
+    PS5 = "PS5"
+    SAT = "SAT"
+    SW = "SW"
+    WIIU = "WIIU"
+    X360 = "X360"
+    XONE = "XONE"
+    XSX = "XSX"
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from random import Random
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from .enums import KeymastersKeepGamePlatforms
+from .game_objective_template import GameObjectiveTemplate
+
+
+class AutoGameRegister(type):
+    games: Dict[str, Type[Game]] = dict()
+
+    def __new__(cls, name: str, bases: Tuple[type, ...], dct: Dict[str, Any]) -> AutoGameRegister:
+        new_class = super().__new__(cls, name, bases, dct)
+
+        if name != "Game":
+            game_name: str = new_class.game_name_with_platforms()
+
+            if game_name in cls.games:
+                raise ValueError(f"Game '{game_name}' is already registered")
+
+            cls.games[game_name] = new_class
+
+        return new_class
+
+
+class Game(metaclass=AutoGameRegister):
+    name: str
+    platform: KeymastersKeepGamePlatforms
+    platforms_other: Optional[List[KeymastersKeepGamePlatforms]] = None
+
+    is_adult_only_or_unrated: bool = True
+
+    options_cls: Optional[Type[Any]] = None
+
+    random: Random
+    include_time_consuming_objectives: bool
+    include_difficult_objectives: bool
+    archipelago_options: Any
+
+    def __init__(
+        self,
+        random: Random = None,
+        include_time_consuming_objectives: bool = False,
+        include_difficult_objectives: bool = False,
+        archipelago_options: Any = None,
+    ) -> None:
+        self.random = random or Random()
+        self.include_time_consuming_objectives = include_time_consuming_objectives
+        self.include_difficult_objectives = include_difficult_objectives
+        self.archipelago_options = archipelago_options
+
+    @classmethod
+    def game_name_with_platforms(cls) -> str:
+        platforms: List[str] = [cls.platform.value]
+
+        if cls.platforms_other:
+            platforms.extend(platform.value for platform in cls.platforms_other)
+
+        return f"{cls.name} ({'/'.join(platforms)})"
+
+    def optional_game_constraint_templates(self) -> List[GameObjectiveTemplate]:
+        raise NotImplementedError
+
+    def game_objective_templates(self) -> List[GameObjectiveTemplate]:
+        raise NotImplementedError
+
+    def filter_game_objective_templates(self) -> List[GameObjectiveTemplate]:
+        return [
+            template for template in self.game_objective_templates()
+            if (self.include_difficult_objectives or not template.is_difficult)
+            and (self.include_time_consuming_objectives or not template.is_time_consuming)
+        ]
+
+    def generate_objectives(self, count: int = 1) -> Tuple[List[str], List[str]]:
+        optional_constraints: List[str] = list()
+        constraint_templates: List[GameObjectiveTemplate] = self.optional_game_constraint_templates()
+
+        if constraint_templates:
+            constraint_template: GameObjectiveTemplate = self.random.choice(constraint_templates)
+            optional_constraints.append(constraint_template.generate_game_objective(self.random))
+
+        templates: List[GameObjectiveTemplate] = self.filter_game_objective_templates()
+        weights: List[int] = [template.weight for template in templates]
+
+        objectives: List[str] = list()
+
+        for _ in range(count):
+            template: GameObjectiveTemplate = self.random.choices(templates, weights=weights)[0]
+            objectives.append(template.generate_game_objective(self.random))
+
+        return optional_constraints, objectives
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from random import Random
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+
+class GameObjectiveTemplate:
+    label: str
+    data: Dict[str, Tuple[Callable[[], List[Any]], Union[int, range]]]
+    is_time_consuming: bool
+    is_difficult: bool
+    weight: int
+
+    def __init__(
+        self,
+        label: str,
+        data: Dict[str, Tuple[Callable[[], List[Any]], Union[int, range]]],
+        is_time_consuming: bool = False,
+        is_difficult: bool = False,
+        weight: int = 1,
+    ) -> None:
+        self.label = label
+        self.data = data
+        self.is_time_consuming = is_time_consuming
+        self.is_difficult = is_difficult
+        self.weight = weight
+
+    def __repr__(self) -> str:
+        return f"<GameObjectiveTemplate label='{self.label}'>"
+
+    def generate_game_objective(self, random: Random) -> str:
+        label: str = self.label
+
+        for key, (collection_callable, quantity) in self.data.items():
+            collection = collection_callable()
+
+            if isinstance(quantity, range):
+                quantity = random.choice(quantity)
+
+            quantity = min(quantity, len(collection))
+            values = random.sample(list(collection), quantity)
+
+            label = label.replace(key, ", ".join(str(value) for value in values))
+
+        return label
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from typing import List
+import functools
+import json
+import re
+
+from typing import Dict, List, Optional, Pattern, Tuple, Type
 
 from dataclasses import dataclass
 
@@ -9,6 +13,8 @@ from ..game_objective_template import GameObjectiveTemplate
 
 from ..enums import KeymastersKeepGamePlatforms
 
+from .objective_catalog import thaw
+
 from Options import OptionList
 from schema import And, Schema, Optional
 
@@ -29,6 +35,9 @@ class CustomMedleyGame(Game):
 
     custom_medleys: dict
 
+    medley_games: Dict[Type[Game], Game]
+    medley_templates: Dict[str, List[GameObjectiveTemplate]]
+
     def __init__(self,
         random = None,
         include_time_consuming_objectives: bool = False,
@@ -37,24 +46,15 @@ class CustomMedleyGame(Game):
         super().__init__(random, include_time_consuming_objectives, include_difficult_objectives, archipelago_options)
         self.current_medley = "None"
         self.custom_medleys = {}
+        self.medley_games = {}
+        self.medley_templates = {}
 
     def optional_game_constraint_templates(self) -> List[GameObjectiveTemplate]:
         # This will always run before the current game objective group is generated, use it to pick
         # and display the current custom medley
 
         if not self.custom_medleys:
-            # Parse custom medleys here and store on the class for efficiency
-            for medley in self.archipelago_options.custom_medleys:
-                name = medley["name"]
-                games = [AutoGameRegister.games[game] for game in medley["games"] if
-                         (not AutoGameRegister.games[game].is_adult_only_or_unrated or self.archipelago_options.include_adult_only_or_unrated_games) and
-                         (not AutoGameRegister.games[game].platform in (KeymastersKeepGamePlatforms.PS5, KeymastersKeepGamePlatforms.XSX, KeymastersKeepGamePlatforms.SW))]
-
-                self.custom_medleys[name] = {
-                    "games": games,
-                    "difficult": medley.get("exclude_difficult", []),
-                    "time": medley.get("exclude_time_consuming", []),
-                }
+            self.custom_medleys = self.parse_custom_medleys()
 
         self.current_medley = self.random.choice(list(self.custom_medleys.keys()))
 
@@ -65,36 +65,102 @@ class CustomMedleyGame(Game):
             )
         ]
 
-    def game_objective_templates(self) -> List[GameObjectiveTemplate]:
-        objectives = []
+    def parse_custom_medleys(self) -> Dict[str, dict]:
+        # Parsed medleys are shared by every instance, worlds using the same medleys only parse them once
+        return parse_medleys(
+            json.dumps(self.archipelago_options.custom_medleys.value, sort_keys=True),
+            bool(self.archipelago_options.include_adult_only_or_unrated_games),
+        )
 
+    def game_objective_templates(self) -> List[GameObjectiveTemplate]:
         medley = self.custom_medleys.get(self.current_medley, None)
         if medley is None:
             _ = self.optional_game_constraint_templates() # this is a hack, but someone will try putting this in a medley
             medley = self.custom_medleys.get(self.current_medley)
 
+        # Built once per medley, the same medley comes up many times while generating
+        if self.current_medley not in self.medley_templates:
+            self.medley_templates[self.current_medley] = self.build_medley_templates(medley)
+
+        return list(self.medley_templates[self.current_medley])
+
+    def medley_game(self, game: Type[Game]) -> Game:
+        if game not in self.medley_games:
+            self.medley_games[game] = game(random=self.random, archipelago_options=self.archipelago_options)
+
+        return self.medley_games[game]
+
+    def build_medley_templates(self, medley: dict) -> List[GameObjectiveTemplate]:
+        objectives = []
+
         for game in medley["games"]:
-            game_obj = game(random=self.random, archipelago_options=self.archipelago_options)
-            game_objectives = [objective for objective in game_obj.game_objective_templates()
-                          if (not objective.is_difficult or game.game_name_with_platforms() not in medley["difficult"]) and
-                          (not objective.is_time_consuming or game.game_name_with_platforms() not in medley["time"])
+            exclude_difficult = game.game_name_with_platforms() in medley["difficult"]
+            exclude_time_consuming = game.game_name_with_platforms() in medley["time"]
+
+            game_objectives = [objective for objective in self.medley_game(game).game_objective_templates()
+                          if (not objective.is_difficult or not exclude_difficult) and
+                          (not objective.is_time_consuming or not exclude_time_consuming)
                           ]
             for objective in game_objectives:
+                # games hand out their frozen catalog templates, medley templates share their data unless keys collide
+                label = objective.label
+                data = objective.data
+
                 # check if any data keys are in the name, lol
-                for key in list(objective.data.keys()):
-                    if key in game.name:
-                        data = objective.data.pop(key)
-                        objective.label = objective.label.replace(key, f"{key}1")
-                        key = f"{key}1"
-                        objective.data[key] = data
+                collisions = placeholder_collisions(game.name, tuple(data))
 
-                objective.label = f"{game.name}: {objective.label}"
+                if collisions is not None:
+                    renames, pattern = collisions
 
-            objectives.extend(game_objectives)
+                    label = pattern.sub(lambda match: renames[match.group(0)], label)
+                    data = {key: value for key, value in data.items() if key not in renames}
+                    data.update((renames[key], objective.data[key]) for key in renames)
+
+                objectives.append(thaw(objective, label=f"{game.name}: {label}", data=data))
 
         return objectives
 
 
+@functools.lru_cache(maxsize=8)
+def parse_medleys(medleys: str, include_adult_only_or_unrated_games: bool) -> Dict[str, dict]:
+    # Keyed by the medleys as JSON, only the last few medley sets are kept
+    custom_medleys = {}
+
+    for medley in json.loads(medleys):
+        name = medley["name"]
+        games = []
+
+        for game_name in medley["games"]:
+            game = AutoGameRegister.games[game_name]
+
+            if ((not game.is_adult_only_or_unrated or include_adult_only_or_unrated_games) and
+                    (not game.platform in (KeymastersKeepGamePlatforms.PS5, KeymastersKeepGamePlatforms.XSX, KeymastersKeepGamePlatforms.SW))):
+                games.append(game)
+
+        custom_medleys[name] = {
+            "games": games,
+            "difficult": medley.get("exclude_difficult", []),
+            "time": medley.get("exclude_time_consuming", []),
+        }
+
+    return custom_medleys
+
+
+@functools.lru_cache(maxsize=None)
+def placeholder_collisions(game_name: str, keys: Tuple[str, ...]) -> Optional[Tuple[Dict[str, str], Pattern[str]]]:
+    # Data keys found in the game name are renamed so the name is not substituted, along with a pattern
+    # rewriting every colliding key in the label in one pass. Games only use a few key sets, so this is
+    # built once per game and key set.
+    renames = {key: f"{key}1" for key in keys if key in game_name}
+
+    if not renames:
+        return None
+
+    pattern = re.compile("|".join(re.escape(key) for key in sorted(renames, key=len, reverse=True)))
+
+    return renames, pattern
+
+
 class CustomMedleys(OptionList):
     """
     Definition of custom medleys. Format is as follows
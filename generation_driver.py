@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import importlib
+import multiprocessing
+import pkgutil
+import sys
+import time
+import typing
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.context import BaseContext
+from dataclasses import dataclass, field
+from random import Random
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from Options import Option, Toggle
+
+from ..game import AutoGameRegister, Game
+
+from .custom_medley_game import CustomMedleyGame
+from .objective_catalog import keep_options, sampler_for
+from .objective_generation import GenerationSession
+
+
+# Game name with platforms -> game, every game of this package, loaded once per worker process
+worker_games: Dict[str, Type[Game]] = dict()
+
+# Option name -> option class, for every option of every game of this package
+worker_options: Dict[str, Type[Option]] = dict()
+
+
+@dataclass
+class SeedResult:
+    option_set: int  # index in the option sets given to the driver
+    seed: int
+    objectives: Dict[str, int] = field(default_factory=dict)  # game -> objectives generated
+    timings: Dict[str, float] = field(default_factory=dict)  # game -> seconds
+    errors: Dict[str, str] = field(default_factory=dict)  # game -> error, for option sets that can't generate
+    skipped: List[str] = field(default_factory=list)  # games without objectives to roll under the option set
+
+
+@dataclass
+class GenerationReport:
+    results: List[SeedResult]
+    wall_time: float
+    objectives: Dict[str, int] = field(default_factory=dict)  # game -> objectives generated over every seed
+    timings: Dict[str, float] = field(default_factory=dict)  # game -> seconds over every seed
+
+    @property
+    def failures(self) -> List[SeedResult]:
+        return [result for result in self.results if result.errors]
+
+
+def load_games() -> Dict[str, Type[Game]]:
+    """
+    Imports every game module of this package and returns its games, resolving the classes of their options. Worker
+    processes call this once when they start, forked workers finding the modules already imported by the parent and
+    spawned ones importing them again.
+    """
+
+    if not worker_games:
+        for module in pkgutil.iter_modules(sys.modules[__package__].__path__):
+            if not module.ispkg:
+                importlib.import_module(f"{__package__}.{module.name}")
+
+        worker_games.update(
+            (name, game) for name, game in AutoGameRegister.games.items()
+            if game.__module__.startswith(f"{__package__}.")
+        )
+
+        for game in worker_games.values():
+            if game.options_cls is not None:
+                module_globals: Dict[str, Any] = vars(sys.modules[game.__module__])
+                worker_options.update(typing.get_type_hints(game.options_cls, globalns=module_globals))
+
+    return worker_games
+
+
+def worker_context() -> BaseContext:
+    """
+    Workers are forked where the platform allows it, so they share the games the parent already imported. Elsewhere,
+    like on Windows, they are spawned and each imports the games again when it starts.
+    """
+
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+
+    return multiprocessing.get_context()
+
+
+def build_options(option_set: Dict[str, Any]) -> SimpleNamespace:
+    """
+    An archipelago_options stand-in holding every option of every game, read from an option set like a YAML's,
+    options missing from it at their default
+    """
+
+    values: Dict[str, Any] = {
+        name: Toggle.from_any(option_set.get(name, default)) for name, default in keep_options.items()
+    }
+
+    for name, option_cls in worker_options.items():
+        values[name] = option_cls.from_any(option_set.get(name, option_cls.default))
+
+    return SimpleNamespace(**values)
+
+
+def rollable(game: Game) -> bool:
+    """
+    Whether a game has objectives to roll under its options. Custom medleys need a medley to pick, other games a
+    template that isn't filtered out.
+    """
+
+    if isinstance(game, CustomMedleyGame):
+        return bool(game.parse_custom_medleys())
+
+    return bool(sampler_for(game).templates)
+
+
+def generate_seed(
+    option_set_index: int,
+    option_set: Dict[str, Any],
+    seed: int,
+    games: Optional[List[str]],
+    count: int,
+) -> SeedResult:
+    """
+    Generates `count` objectives for each game with one option set and seed, in one session like a keep would.
+    Whether difficult and time consuming objectives are included is read from the option set, like the keep's own
+    options. Games without objectives to roll under the option set are skipped.
+    """
+
+    result: SeedResult = SeedResult(option_set_index, seed)
+    session: GenerationSession = GenerationSession()
+
+    try:
+        options: SimpleNamespace = build_options(option_set)
+
+        include_difficult_objectives: bool = bool(
+            Toggle.from_any(option_set.get("include_difficult_objectives", False)).value
+        )
+
+        include_time_consuming_objectives: bool = bool(
+            Toggle.from_any(option_set.get("include_time_consuming_objectives", False)).value
+        )
+    except Exception as error:
+        result.errors["options"] = f"{type(error).__name__}: {error}"
+
+        return result
+
+    for name in games or option_set.get("game_selection") or worker_games:
+        start: float = time.perf_counter()
+
+        try:
+            game: Game = worker_games[name](
+                random=Random(f"{seed}-{name}"),
+                include_time_consuming_objectives=include_time_consuming_objectives,
+                include_difficult_objectives=include_difficult_objectives,
+                archipelago_options=options,
+            )
+
+            if not rollable(game):
+                result.skipped.append(name)
+                continue
+
+            result.objectives[name] = len(session.generate_objectives(game, count)[1])
+        except Exception as error:
+            result.errors[name] = f"{type(error).__name__}: {error}"
+
+        result.timings[name] = time.perf_counter() - start
+
+    return result
+
+
+def generate_seeds(
+    option_sets: List[Dict[str, Any]],
+    seeds: List[int],
+    games: Optional[List[str]] = None,
+    count: int = 100,
+    max_workers: Optional[int] = None,
+) -> GenerationReport:
+    """
+    Generates objectives for every option set with every seed, fanned out over a process pool. `games` are game names
+    with platforms, an option set's game selection or every game of this package when not given. Errors are reported
+    per seed rather than raised, so one broken option set doesn't stop the others from being checked. Games that can't
+    roll under an option set, like custom medleys without medleys, are listed as skipped instead.
+    """
+
+    load_games()
+
+    tasks: List[Tuple[int, Dict[str, Any], int]] = [
+        (index, option_set, seed) for index, option_set in enumerate(option_sets) for seed in seeds
+    ]
+
+    start: float = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=worker_context(), initializer=load_games) as executor:
+        futures = [
+            executor.submit(
+                generate_seed,
+                index,
+                option_set,
+                seed,
+                games,
+                count,
+            )
+            for index, option_set, seed in tasks
+        ]
+
+        results: List[SeedResult] = [future.result() for future in futures]
+
+    report: GenerationReport = GenerationReport(results, time.perf_counter() - start)
+
+    for result in results:
+        for name, objectives in result.objectives.items():
+            report.objectives[name] = report.objectives.get(name, 0) + objectives
+
+        for name, seconds in result.timings.items():
+            report.timings[name] = report.timings.get(name, 0.0) + seconds
+
+    return report
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import json
+import time
+import tracemalloc
+
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from ..game import AutoGameRegister, Game
+from ..game_objective_template import GameObjectiveTemplate
+
+from .objective_catalog import SharedPool, data_name, thaw
+
+
+@dataclass
+class CallRecord:
+    calls: int = 0
+    wall_time: float = 0.0  # seconds, including everything called from it
+    self_time: float = 0.0  # seconds, without the instrumented calls made from it
+    # bytes in use at the peak of each call above what was in use when it started, summed over calls, when tracing
+    # allocations. Memory freed before the call returns still counts, unlike a difference of the bytes in use.
+    peak_allocated: int = 0
+
+
+def frame_name(function: Callable[..., Any], game_cls: Optional[Type[Game]] = None) -> str:
+    # Pools and data are named after the game they came from, so games sharing a base class are told apart
+    if isinstance(function, SharedPool):
+        return function.name
+
+    return data_name(function, game_cls)
+
+
+class Instrumentation:
+    """
+    Call counts, wall time and allocations of every game_objective_templates() and
+    optional_game_constraint_templates() call and every data callable of their templates, per stack of instrumented
+    calls, like a medley's templates calling the templates of its games. Nothing is wrapped until enabled, so games run
+    exactly as before when it's off.
+    """
+
+    records: Dict[Tuple[str, ...], CallRecord]
+    trace_allocations: bool
+    started_tracing: bool
+
+    stack: List[str]
+    child_times: List[float]
+    peaks: List[int]  # the highest bytes in use seen so far by each call on the stack, when tracing allocations
+
+    # (game class, template method) -> its own method before instrumenting, None when it was inherited
+    originals: Dict[Tuple[Type[Game], str], Optional[Callable[[Game], List[GameObjectiveTemplate]]]]
+    # (game class, data callable) -> its wrapper
+    data_wrappers: Dict[Tuple[Type[Game], Callable[[], Any]], Callable[[], Any]]
+
+    def __init__(self, trace_allocations: bool = False) -> None:
+        self.records = dict()
+        self.trace_allocations = trace_allocations
+        self.started_tracing = False
+
+        self.stack = list()
+        self.child_times = list()
+        self.peaks = list()
+
+        self.originals = dict()
+        self.data_wrappers = dict()
+
+    def measure(self, frame: str, function: Callable[..., Any], *args: Any) -> Any:
+        self.stack.append(frame)
+        self.child_times.append(0.0)
+
+        in_use: int = 0
+
+        if self.trace_allocations:
+            # The peak is reset for every call, the calls it interrupts keep theirs on the stack
+            in_use, peak = tracemalloc.get_traced_memory()
+
+            if self.peaks:
+                self.peaks[-1] = max(self.peaks[-1], peak)
+
+            self.peaks.append(in_use)
+            tracemalloc.reset_peak()
+
+        start: float = time.perf_counter()
+
+        try:
+            return function(*args)
+        finally:
+            elapsed: float = time.perf_counter() - start
+
+            record: CallRecord = self.records.setdefault(tuple(self.stack), CallRecord())
+            record.calls += 1
+            record.wall_time += elapsed
+            record.self_time += elapsed - self.child_times.pop()
+
+            if self.trace_allocations:
+                peak = max(self.peaks.pop(), tracemalloc.get_traced_memory()[1])
+                record.peak_allocated += peak - in_use
+
+                if self.peaks:
+                    self.peaks[-1] = max(self.peaks[-1], peak)
+
+            self.stack.pop()
+
+            if self.child_times:
+                self.child_times[-1] += elapsed
+
+    def data_wrapper(self, game_cls: Type[Game], collection_callable: Callable[[], Any]) -> Callable[[], Any]:
+        # The same wrapper every time, so session pools keyed by data callable keep working. Medley templates hold
+        # the wrappers of their games already.
+        if getattr(collection_callable, "instrumented", False):
+            return collection_callable
+
+        key: Tuple[Type[Game], Callable[[], Any]] = (game_cls, collection_callable)
+
+        if key not in self.data_wrappers:
+            frame: str = frame_name(collection_callable, game_cls)
+
+            def instrumented_data() -> Any:
+                return self.measure(frame, collection_callable)
+
+            instrumented_data.instrumented = True
+
+            if getattr(collection_callable, "volatile", False):
+                instrumented_data.volatile = True
+
+            self.data_wrappers[key] = instrumented_data
+
+        return self.data_wrappers[key]
+
+    def instrument(self, game_cls: Type[Game]) -> None:
+        for method in ("game_objective_templates", "optional_game_constraint_templates"):
+            self.instrument_templates(game_cls, method)
+
+    def instrument_templates(self, game_cls: Type[Game], method: str) -> None:
+        original: Callable[[Game], List[GameObjectiveTemplate]] = getattr(game_cls, method)
+        frame: str = f"{game_cls.__name__}.{method}"
+
+        # Not functools.wraps, it would copy the catalog of the original and let samplers bypass the wrapped data
+        def templates(game: Game) -> List[GameObjectiveTemplate]:
+            return [
+                thaw(template, data={
+                    key: (self.data_wrapper(type(game), collection_callable), quantity)
+                    for key, (collection_callable, quantity) in template.data.items()
+                })
+                for template in self.measure(frame, original, game)
+            ]
+
+        self.originals[(game_cls, method)] = vars(game_cls).get(method)
+        setattr(game_cls, method, templates)
+
+    def restore(self) -> None:
+        for (game_cls, method), original in self.originals.items():
+            if original is None:
+                delattr(game_cls, method)
+            else:
+                setattr(game_cls, method, original)
+
+        self.originals.clear()
+        self.data_wrappers.clear()
+
+    def to_json(self) -> str:
+        return json.dumps(
+            [
+                {"stack": list(stack), **asdict(record)}
+                for stack, record in sorted(self.records.items(), key=lambda item: -item[1].wall_time)
+            ],
+            indent=2,
+        )
+
+    def to_folded(self) -> str:
+        """
+        Folded stacks for flamegraph tools, one line per stack with its self time in microseconds
+        """
+
+        return "".join(
+            f"{';'.join(stack)} {round(record.self_time * 1_000_000)}\n" for stack, record in self.records.items()
+        )
+
+    def write_json(self, path: Path) -> None:
+        Path(path).write_text(self.to_json(), encoding="utf-8")
+
+    def write_folded(self, path: Path) -> None:
+        Path(path).write_text(self.to_folded(), encoding="utf-8")
+
+
+# The enabled instrumentation, None while disabled
+instrumentation: Optional[Instrumentation] = None
+
+
+def enable(trace_allocations: bool = False) -> Instrumentation:
+    """
+    Instruments every game of this package until disabled. Allocations are traced with tracemalloc when asked,
+    which slows everything down.
+    """
+
+    global instrumentation
+
+    if instrumentation is not None:
+        return instrumentation
+
+    instrumentation = Instrumentation(trace_allocations)
+
+    if trace_allocations and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        instrumentation.started_tracing = True
+
+    for game_cls in AutoGameRegister.games.values():
+        if game_cls.__module__.startswith(f"{__package__}."):
+            instrumentation.instrument(game_cls)
+
+    return instrumentation
+
+
+def disable() -> Optional[Instrumentation]:
+    """
+    Puts every game back as it was and returns the instrumentation with what it recorded
+    """
+
+    global instrumentation
+
+    disabled: Optional[Instrumentation] = instrumentation
+
+    if disabled is not None:
+        disabled.restore()
+
+        if disabled.started_tracing:
+            tracemalloc.stop()
+
+    instrumentation = None
+
+    return disabled
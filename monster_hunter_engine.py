@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import functools
+
+from dataclasses import dataclass, field
+from enum import IntFlag
+from typing import Dict, FrozenSet, Iterable, List, Tuple
+
+from ..game_objective_template import GameObjectiveTemplate
+
+from .objective_catalog import objective_catalog
+
+
+class MonsterHunterContent(IntFlag):
+    BASE = 0
+    RANK = 1 << 0
+    DLC = 1 << 1
+    EXPANSION = 1 << 2
+    APEX = 1 << 3
+
+
+class MonsterHunterPool:
+    """
+    A list of names from one Monster Hunter title, each group of names gated behind the content it requires.
+    Every combination of content is filtered once, the first time it's asked for, so reading a pool afterwards
+    is a dict lookup.
+    """
+
+    groups: Tuple[Tuple[MonsterHunterContent, Tuple[str, ...]], ...]
+    sort: bool
+
+    views: Dict[MonsterHunterContent, Tuple[str, ...]]
+
+    def __init__(
+        self,
+        *groups: Tuple[MonsterHunterContent, Tuple[str, ...]],
+        sort: bool = True,
+    ) -> None:
+        self.groups = groups
+        self.sort = sort
+
+        self.views = dict()
+
+    def excluding(self, names: Tuple[str, ...]) -> MonsterHunterExcludingPool:
+        return MonsterHunterExcludingPool(self, frozenset(names))
+
+    def view(self, content: MonsterHunterContent) -> Tuple[str, ...]:
+        try:
+            return self.views[content]
+        except KeyError:
+            self.views[content] = self.build(content)
+
+            return self.views[content]
+
+    def build(self, content: MonsterHunterContent) -> Tuple[str, ...]:
+        names: List[str] = [
+            name for required, group in self.groups if required & content == required for name in group
+        ]
+
+        return tuple(sorted(names) if self.sort else names)
+
+
+class MonsterHunterExcludingPool(MonsterHunterPool):
+    """
+    The names of another pool without an excluded set, sorted and without duplicates, like the capturable
+    monsters. Built from the other pool's view, so it's never sorted again.
+    """
+
+    source: MonsterHunterPool
+    excluded: FrozenSet[str]
+
+    def __init__(self, source: MonsterHunterPool, excluded: FrozenSet[str]) -> None:
+        super().__init__()
+
+        self.source = source
+        self.excluded = excluded
+
+    def build(self, content: MonsterHunterContent) -> Tuple[str, ...]:
+        names: Iterable[str] = self.source.view(content)
+
+        if not self.source.sort:
+            names = sorted(names)
+
+        return tuple(dict.fromkeys(name for name in names if name not in self.excluded))
+
+
+@dataclass(frozen=True)
+class MonsterHunterObjective:
+    label: str
+    data: Dict[str, Tuple[str, int]]  # placeholder -> (name of the game method providing it, count)
+    is_time_consuming: bool = False
+    is_difficult: bool = False
+    weight: int = 1
+    requires: MonsterHunterContent = MonsterHunterContent.BASE
+
+
+@dataclass(frozen=True)
+class MonsterHunterTitle:
+    monsters: MonsterHunterPool
+    capturable: MonsterHunterPool
+    variants: MonsterHunterPool
+    weapons: MonsterHunterPool
+    stages: MonsterHunterPool
+    drops: MonsterHunterPool
+    tails: MonsterHunterPool
+    arenas: MonsterHunterPool
+    objectives: Tuple[MonsterHunterObjective, ...] = field(default=())  # listed after the shared objectives
+
+    included: Dict[MonsterHunterContent, Tuple[MonsterHunterObjective, ...]] = field(
+        default_factory=dict, compare=False, repr=False
+    )
+
+    def objectives_for(self, content: MonsterHunterContent) -> Tuple[MonsterHunterObjective, ...]:
+        # Shared and title objectives available with the given content, filtered once per content
+        try:
+            return self.included[content]
+        except KeyError:
+            self.included[content] = tuple(
+                objective for objective in shared_objectives + self.objectives
+                if objective.requires & content == objective.requires
+            )
+
+            return self.included[content]
+
+
+timers: Tuple[str, ...] = (
+    "30 Minutes",
+    "25 Minutes",
+    "20 Minutes",
+)
+
+shared_objectives: Tuple[MonsterHunterObjective, ...] = (
+    MonsterHunterObjective(
+        label="Slay MONSTER",
+        data={"MONSTER": ("monsters", 1)},
+        weight=4,
+    ),
+    MonsterHunterObjective(
+        label="Slay MONSTER using the following weapon: WEAPON",
+        data={"MONSTER": ("monsters", 1), "WEAPON": ("weapons", 1)},
+        weight=3,
+    ),
+    MonsterHunterObjective(
+        label="Hunt MONSTER with its own Weapon",
+        data={"MONSTER": ("monsters", 1)},
+        weight=2,
+    ),
+    MonsterHunterObjective(
+        label="Hunt MONSTER within TIMER",
+        data={"MONSTER": ("monsters", 1), "TIMER": ("timers", 1)},
+        weight=3,
+    ),
+    MonsterHunterObjective(
+        label="Capture MONSTER",
+        data={"MONSTER": ("capturable", 1)},
+        weight=4,
+    ),
+    MonsterHunterObjective(
+        label="Capture MONSTER using the following weapon: WEAPON",
+        data={"MONSTER": ("capturable", 1), "WEAPON": ("weapons", 1)},
+        weight=3,
+    ),
+    MonsterHunterObjective(
+        label="Carve the following Tail: TAIL",
+        data={"TAIL": ("tails", 1)},
+        weight=3,
+    ),
+    MonsterHunterObjective(
+        label="Break 2 MONSTER parts",
+        data={"MONSTER": ("monsters", 1)},
+        weight=2,
+    ),
+    MonsterHunterObjective(
+        label="Hunt 2 monsters in the STAGE",
+        data={"STAGE": ("stages", 1)},
+        weight=3,
+    ),
+    MonsterHunterObjective(
+        label="Hunt 3 monsters in the STAGE",
+        data={"STAGE": ("stages", 1)},
+        weight=2,
+    ),
+    MonsterHunterObjective(
+        label="Hunt 3 VARIANT monsters",
+        data={"VARIANT": ("variants", 1)},
+        weight=2,
+    ),
+    MonsterHunterObjective(
+        label="Hunt MONSTER without dying",
+        data={"MONSTER": ("monsters", 1)},
+        is_difficult=True,
+        weight=2,
+    ),
+    MonsterHunterObjective(
+        label="Wielding the WEAPON, obtain the following Drop: DROP",
+        data={"WEAPON": ("weapons", 1), "DROP": ("drops", 1)},
+        is_time_consuming=True,
+        weight=2,
+    ),
+    MonsterHunterObjective(
+        label="Obtain the following Drops as Broken Part Rewards (when possible): DROPS",
+        data={"DROPS": ("drops", 2)},
+        is_time_consuming=True,
+        is_difficult=True,
+        weight=1,
+    ),
+)
+
+
+class MonsterHunterGame:
+    """
+    Objective generation shared by the Monster Hunter games, driven by each game's `title` data. Mixed into the
+    games next to Game rather than subclassing it, since AutoGameRegister would register it as a game of its own.
+    """
+
+    title: MonsterHunterTitle
+
+    @functools.cached_property
+    def content(self) -> MonsterHunterContent:
+        # Options don't change during generation, each game reads its content options once
+        raise NotImplementedError
+
+    @objective_catalog
+    def game_objective_templates(self) -> List[GameObjectiveTemplate]:
+        return [
+            GameObjectiveTemplate(
+                label=objective.label,
+                data={
+                    placeholder: (getattr(self, method), count)
+                    for placeholder, (method, count) in objective.data.items()
+                },
+                is_time_consuming=objective.is_time_consuming,
+                is_difficult=objective.is_difficult,
+                weight=objective.weight,
+            )
+            for objective in self.title.objectives_for(self.content)
+        ]
+
+    def monsters(self) -> Tuple[str, ...]:
+        return self.title.monsters.view(self.content)
+
+    def capturable(self) -> Tuple[str, ...]:
+        return self.title.capturable.view(self.content)
+
+    def variants(self) -> Tuple[str, ...]:
+        return self.title.variants.view(self.content)
+
+    def weapons(self) -> Tuple[str, ...]:
+        return self.title.weapons.view(self.content)
+
+    def stages(self) -> Tuple[str, ...]:
+        return self.title.stages.view(self.content)
+
+    def drops(self) -> Tuple[str, ...]:
+        return self.title.drops.view(self.content)
+
+    def tails(self) -> Tuple[str, ...]:
+        return self.title.tails.view(self.content)
+
+    @staticmethod
+    def timers() -> Tuple[str, ...]:
+        return timers
+
+    def arenas(self) -> Tuple[str, ...]:
+        return self.title.arenas.view(self.content)
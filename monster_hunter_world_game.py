@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import functools
-from typing import List
+from typing import List, Tuple
 
 from dataclasses import dataclass
 
@@ -12,6 +12,14 @@ from ..game_objective_template import GameObjectiveTemplate
 
 from ..enums import KeymastersKeepGamePlatforms
 
+from .monster_hunter_engine import (
+    MonsterHunterContent,
+    MonsterHunterGame,
+    MonsterHunterObjective,
+    MonsterHunterPool,
+    MonsterHunterTitle,
+)
+
 
 @dataclass
 class MonsterHunterWorldArchipelagoOptions:
@@ -20,7 +28,329 @@ class MonsterHunterWorldArchipelagoOptions:
     monster_hunter_world_include_events: MonsterHunterWorldIncludeDLC
 
 
-class MonsterHunterWorldGame(Game):
+# Iceborne is the expansion, rank monsters are the Master Rank locked ones and DLC covers the siege monsters
+
+monsters = MonsterHunterPool(
+    (MonsterHunterContent.BASE, (
+        "Ancient Leshen",
+        "Anjanath",
+        "Azure Rathalos",
+        "Barroth",
+        "Bazelgeuse",
+        "Behemoth",
+        "Black Diablos",
+        "Deviljho",
+        "Diablos",
+        "Dodogama",
+        "Great Girros",
+        "Great Jagras",
+        "Jyuratodus",
+        "Kirin",
+        "Kulu-Ya-Ku",
+        "Kushala Daora",
+        "Lavasioth",
+        "Legiana",
+        "Leshen",
+        "Lunastra",
+        "Nergigante",
+        "Odogaron",
+        "Paolumu",
+        "Pink Rathian",
+        "Pukei-Pukei",
+        "Radobaan",
+        "Rathalos",
+        "Rathian",
+        "Teostra",
+        "Tobi Kadachi",
+        "Tzitzi-Ya-Ku",
+        "Uragaan",
+        "Vaal Hazak",
+        "Xeno'jiiva",
+        "Zorah Magdaros",
+    )),
+    (MonsterHunterContent.DLC, (
+        "Kulve Taroth",
+    )),
+    (MonsterHunterContent.EXPANSION, (
+        "Acidic Glavenus",
+        "Alatreon",
+        "Banbaro",
+        "Barioth",
+        "Beotodus",
+        "Blackveil Vaal Hazak",
+        "Brachydios",
+        "Brute Tigrex",
+        "Coral Pukei-Pukei",
+        "Ebony Odogaron",
+        "Fatalis",
+        "Frostfang Barioth",
+        "Fulgur Anjanath",
+        "Furious Rajang",
+        "Glavenus",
+        "Namielle",
+        "Nargacuga",
+        "Nightshade Paolumu",
+        "Raging Brachydios",
+        "Rajang",
+        "Savage Deviljho",
+        "Seething Bazelgeuse",
+        "Shara Ishvalda",
+        "Shrieking Legiana",
+        "Stygian Zinogre",
+        "Tigrex",
+        "Velkhana",
+        "Viper Tobi Kadachi",
+        "Zinogre",
+    )),
+    (MonsterHunterContent.EXPANSION | MonsterHunterContent.RANK, (
+        "Gold Rathian",
+        "Silver Rathalos",
+        "Ruiner Nergigante",
+        "Scarred Yian Garuga",
+        "Yian Garuga",
+    )),
+    (MonsterHunterContent.EXPANSION | MonsterHunterContent.DLC, (
+        "Safi'jiiva",
+    )),
+)
+
+non_capture = (
+    "Alatreon",
+    "Ancient Leshen",
+    "Behemoth",
+    "Blackveil Vaal Hazak",
+    "Fatalis",
+    "Kulve Taroth",
+    "Kushala Daora",
+    "Leshen",
+    "Lunastra",
+    "Namielle",
+    "Nergigante",
+    "Raging Brachydios",
+    "Ruiner Nergigante",
+    "Safi'jiiva",
+    "Shara Ishvalda",
+    "Teostra",
+    "Vaal Hazak",
+    "Velkhana",
+    "Xeno'jiiva",
+    "Zorah Magdaros",
+)
+
+variants = MonsterHunterPool(
+    (MonsterHunterContent.BASE, (
+        "Subspecies",
+        "Rare Species",
+        "Variant Species",
+        "Tempered",
+    )),
+    sort=False,
+)
+
+weapons = MonsterHunterPool(
+    (MonsterHunterContent.BASE, (
+        "Great Sword",
+        "Long Sword",
+        "Sword and Shield",
+        "Dual Blades",
+        "Hammer",
+        "Hunting Horn",
+        "Lance",
+        "Gunlance",
+        "Switch Axe",
+        "Charge Blade",
+        "Insect Glaive",
+        "Light Bowgun",
+        "Heavy Bowgun",
+        "Bow",
+    )),
+    sort=False,
+)
+
+stages = MonsterHunterPool(
+    (MonsterHunterContent.BASE, (
+        "Ancient Forest",
+        "Wildspire Wastes",
+        "Coral Highlands",
+        "Rotten Vale",
+        "Elder's Recess",
+        "Confluence of Fates",
+        "Everstream",
+        "Arena",
+        "Special Arena",
+    )),
+    (MonsterHunterContent.DLC, (
+        "Caverns of El Dorado",
+    )),
+    (MonsterHunterContent.EXPANSION, (
+        "Hoarfrost Reach",
+        "Guiding Lands",
+        "Origin Isle",
+        "Castle Schrade",
+        "Seliana Supply Cache",
+    )),
+)
+
+drops = MonsterHunterPool(
+    (MonsterHunterContent.BASE, (
+        "Bird Wyvern Gem",
+        "Wyvern Gem",
+        "Anjanath Plate",
+        "Anjanath Gem",
+        "Rathian Plate",
+        "Rathian Ruby",
+        "Legiana Plate",
+        "Legiana Gem",
+        "Odogaron Plate",
+        "Odogaron Gem",
+        "Rathalos Plate",
+        "Rathalos Ruby",
+        "Diablos Marrow",
+        "Uragaan Marrow",
+        "Uragaan Ruby",
+        "Bazelgeuse Gem",
+        "Deviljho Gem",
+        "Zorah Magdaros Gem",
+        "Nergigante Gem",
+        "Teostra Gem",
+        "Lunastra Gem",
+        "Daora Gem",
+        "Vaal Hazak Gem",
+        "Xeno'jiiva Gem",
+    )),
+    (MonsterHunterContent.DLC, (
+        "Kulve Taroth Golden Glimstone",
+    )),
+    (MonsterHunterContent.EXPANSION, (
+        "Fey Wyvern Gem",
+        "Large Wyvern Gem",
+        "Large Elder Dragon Gem",
+        "Anjanath Mantle",
+        "Fulgur Anjanath Mantle",
+        "Rathian Mantle",
+        "Legiana Mantle",
+        "Odogaron Mantle",
+        "Ebony Odogaron Mantle",
+        "Rathalos Mantle",
+        "Blos Medulla",
+        "Uragaan Pallium",
+        "Nargacuga Mantle",
+        "Tigrex Mantle",
+        "Glavenus Mantle",
+        "Brachydios Pallium",
+        "Immortal Reactor",
+        "Zinogre Skymerald",
+        "Stygian Zinogre Skymerald",
+        "Bazelgeuse Mantle",
+        "Deviljho Crook",
+        "Ghoulish Gold Gorer",
+        "Rajang Heart",
+        "Velkhana Crystal",
+        "Shara Ishvalda Gem",
+        "Azure Dragonsphire",
+    )),
+    (MonsterHunterContent.EXPANSION | MonsterHunterContent.DLC, (
+        "Zionium Crystal",
+        "Golden Dragonsphire",
+    )),
+)
+
+tails = MonsterHunterPool(
+    (MonsterHunterContent.BASE, (
+        "Pukei-Pukei Tail",
+        "Barroth Tail",
+        "Anjanath Tail",
+        "Great Girros Tail",
+        "Odogaron Tail",
+        "Rathalos Tail",
+        "Azure Rathalos Tail",
+        "Dodogama Tail",
+        "Bazelgeuse Tail",
+        "Deviljho Tail",
+        "Nergigante Tail",
+        "Teostra Tail",
+        "Lunastra Tail",
+        "Daora Tail",
+        "Vaal Hazak Tail",
+        "Xeno'jiiva Tail",
+        "Behemoth Tail",
+    )),
+    (MonsterHunterContent.EXPANSION, (
+        "Pukei-Pukei Lash",
+        "Barroth Lash",
+        "Anjanath Lash",
+        "Great Girros Lash",
+        "Odogaron Lash",
+        "Rathalos Lash",
+        "Azure Rathalos Lash",
+        "Dodogama Lash",
+        "Bazelgeuse Flail",
+        "Deviljho Flail",
+        "Nergigante Flail",
+        "Teostra Lash",
+        "Lunasta Lash",
+        "Daora Lash",
+        "Vaal Hazak Flail",
+        "Coral Pukei-Pukei Lash",
+        "Banbaro Lash",
+        "Fulgur Anjanath Lash",
+        "Ebony Odogaron Lash",
+        "Barioth Lash",
+        "Nargacuga Lash",
+        "Tigrex Lash",
+        "Glavenus Tailedge",
+        "Acidic Glavenus Tailedge",
+        "Brachydios Lash",
+        "Zinogre Lash",
+        "Stygian Zinogre Lash",
+        "Velkhana Lash",
+        "Namielle Lash",
+        "Alatreon Diretail",
+    )),
+    (MonsterHunterContent.EXPANSION | MonsterHunterContent.RANK, (
+        "Garuga Lash",
+        "Silver Rathalos Lash",
+    )),
+    (MonsterHunterContent.EXPANSION | MonsterHunterContent.DLC, (
+        "Safi'jiiva Lash",
+    )),
+)
+
+arenas = MonsterHunterPool(
+    (MonsterHunterContent.BASE, tuple(f"Arena Quest 0{i}" for i in range(1, 10))),
+    (MonsterHunterContent.EXPANSION, tuple(f"Arena Master Quest 0{i}" for i in range(1, 8))),
+    sort=False,
+)
+
+guiding_lands_hunts: Tuple[int, ...] = tuple(range(2, 7))
+
+monster_hunter_world = MonsterHunterTitle(
+    monsters=monsters,
+    capturable=monsters.excluding(non_capture),
+    variants=variants,
+    weapons=weapons,
+    stages=stages,
+    drops=drops,
+    tails=tails,
+    arenas=arenas,
+    objectives=(
+        MonsterHunterObjective(
+            label="Complete a MONSTER investigation",
+            data={"MONSTER": ("monsters", 1)},
+            weight=1,
+        ),
+        MonsterHunterObjective(
+            label="Hunt NUMBER monsters in the Guiding Lands",
+            data={"NUMBER": ("guiding_lands_hunts", 1)},
+            is_time_consuming=True,
+            weight=2,
+            requires=MonsterHunterContent.EXPANSION,
+        ),
+    ),
+)
+
+
+class MonsterHunterWorldGame(MonsterHunterGame, Game):
     name = "Monster Hunter World"
     platform = KeymastersKeepGamePlatforms.PC
 
@@ -33,6 +363,8 @@ class MonsterHunterWorldGame(Game):
 
     options_cls = MonsterHunterWorldArchipelagoOptions
 
+    title = monster_hunter_world
+
     @property
     def include_rank_dependent_monsters(self) -> bool:
         return bool(self.archipelago_options.monster_hunter_world_include_rank.value)
@@ -45,6 +377,21 @@ class MonsterHunterWorldGame(Game):
     def include_dlc(self):
         return bool(self.archipelago_options.monster_hunter_world_include_events.value)
 
+    @functools.cached_property
+    def content(self) -> MonsterHunterContent:
+        content: MonsterHunterContent = MonsterHunterContent.BASE
+
+        if self.include_rank_dependent_monsters:
+            content |= MonsterHunterContent.RANK
+
+        if self.include_dlc:
+            content |= MonsterHunterContent.DLC
+
+        if self.iceborne:
+            content |= MonsterHunterContent.EXPANSION
+
+        return content
+
     def optional_game_constraint_templates(self) -> List[GameObjectiveTemplate]:
         return [
             GameObjectiveTemplate(
@@ -81,524 +428,9 @@ class MonsterHunterWorldGame(Game):
             )
         ]
 
-    def game_objective_templates(self) -> List[GameObjectiveTemplate]:
-        templates: List[GameObjectiveTemplate] = [
-            GameObjectiveTemplate(
-                label="Slay MONSTER",
-                data={
-                    "MONSTER": (self.monsters, 1),
-                },
-                is_time_consuming=False,
-                is_difficult=False,
-                weight=4,
-            ),
-            GameObjectiveTemplate(
-                label="Slay MONSTER using the following weapon: WEAPON",
-                data={
-                    "MONSTER": (self.monsters, 1),
-                    "WEAPON": (self.weapons, 1),
-                },
-                is_time_consuming=False,
-                is_difficult=False,
-                weight=3,
-            ),
-            GameObjectiveTemplate(
-                label="Hunt MONSTER with its own Weapon",
-                data={
-                    "MONSTER": (self.monsters, 1),
-                },
-                is_time_consuming=False,
-                is_difficult=False,
-                weight=2,
-            ),
-            GameObjectiveTemplate(
-                label="Hunt MONSTER within TIMER",
-                data={
-                    "MONSTER": (self.monsters, 1),
-                    "TIMER": (self.timers, 1),
-                },
-                is_time_consuming=False,
-                is_difficult=False,
-                weight=3,
-            ),
-            GameObjectiveTemplate(
-                label="Capture MONSTER",
-                data={
-                    "MONSTER": (self.capturable, 1),
-                },
-                is_time_consuming=False,
-                is_difficult=False,
-                weight=4,
-            ),
-            GameObjectiveTemplate(
-                label="Capture MONSTER using the following weapon: WEAPON",
-                data={
-                    "MONSTER": (self.capturable, 1),
-                    "WEAPON": (self.weapons, 1),
-                },
-                is_time_consuming=False,
-                is_difficult=False,
-                weight=3,
-            ),
-            GameObjectiveTemplate(
-                label="Carve the following Tail: TAIL",
-                data={
-                    "TAIL": (self.tails, 1),
-                },
-                is_time_consuming=False,
-                is_difficult=False,
-                weight=3,
-            ),
-            GameObjectiveTemplate(
-                label="Break 2 MONSTER parts",
-                data={
-                    "MONSTER": (self.monsters, 1),
-                },
-                is_time_consuming=False,
-                is_difficult=False,
-                weight=2,
-            ),
-            GameObjectiveTemplate(
-                label="Hunt 2 monsters in the STAGE",
-                data={
-                    "STAGE": (self.stages, 1),
-                },
-                is_time_consuming=False,
-                is_difficult=False,
-                weight=3,
-            ),
-            GameObjectiveTemplate(
-                label="Hunt 3 monsters in the STAGE",
-                data={
-                    "STAGE": (self.stages, 1),
-                },
-                is_time_consuming=False,
-                is_difficult=False,
-                weight=2,
-            ),
-            GameObjectiveTemplate(
-                label="Hunt 3 VARIANT monsters",
-                data={
-                    "VARIANT": (self.variants, 1),
-                },
-                is_time_consuming=False,
-                is_difficult=False,
-                weight=2
-            ),
-            GameObjectiveTemplate(
-                label="Hunt MONSTER without dying",
-                data={
-                    "MONSTER": (self.monsters, 1),
-                },
-                is_time_consuming=False,
-                is_difficult=True,
-                weight=2,
-            ),
-            GameObjectiveTemplate(
-                label="Wielding the WEAPON, obtain the following Drop: DROP",
-                data={
-                    "WEAPON": (self.weapons, 1),
-                    "DROP": (self.drops, 1),
-                },
-                is_time_consuming=True,
-                is_difficult=False,
-                weight=2,
-            ),
-            GameObjectiveTemplate(
-                label="Obtain the following Drops as Broken Part Rewards (when possible): DROPS",
-                data={
-                    "DROPS": (self.drops, 2),
-                },
-                is_time_consuming=True,
-                is_difficult=True,
-                weight=1,
-            ),
-            GameObjectiveTemplate(
-                label="Complete a MONSTER investigation",
-                data={
-                    "MONSTER": (self.monsters, 1),
-                },
-                is_time_consuming=False,
-                is_difficult=False,
-                weight=1,
-            ),
-        ]
-
-        if self.iceborne:
-            templates.extend([
-                GameObjectiveTemplate(
-                    label="Hunt NUMBER monsters in the Guiding Lands",
-                    data={
-                        "NUMBER": (lambda: list(range(2, 7)), 1)
-                    },
-                    is_time_consuming=True,
-                    is_difficult=False,
-                    weight=2
-                )
-            ])
-
-        return templates
-
-    def monsters_base(self) -> List[str]:
-        monsters = [
-            "Ancient Leshen",
-            "Anjanath",
-            "Azure Rathalos",
-            "Barroth",
-            "Bazelgeuse",
-            "Behemoth",
-            "Black Diablos",
-            "Deviljho",
-            "Diablos",
-            "Dodogama",
-            "Great Girros",
-            "Great Jagras",
-            "Jyuratodus",
-            "Kirin",
-            "Kulu-Ya-Ku",
-            "Kushala Daora",
-            "Lavasioth",
-            "Legiana",
-            "Leshen",
-            "Lunastra",
-            "Nergigante",
-            "Odogaron",
-            "Paolumu",
-            "Pink Rathian",
-            "Pukei-Pukei",
-            "Radobaan",
-            "Rathalos",
-            "Rathian",
-            "Teostra",
-            "Tobi Kadachi",
-            "Tzitzi-Ya-Ku",
-            "Uragaan",
-            "Vaal Hazak",
-            "Xeno'jiiva",
-            "Zorah Magdaros"
-        ]
-
-        if self.include_dlc:
-            monsters.append("Kulve Taroth")
-
-        if self.iceborne:
-            monsters.extend([
-                "Acidic Glavenus",
-                "Alatreon",
-                "Banbaro",
-                "Barioth",
-                "Beotodus",
-                "Blackveil Vaal Hazak",
-                "Brachydios",
-                "Brute Tigrex",
-                "Coral Pukei-Pukei",
-                "Ebony Odogaron",
-                "Fatalis",
-                "Frostfang Barioth",
-                "Fulgur Anjanath",
-                "Furious Rajang",
-                "Glavenus",
-                "Namielle",
-                "Nargacuga",
-                "Nightshade Paolumu",
-                "Raging Brachydios",
-                "Rajang",
-                "Savage Deviljho",
-                "Seething Bazelgeuse",
-                "Shara Ishvalda",
-                "Shrieking Legiana",
-                "Stygian Zinogre",
-                "Tigrex",
-                "Velkhana",
-                "Viper Tobi Kadachi",
-                "Zinogre"
-            ])
-
-            if self.include_rank_dependent_monsters:
-                monsters.extend([
-                    "Gold Rathian",
-                    "Silver Rathalos",
-                    "Ruiner Nergigante",
-                    "Scarred Yian Garuga",
-                    "Yian Garuga",
-                ])
-
-            if self.include_dlc:
-                monsters.extend([
-                    "Safi'jiiva",
-                ])
-        return monsters
-
-    def monsters(self) -> List[str]:
-        monsters: List[str] = self.monsters_base()
-
-        return sorted(monsters)
-
-    def capturable(self) -> List[str]:
-        monsters = self.monsters()
-
-        non_capture = [
-            "Alatreon",
-            "Ancient Leshen",
-            "Behemoth",
-            "Blackveil Vaal Hazak",
-            "Fatalis",
-            "Kulve Taroth",
-            "Kushala Daora",
-            "Leshen",
-            "Lunastra",
-            "Namielle",
-            "Nergigante",
-            "Raging Brachydios",
-            "Ruiner Nergigante",
-            "Safi'jiiva",
-            "Shara Ishvalda",
-            "Teostra",
-            "Vaal Hazak",
-            "Velkhana",
-            "Xeno'jiiva",
-            "Zorah Magdaros",
-        ]
-
-        return sorted(set(monsters).difference(non_capture))
-
-    def variants(self) -> List[str]:
-        variants = [
-            "Subspecies",
-            "Rare Species",
-            "Variant Species",
-            "Tempered",
-        ]
-
-        return variants
-
     @staticmethod
-    def weapons() -> List[str]:
-        return [
-            "Great Sword",
-            "Long Sword",
-            "Sword and Shield",
-            "Dual Blades",
-            "Hammer",
-            "Hunting Horn",
-            "Lance",
-            "Gunlance",
-            "Switch Axe",
-            "Charge Blade",
-            "Insect Glaive",
-            "Light Bowgun",
-            "Heavy Bowgun",
-            "Bow",
-        ]
-
-    @functools.cached_property
-    def stages_base(self) -> List[str]:
-        return [
-            "Ancient Forest",
-            "Wildspire Wastes",
-            "Coral Highlands",
-            "Rotten Vale",
-            "Elder's Recess",
-            "Confluence of Fates",
-            "Everstream",
-            "Arena",
-            "Special Arena",
-        ]
-
-    @functools.cached_property
-    def stages_g(self) -> List[str]:
-        return [
-            "Hoarfrost Reach",
-            "Guiding Lands",
-            "Origin Isle",
-            "Castle Schrade",
-            "Seliana Supply Cache",
-        ]
-
-    def stages(self) -> List[str]:
-        stages: List[str] = self.stages_base[:]
-
-        if self.include_dlc:
-            stages.append("Caverns of El Dorado")
-
-        if self.iceborne:
-            stages.extend(self.stages_g)
-
-
-        return sorted(stages)
-
-    @functools.cached_property
-    def drops_base(self) -> List[str]:
-        return [
-            "Bird Wyvern Gem",
-            "Wyvern Gem",
-            "Anjanath Plate",
-            "Anjanath Gem",
-            "Rathian Plate",
-            "Rathian Ruby",
-            "Legiana Plate",
-            "Legiana Gem",
-            "Odogaron Plate",
-            "Odogaron Gem",
-            "Rathalos Plate",
-            "Rathalos Ruby",
-            "Diablos Marrow",
-            "Uragaan Marrow",
-            "Uragaan Ruby",
-            "Bazelgeuse Gem",
-            "Deviljho Gem",
-            "Zorah Magdaros Gem",
-            "Nergigante Gem",
-            "Teostra Gem",
-            "Lunastra Gem",
-            "Daora Gem",
-            "Vaal Hazak Gem",
-            "Xeno'jiiva Gem",
-        ]
-
-    @functools.cached_property
-    def drops_g_dlc(self) -> List[str]:
-        return [
-            "Fey Wyvern Gem",
-            "Large Wyvern Gem",
-            "Large Elder Dragon Gem",
-            "Anjanath Mantle",
-            "Fulgur Anjanath Mantle",
-            "Rathian Mantle",
-            "Legiana Mantle",
-            "Odogaron Mantle",
-            "Ebony Odogaron Mantle",
-            "Rathalos Mantle",
-            "Blos Medulla",
-            "Uragaan Pallium",
-            "Nargacuga Mantle",
-            "Tigrex Mantle",
-            "Glavenus Mantle",
-            "Brachydios Pallium",
-            "Immortal Reactor",
-            "Zinogre Skymerald",
-            "Stygian Zinogre Skymerald",
-            "Bazelgeuse Mantle",
-            "Deviljho Crook",
-            "Ghoulish Gold Gorer",
-            "Rajang Heart",
-            "Velkhana Crystal",
-            "Shara Ishvalda Gem",
-            "Azure Dragonsphire",
-
-        ]
-
-    def drops(self) -> List[str]:
-        drops: List[str] = self.drops_base[:]
-
-        if self.include_dlc:
-            drops.append("Kulve Taroth Golden Glimstone")
-
-        if self.iceborne:
-            drops.extend(self.drops_g_dlc)
-
-            if self.include_dlc:
-                drops.extend([
-                    "Zionium Crystal",
-                    "Golden Dragonsphire"
-                ])
-
-        return sorted(drops)
-
-    @functools.cached_property
-    def tails_base(self) -> List[str]:
-        return [
-            "Pukei-Pukei Tail",
-            "Barroth Tail",
-            "Anjanath Tail",
-            "Great Girros Tail",
-            "Odogaron Tail",
-            "Rathalos Tail",
-            "Azure Rathalos Tail",
-            "Dodogama Tail",
-            "Bazelgeuse Tail",
-            "Deviljho Tail",
-            "Nergigante Tail",
-            "Teostra Tail",
-            "Lunastra Tail",
-            "Daora Tail",
-            "Vaal Hazak Tail",
-            "Xeno'jiiva Tail",
-            "Behemoth Tail",
-        ]
-
-    @functools.cached_property
-    def tails_g_dlc(self) -> List[str]:
-        return [
-            "Pukei-Pukei Lash",
-            "Barroth Lash",
-            "Anjanath Lash",
-            "Great Girros Lash",
-            "Odogaron Lash",
-            "Rathalos Lash",
-            "Azure Rathalos Lash",
-            "Dodogama Lash",
-            "Bazelgeuse Flail",
-            "Deviljho Flail",
-            "Nergigante Flail",
-            "Teostra Lash",
-            "Lunasta Lash",
-            "Daora Lash",
-            "Vaal Hazak Flail",
-            "Coral Pukei-Pukei Lash",
-            "Banbaro Lash",
-            "Fulgur Anjanath Lash",
-            "Ebony Odogaron Lash",
-            "Barioth Lash",
-            "Nargacuga Lash",
-            "Tigrex Lash",
-            "Glavenus Tailedge",
-            "Acidic Glavenus Tailedge",
-            "Brachydios Lash",
-            "Zinogre Lash",
-            "Stygian Zinogre Lash",
-            "Velkhana Lash",
-            "Namielle Lash",
-            "Alatreon Diretail",
-        ]
-
-    @functools.cached_property
-    def tails_rank_g(self) -> List[str]:
-        return [
-            "Garuga Lash",
-            "Silver Rathalos Lash",
-        ]
-
-    def tails(self) -> List[str]:
-        tails: List[str] = self.tails_base[:]
-
-        if self.iceborne:
-            tails.extend(self.tails_g_dlc)
-
-            if self.include_rank_dependent_monsters:
-                tails.extend(self.tails_rank_g)
-
-            if self.include_dlc:
-                tails.append("Safi'jiiva Lash")
-        return sorted(tails)
-
-    @staticmethod
-    def timers() -> List[str]:
-        return [
-            "30 Minutes",
-            "25 Minutes",
-            "20 Minutes",
-        ]
-
-    def arenas(self) -> List[str]:
-        arenas = [
-            f"Arena Quest 0{i}" for i in range(1, 10)
-        ]
-
-        if self.iceborne:
-            arenas.extend([f"Arena Master Quest 0{i}" for i in range(1, 8)])
-
-        return arenas
+    def guiding_lands_hunts() -> Tuple[int, ...]:
+        return guiding_lands_hunts
 
 
 class MonsterHunterWorldIncludeRankMonsters(DefaultOnToggle):
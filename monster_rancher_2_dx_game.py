@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from typing import List, Dict, Callable
+import bisect
+import functools
+
+from random import Random
+from typing import List, Dict, FrozenSet, Optional, Tuple, Type
 
 from dataclasses import dataclass
 
@@ -9,13 +13,1199 @@ from ..game_objective_template import GameObjectiveTemplate
 
 from ..enums import KeymastersKeepGamePlatforms
 
-from Options import OptionSet
+from .objective_catalog import objective_catalog
+from .objective_generation import VolatilePartial
+
+from Options import OptionSet, Toggle
 
 
 @dataclass
 class MonsterRancher2DXArchipelagoOptions:
     monster_rancher_2_dx_unlocked_main_breeds: MonsterRancher2DXUnlockedMainBreeds
     monster_rancher_2_dx_unlocked_sub_breeds: MonsterRancher2DXUnlockedSubBreeds
+    monster_rancher_2_dx_stable_tech_sets: MonsterRancher2DXStableTechSets
+
+
+# Breeds that are available without unlocking them in-game
+default_breeds: FrozenSet[str] = frozenset({
+    "Ape",
+    "Arrow Head",
+    "ColorPandora",
+    "Gaboo",
+    "Jell",
+    "Hare",
+    "Hopper",
+    "Kato",
+    "Mocchi",
+    "Monol",
+    "Naga",
+    "Pixie",
+    "Plant",
+    "Suezo",
+    "Tiger",
+    "Zuum",
+})
+
+# Main breed -> (combination, breed that has to be unlocked for it or None if always available), in listing order
+breed_combinations: Dict[str, Tuple[Tuple[str, Optional[str]], ...]] = {
+    "Ape": (
+        ("Ape", None),
+        ("Bossy", None),
+        ("Rock Ape", None),
+        ("Gibberer", None),
+        ("Tropical Ape", None),
+        ("Gold Dust", None),
+        ("King Ape", "King Ape"),
+    ),
+    "Arrow Head": (
+        ("Arrow Head", None),
+        ("Priarocks", None),
+        ("Renocraft", None),
+        ("MustardArrow", None),
+        ("Sumopion", None),
+        ("Plated Arrow", "Durahan"),
+        ("Selketo", "Joker"),
+        ("Log Sawer", "Mock"),
+        ("Silver Face", "Silver Face"),
+    ),
+    "Bajarl": (
+        ("Bajarl", None),
+        ("Boxer Bajarl", None),
+        ("Magic Bajarl", None),
+        ("Gym Bajarl", None),
+        ("Ultrarl", None),
+        ("Jaba", "Joker"),
+    ),
+    "Baku": (
+        ("Baku", None),
+        ("Magmax", None),
+        ("Higante", None),
+        ("Gontar", None),
+        ("Giga Pint", None),
+        ("Nussie", None),
+        ("Icebergy", None),
+        ("Shishi", None),
+        ("Dango", None),
+        ("War Baku", "Durahan"),
+        ("Baku Clown", "Joker"),
+    ),
+    "Beaclon": (
+        ("Beaclon", None),
+        ("Bethelgeus", None),
+        ("Rocklon", None),
+        ("Melcarba", None),
+        ("Sloth Beetle", None),
+        ("Eggplantern", None),
+        ("KautRoarKaut", "Bajarl"),
+        ("Ducklon", "Ducken"),
+        ("Centurion", "Durahan"),
+        ("Jaggernaut", "Joker"),
+    ),
+    "Centaur": (
+        ("Centaur", None),
+        ("Antares", None),
+        ("Dragoon", None),
+        ("Trojan", None),
+        ("Ferious", None),
+        ("Celious", None),
+        ("Blue Thunder", None),
+        ("Trotter", None),
+        ("Bazoo", "Bajarl"),
+        ("Chariot", "Durahan"),
+        ("Reaper", "Joker"),
+        ("Sniper", "Sniper"),
+    ),
+    "ColorPandora": (
+        ("ColorPandora", None),
+        ("Liquid Cube", None),
+        ("PeachTreeBug", None),
+        ("Dice", None),
+        ("Tram", None),
+    ),
+    "Dragon": (
+        ("Dragon", None),
+        ("Crab Dragon", None),
+        ("Gariel", None),
+        ("Stone Dragon", None),
+        ("Tecno Dragon", None),
+        ("Oscerot", None),
+        ("Ragnaroks", None),
+        ("Tiamat", None),
+        ("Hound Dragon", None),
+        ("Moo", None),
+        ("Dodongo", "Bajarl"),
+        ("Corkasus", "Beaclon"),
+        ("Armor Dragon", "Durahan"),
+        ("Death Dragon", "Joker"),
+        ("Gidras", "Metalner"),
+        ("Magma Heart", "Magma Heart"),
+    ),
+    "Ducken": (
+        ("Ducken", None),
+        ("Blocken", None),
+        ("Ticken", None),
+        ("Cawken", None),
+        ("Watermelony", None),
+    ),
+    "Durahan": (
+        ("Durahan", None),
+        ("Lorica", None),
+        ("Vesuvius", None),
+        ("Kelmadics", None),
+        ("Leziena", None),
+        ("Hound Knight", None),
+        ("Kokushi Muso", None),
+        ("Ruby Knight", None),
+        ("Shogun", None),
+        ("Hercules", "Beaclon"),
+        ("Genocider", "Joker"),
+        ("Metal Glory", "Metalner"),
+        ("Wood Knight", "Mock"),
+        ("Garuda", "Phoenix"),
+    ),
+    "Gaboo": (
+        ("Gaboo", None),
+        ("Jelly Gaboo", None),
+        ("Frozen Gaboo", None),
+        ("GabooSoldier", None),
+        ("Mad Gaboo", None),
+        ("Dokoo", "Joker"),
+    ),
+    "Gali": (
+        ("Gali", None),
+        ("Stone Mask", None),
+        ("Furred Mask", None),
+        ("Aqua Mask", None),
+        ("Galirous", None),
+        ("Purple Mask", None),
+        ("Pink Mask", None),
+        ("Colorful", None),
+        ("Suezo Mask", None),
+        ("Fanged Mask", None),
+        ("Brown Mask", None),
+        ("Scaled Mask", None),
+    ),
+    "Ghost": (
+        ("Ghost", None),
+        ("Chef", None),
+    ),
+    "Golem": (
+        ("Golem", None),
+        ("Dagon", None),
+        ("Tyrant", None),
+        ("Amenhotep", None),
+        ("Moaigon", None),
+        ("Gobi", None),
+        ("Poseidon", None),
+        ("Black Golem", None),
+        ("Marble Guy", None),
+        ("Pink Golem", None),
+        ("Ecologuardia", None),
+        ("Titan", None),
+        ("Big Blue", None),
+        ("Magna", None),
+        ("Scaled Golem", None),
+        ("Forward Golem", None),
+        ("Dream Golem", None),
+        ("Dao", "Bajarl"),
+        ("Sleepyhead", "Baku"),
+        ("Strong Horn", "Beaclon"),
+        ("Battle Rocks", "Durahan"),
+        ("Angolmor", "Joker"),
+        ("Astro", "Metalner"),
+        ("Wood Golem", "Mock"),
+        ("Mariomax", "Wracky"),
+        ("Pressure", "Zilla"),
+        ("Sand Golem", "Sand Golem"),
+    ),
+    "Hare": (
+        ("Hare", None),
+        ("Prince Hare", None),
+        ("Rocky Fur", None),
+        ("Jelly Hare", None),
+        ("Evil Hare", None),
+        ("Purple Hare", None),
+        ("Fairy Hare", None),
+        ("Leaf Hare", None),
+        ("Four Eyed", None),
+        ("Blue Hare", None),
+        ("Wild Hare", None),
+        ("Scaled Hare", None),
+        ("Kung Fu Hare", None),
+        ("Tornado", None),
+    ),
+    "Henger": (
+        ("Henger", None),
+        ("Garlant", None),
+        ("Proto", None),
+        ("Gaia", None),
+        ("Black Henger", None),
+        ("Omega", None),
+        ("Skeleton", None),
+        ("End Bringer", "Joker"),
+        ("Heuy", "Metalner"),
+        ("Automaton", "Mock"),
+    ),
+    "Hopper": (
+        ("Hopper", None),
+        ("Draco Hopper", None),
+        ("Mustachios", None),
+        ("Pink Hopper", None),
+        ("Fairy Hopper", None),
+        ("Rear Eyed", None),
+        ("Skipper", None),
+        ("Frog Hopper", None),
+        ("Emerald Eye", "Bajarl"),
+        ("Snow Hopper", "Jill"),
+        ("Sneak Hopper", "Joker"),
+        ("Springer", "Metalner"),
+        ("Woody Hopper", "Mock"),
+        ("Bloody Eye", "Bloody Eye"),
+    ),
+    "Jell": (
+        ("Jell", None),
+        ("Noble Jell", None),
+        ("Wall Mimic", None),
+        ("Muddy Jell", None),
+        ("Clay", None),
+        ("Purple Jell", None),
+        ("Pink Jam", None),
+        ("Chloro Jell", None),
+        ("Eye Jell", None),
+        ("Icy Jell", None),
+        ("Worm Jell", None),
+        ("Scaled Jell", None),
+        ("Metal Jell", None),
+    ),
+    "Jill": (
+        ("Jill", None),
+        ("Wondar", None),
+        ("Bengal", None),
+        ("Pong Pong", None),
+        ("Zorjil", None),
+        ("Pierry", None),
+        ("Pithecan", None),
+        ("Skull Capped", "Joker"),
+        ("Bighand", "Bighand"),
+    ),
+    "Joker": (
+        ("Joker", None),
+        ("Flare Death", None),
+        ("Tombstone", None),
+        ("Hell Heart", None),
+        ("Blue Terror", None),
+        ("Bloodshed", None),
+        ("Odium", "Bajarl"),
+    ),
+    "Metalner": (
+        ("Metalner", None),
+        ("Love Seeker", None),
+        ("Metazorl", None),
+        ("Chinois", None),
+    ),
+    "Mew": (
+        ("Mew", None),
+        ("Eared Mew", None),
+        ("Aqua Mew", None),
+        ("Mum Mew", None),
+        ("Bowwow", None),
+        ("Swimmer", None),
+    ),
+    "Mocchi": (
+        ("Mocchi", None),
+        ("Draco Mocchi", None),
+        ("Gelatine", None),
+        ("Nyankoro", None),
+        ("Manna", None),
+        ("Fake Penguin", None),
+        ("Caloriena", None),
+        ("GentleMocchi", None),
+        ("Mocchini", None),
+        ("KnightMocchi", "Durahan"),
+        ("Hell Pierrot", "Joker"),
+        ("White Mocchi", "White Mocchi"),
+    ),
+    "Mock": (
+        ("Mock", None),
+        ("Pole Mock", None),
+        ("White Birch", None),
+        ("Ebony", "Joker"),
+    ),
+    "Monol": (
+        ("Monol", None),
+        ("Ivory Wall", None),
+        ("Obelisk", None),
+        ("Furred Wall", None),
+        ("Ice Candy", None),
+        ("Asphaultum", None),
+        ("Romper Wall", None),
+        ("New Leaf", None),
+        ("Sandy", None),
+        ("Blue Sponge", None),
+        ("Soboros", None),
+        ("Jura Wall", None),
+        ("Dominos", None),
+        ("Galaxy", None),
+        ("Scribble", None),
+        ("Burning Wall", "Burning Wall"),
+    ),
+    "Naga": (
+        ("Naga", None),
+        ("Bazula", None),
+        ("Trident", None),
+        ("Edgehog", None),
+        ("Aqua Cutter", None),
+        ("Crimson Eyed", None),
+        ("Ripper", None),
+        ("Jungler", None),
+        ("Cyclops", None),
+        ("Striker", None),
+        ("Earth Keeper", None),
+        ("Stinger", None),
+        ("Time Noise", None),
+        ("Punisher", "Punisher"),
+    ),
+    "Niton": (
+        ("Niton", None),
+        ("Ammon", None),
+        ("Clear Shell", None),
+        ("Stripe Shell", None),
+        ("Disc Niton", None),
+        ("Dribbler", None),
+        ("Radial Niton", None),
+        ("Alabia Niton", "Bajarl"),
+        ("Knight Niton", "Durahan"),
+        ("Metal Shell", "Metalner"),
+        ("Baum Kuchen", "Mock"),
+    ),
+    "Phoenix": (
+        ("Phoenix", None),
+        ("Cinder Bird", None),
+        ("Blue Phoenix", "Blue Phoenix"),
+    ),
+    "Pixie": (
+        ("Pixie", None),
+        ("Daina", None),
+        ("Angel", None),
+        ("Granity", None),
+        ("Lepus", None),
+        ("Nagisa", None),
+        ("Kitten", None),
+        ("Silhouette", None),
+        ("Allure", None),
+        ("Serenity", None),
+        ("Vanity", None),
+        ("Mint", None),
+        ("Night Flyer", None),
+        ("Dixie", None),
+        ("Kasumi", None),
+        ("Mia", None),
+        ("Poison", None),
+        ("Jinnee", "Bajarl"),
+        ("Unico", "Centaur"),
+        ("Janne", "Durahan"),
+        ("Snowy", "Jill"),
+        ("Lilim", "Joker"),
+        ("Futurity", "Metalner"),
+        ("Dryad", "Mock"),
+        ("Jilt", "Wracky"),
+    ),
+    "Plant": (
+        ("Plant", None),
+        ("Gold Plant", None),
+        ("Rock Plant", None),
+        ("Hare Plant", None),
+        ("Mirage Plant", None),
+        ("Black Plant", None),
+        ("Weeds", None),
+        ("Queen Plant", None),
+        ("Usaba", None),
+        ("Blue Plant", None),
+        ("Fly Plant", None),
+        ("Scaled Plant", None),
+    ),
+    "Suezo": (
+        ("Suezo", None),
+        ("Orion", None),
+        ("Rocky Suezo", None),
+        ("Furred Suezo", None),
+        ("Clear Suezo", None),
+        ("Red Eye", None),
+        ("Purple Suezo", None),
+        ("Pink Eye", None),
+        ("Green Suezo", None),
+        ("Horn", None),
+        ("Fly Eye", None),
+        ("Melon Suezo", None),
+        ("Birdie", None),
+        ("Bronze Suezo", None),
+        ("Silver Suezo", None),
+        ("Gold Suezo", None),
+        # Sueki Suezo cannot be used here, Sueki lives for a single week
+        ("White Suezo", "White Suezo"),
+    ),
+    "Tiger": (
+        ("Tiger", None),
+        ("Balon", None),
+        ("Rock Hound", None),
+        ("Hare Hound", None),
+        ("Jelly Hound", None),
+        ("Terror Dog", None),
+        ("Cabalos", None),
+        ("Daton", None),
+        ("Tropical Dog", None),
+        ("Mono Eyed", None),
+        ("Jagd Hound", None),
+        ("Datonare", None),
+        ("White Hound", None),
+        ("Kamui", "Kamui"),
+    ),
+    "Undine": (
+        ("Undine", None),
+        ("Mermaid", None),
+        ("Siren", "Joker"),
+    ),
+    "Worm": (
+        ("Worm", None),
+        ("Mask Worm", None),
+        ("Rock Worm", None),
+        ("Corone", None),
+        ("Jelly Worm", None),
+        ("Black Worm", None),
+        ("Purple Worm", None),
+        ("Red Worm", None),
+        ("Flower Worm", None),
+        ("Eye Worm", None),
+        ("Drill Tusk", None),
+        ("Scaled Worm", None),
+        ("Express Worm", None),
+    ),
+    "Wracky": (
+        ("Wracky", None),
+        ("Draco Doll", None),
+        ("Pebbly", None),
+        ("Henger Doll", None),
+        ("Baby Doll", None),
+        ("Satan Clause", None),
+        ("Santy", None),
+        ("Bakky", "Bajarl"),
+        ("Petit Knight", "Durahan"),
+        ("Tricker", "Joker"),
+        ("Metal Glay", "Metalner"),
+        ("Mocky", "Mock"),
+    ),
+    "Zilla": (
+        ("Zilla", None),
+        ("Gigalon", None),
+        ("Pink Zilla", None),
+        ("Gooji", None),
+        ("Deluxe Liner", None),
+        ("Zilla King", "Zilla King"),
+    ),
+    "Zuum": (
+        ("Zuum", None),
+        ("Crab Saurian", None),
+        ("Hachiro", None),
+        ("Salamander", None),
+        ("NobleSaurian", None),
+        ("Rock Saurian", None),
+        ("Spot Saurian", None),
+        ("JellySaurian", None),
+        ("Tasman", None),
+        ("BlackSaurian", None),
+        ("Naga Saurian", None),
+        ("FairySaurian", None),
+        ("AlohaSaurian", None),
+        ("Mustardy", None),
+        ("HoundSaurian", None),
+        ("ShellSaurian", None),
+        ("ZebraSaurian", None),
+        ("Sand Saurian", "Bajarl"),
+        ("Basilisk", "Joker"),
+        ("Wood Saurian", "Mock"),
+        ("Wild Saurian", "Wild Saurian"),
+    ),
+    "Kato": (
+        ("Kato", None),
+        ("Draco Kato", None),
+        ("Gordish", None),
+        ("Pink Kato", None),
+        ("Citronie", None),
+        ("Blue Kato", None),
+        ("Ninja Kato", None),
+        ("Axer", None),
+        ("Tainted Cat", "Joker"),
+        ("Crescent", "Crescent"),
+    ),
+}
+
+# Main breed -> techs that can be learned by every monster of that breed
+breed_techs: Dict[str, Tuple[str, ...]] = {
+    "Ape": (
+        "Sneeze",
+        "Swing-Throw",
+        "Blast",
+        "Boomerang",
+        "Grab-Throw",
+        "Big Banana",
+        "Roll Assault",
+        "Bomb",
+        "Big Bomb",
+        "Tasty Banana",
+    ),
+    "Arrow Head": (
+        "Claw Pinch",
+        "Bloodsuction",
+        "Somersault",
+        "Somersaults",
+        "Sting Slash",
+        "Long Punch",
+        "Sting",
+        "TripleStings",
+        "Tail Swing",
+        "Tail Swings",
+        "Death Scythe",
+        "Jumping Claw",
+        "Aerial Claw",
+        "Acrobatics",
+        "Meteor",
+        "Cyclone",
+        "Hidden Sting",
+        "Energy Shot",
+        "Energy Shots",
+        "Javelin",
+        "Roll Assault",
+        "Fist Missile",
+    ),
+    "Bajarl": (
+        "Hook",
+        "1-2-Hook",
+        "Straight",
+        "Uppercut",
+        "1-2-Uppercut",
+        "1-2-Smash",
+        "Magic Punch",
+        "Mystic Combo",
+        "Mystic Punch",
+        "Magic Pot",
+        "Mystic Pot",
+        "Miracle Pot",
+        "Bajarl Beam",
+    ),
+    "Baku": (
+        "Bite",
+        "Two Bites",
+        "Three Bites",
+        "Tongue Slap",
+        "Roar",
+        "Two Roars",
+        "MillionRoars",
+        "Diving Press",
+        "Sneeze",
+        "Mating Song",
+        "Gust Breath",
+        "Hypnotism",
+        "Nap",
+    ),
+    "Beaclon": (
+        "Heavy Punch",
+        "MaximalPunch",
+        "Horn Attack",
+        "SpinningHorn",
+        "Punch Combo",
+        "Beaclon Combo",
+        "Triple Stabs",
+        "Dive Assault",
+        "Spiral Dive",
+        "Tremor",
+        "Horn Combo",
+        "Horn Smash",
+        "Earthquake",
+        "Top Assault",
+        "Rolling Bomb",
+        "Flying Press",
+        "Horn Cannon",
+        "Frantic Horn",
+        "Fist Missile",
+    ),
+    "Centaur": (
+        "Stab Combo",
+        "Triple Stabs",
+        "Stab-Throw",
+        "Z Slash",
+        "Turn Stab",
+        "Mind Flare",
+        "Mind Blast",
+        "Cross Slash",
+        "Energy Shot",
+        "Javelin",
+        "Death Thrust",
+        "Rush Slash",
+        "Energy Shots",
+        "Jump Javelin",
+        "Meteor Drive",
+    ),
+    "ColorPandora": (
+        "Giant Whip",
+        "Two Swings",
+        "Kamikaze",
+        "Vital Ritual",
+        "Cracker",
+        "Megacracker",
+        "Triple Shots",
+        "Delta Attack",
+        "Shotgun",
+        "Megashotgun",
+        "Giant Wheel",
+        "Spiral Rush",
+        "Meteor Drive",
+    ),
+    "Dragon": (
+        "Tail Attack",
+        "Two Bites",
+        "Dragon Punch",
+        "Wing Attack",
+        "Wing Combo",
+        "Claw Combo",
+        "Claw",
+        "Spinning Claw",
+        "Flutter",
+        "Flutters",
+        "Trample",
+        "Fire Breath",
+        "Dragon Combo",
+        "Inferno",
+        "Glide Charge",
+        "SlammingDown",
+        "Flying Combo",
+    ),
+    "Ducken": (
+        "Explosion",
+        "Ducken Dance",
+        "Surprise",
+        "Bound Charge",
+        "Bound Stamp",
+        "Bound",
+        "Eye Beam",
+        "Beam Shower",
+        "Maximal Beam",
+        "Bombing",
+        "Boomerang",
+        "Missile",
+        "Two Missiles",
+        "Big Missile",
+        "Falling Beak",
+        "Frantic Beam",
+    ),
+    "Durahan": (
+        "Swing",
+        "TwisterSlash",
+        "Thunderbolt",
+        "Flash Slash",
+        "Triple Slash",
+        "Slash Combo",
+        "MillionStabs",
+        "Punch Combo",
+        "DeathBringer",
+        "Kick Combo",
+        "V Slash",
+        "Dash Slash",
+        "Charge",
+        "Air Shot",
+        "Jumping Stab",
+        "RollingSlash",
+        "Lightning",
+        "Blast Shot",
+        "Sword Throw",
+        "Gust Slash",
+    ),
+    "Gaboo": (
+        "Acid Spit",
+        "Diving Press",
+        "Chop Combo",
+        "Samurai Kick",
+        "Rolling Chop",
+        "Shock Wave",
+        "Back Blow",
+        "ElectricBlow",
+        "Ninja Kick",
+        "Straight",
+        "Cyclone",
+        "Kiss",
+        "Long Punch",
+        "Spit",
+        "Jumping Chop",
+    ),
+    "Gali": (
+        "Back Blow",
+        "Fire Wall",
+        "Blaze Wall",
+        "Napalm",
+        "Heavy Blow",
+        "Thwack",
+        "Whirlwind",
+        "Typhoon",
+        "Hurricane",
+        "Spirit Blow",
+        "Smash Whack",
+        "Red Wisp",
+        "Blue Wisp",
+        "Flying Mask",
+        "Spirit Punch",
+        "Giant Blow",
+        "Giant Thwack",
+        "Cutting Mask",
+        "Hashing Mask",
+        "Spirit Smash",
+    ),
+    "Ghost": (
+        "Uppercut",
+        "Combination",
+        "Energy Shot",
+        "Surprise",
+        "Astonishment",
+        "Necromancy",
+        "Dove Bomb",
+        "Pigeon Bomb",
+        "Magic Card",
+        "Magic Cards",
+    ),
+    "Golem": (
+        "Heavy Punch",
+        "Heavy Kick",
+        "Slap",
+        "Uppercut",
+        "Thwack",
+        "Brow Hit",
+        "Smash Thwack",
+        "Clap Attack",
+        "Palm Strike",
+        "Double Palms",
+        "Heavy Slap",
+        "Diving Press",
+        "Charge",
+        "Roll Assault",
+        "Brow Smash",
+        "Earthquake",
+        "Giant Clap",
+        "Fist Shot",
+        "Fist Missile",
+        "Cyclone",
+    ),
+    "Hare": (
+        "Straight",
+        "HardStraight",
+        "Kung Fu Fist",
+        "Kung Fu Blow",
+        "Bang",
+        "Big Bang",
+        "Back Blow",
+        "Rolling BlowSmash",
+        "Heavy Smash",
+        "High Kick",
+        "Spin Kick",
+        "Foul Gas",
+        "Kung Fu Kick",
+        "Stinking Gas",
+    ),
+    "Henger": (
+        "Kick",
+        "Heavy Chop",
+        "Laser Cutter",
+        "Yoyo",
+        "Laser Sword",
+        "Laser Swords",
+        "Two Cutters",
+        "Two Yoyos",
+        "Arm Cannon",
+        "Napalm Shot",
+        "Hammer Fall",
+        "Burst Cannon",
+        "Sledge Fall",
+        "Sound Wave",
+        "Fist Missile",
+        "Drill Shot",
+        "Drill Shots",
+        "Eye Beam",
+    ),
+    "Hopper": (
+        "Jump Blow",
+        "2 Jump Blows",
+        "3 Jump Blows",
+        "1-2 Jump Blow",
+        "Hopper Combo",
+        "Flick",
+        "Rapid Flick",
+        "Flick Combo",
+    ),
+    "Jell": (
+        "Pierce",
+        "Suffocation",
+        "Bloodsuction",
+        "Two Whips",
+        "Jell Press",
+        "Jell Cube",
+        "Three Cubes",
+        "Jell Top",
+        "Spiked Top",
+        "Fly Swatter",
+        "Fly Smasher",
+        "Beam Gun",
+        "Beam Cannon",
+        "Cannon",
+        "Slingshot",
+        "Pyramid",
+        "Gatling Gun",
+        "Jell Copter",
+    ),
+    "Jill": (
+        "Ice Spikes",
+        "Clap Attack",
+        "Punch Combo",
+        "Slap Combo",
+        "Cold Breath",
+        "Ice Wave",
+        "Frantic Rush",
+        "Jill Combo",
+        "Ice Meteor",
+        "Snowstorm",
+    ),
+    "Joker": (
+        "Death Slash",
+        "Death Cutter",
+        "Death Energy",
+        "Death Final",
+    ),
+    "Metalner": (
+        "Back Charge",
+        "Straight",
+        "High Kick",
+        "Double Kicks",
+        "Dash Straight",
+        "Elbow Strike",
+        "Double Palms",
+        "Palm Strike",
+        "Metalner Ray",
+        "Burning Palms",
+        "UFO Attack",
+    ),
+    "Mew": (
+        "Head Butt",
+        "Head Assault",
+        "Scratch",
+        "Stab",
+        "RushingPunch",
+        "Diving Press",
+        "HundredBlows",
+        "MillionBlows",
+        "Twiddling",
+        "Twiddling-2",
+        "Twiddling-Z",
+        "Miaow",
+        "Song of Mew",
+        "Recital",
+        "Zap",
+        "Maximal Zap",
+    ),
+    "Mocchi": (
+        "Thrust",
+        "1-2 Thrust",
+        "Thrusts",
+        "Licking",
+        "Press",
+        "Diving Press",
+        "Giant Press",
+        "Roll Attack",
+        "DazzlingRoll",
+        "Petal Swirl",
+        "Petal Vortex",
+        "Petal Storm",
+        "Mocchi Ray",
+        "Mocchi Beam",
+        "MocchiCannon",
+        "Flame",  # Mocchi/Dragon only
+        "Roll Assault",
+        "Petal Roll",
+    ),
+    "Mock": (
+        "Leaf Cutter",
+        "Leaf Gatling",
+        "Twig Gun",
+        "Twig Gatling",
+        "Energy Steal",
+        "Twister",
+        "Twisters",
+    ),
+    "Monol": (
+        "Needle Stabs",
+        "Spike Stabs",
+        "Ray",
+        "Double Rays",
+        "Triple Rays",
+        "Spike Bite",
+        "Scratch",
+        "Knock",
+        "Two Knocks",
+        "Three Knocks",
+        "Flattening-L",
+        "Screech",
+        "StrangeLight",
+        "Flattening-X",
+        "Sound Wave",
+        "Tentacles",
+        "Beam",
+        "Double Beams",
+        "Triple Beams",
+    ),
+    "Naga": (
+        "Stab",
+        "Pierce",
+        "Tail Assault",
+        "Life Steal",
+        "Poison Gas",
+        "Energy Shot",
+        "Turn Assault",
+        "Drill Attack",
+        "Eye Beam",
+        "Energy Shots",
+    ),
+    "Niton": (
+        "Numbing Stab",
+        "ElectricStab",
+        "Sound Wave",
+        "Sound Wave-L",
+        "Sound Wave-X",
+        "Shock",
+        "Severe Shock",
+        "MaximalShock",
+        "Niton Ink",
+        "Shell Attack",
+        "Spiked Shell",
+        "ViolentShell",
+    ),
+    "Phoenix": (
+        "Rapid Beaks",
+        "Flame Shot",
+        "Flame Cannon",
+        "Fire Twister",
+        "Fire Tornado",
+        "Heat Beam",
+        "Fire Stream",
+        "Fire Wave",
+    ),
+    "Pixie": (
+        "Slap",
+        "High Kick",
+        "Heel Raid",
+        "Bang",
+        "Big Bang",
+        "Bolt",
+        "Lightning",
+        "Kiss",
+        "Life Steal",
+        "Refreshment",
+        "Flame",
+        "Gigaflame",
+        "Ray",
+        "Megaray",
+        "Gigaray",
+    ),
+    "Plant": (
+        "Root Attack",
+        "Root Combo",
+        "Life Steal",
+        "Jab Combo",
+        "Plant Combo",
+        "Toxic Nectar",
+        "Toxic Pollen",
+        "Face Drill",
+        "Seed Gun",
+        "Seed Gatling",
+    ),
+    "Suezo": (
+        "Tongue Slap",
+        "Kiss",
+        "Bite",
+        "Lick",
+        "Chewing",
+        "Teleport",
+        "Telekinesis",
+        "Telepathy",
+        "Eye Beam",
+        "Yodel",
+    ),
+    "Tiger": (
+        "Bolt",
+        "One-Two",
+        "Lightning",
+        "Charge",
+        "Combination",
+        "Ice Bomb",
+        "Stab",
+        "Roll Assault",
+        "Blizzard",
+        "Roar",
+    ),
+    "Undine": (
+        "Ice Swords",
+        "Dolphin Blow",
+        "Splash",
+        "Aqua Whip",
+        "Two Whips",
+        "Kiss",
+        "Arrow",
+        "Aqua Wave",
+        "Aqua Waves",
+        "Ice Coffin",
+        "Ice Arrow",
+        "Aqua Whirl",
+        "Water Gun",
+        "Icicle Arrow",
+        "Hailstorm",
+        "Cold Storm",
+        "Vitalization",
+        "Cold Geyser",
+        "Water Cannon",
+    ),
+    "Worm": (
+        "Somersault",
+        "Somersaults",
+        "Tail Lash",
+        "Two Lashes",
+        "Three Lashes",
+        "Roll Assault",
+        "Pierce-Throw",
+        "Pinch-Throw",
+        "Pierce",
+        "Tusk Slash",
+        "Injection",
+        "Poison Gas",
+        "Wheel Attack",
+    ),
+    "Wracky": (
+        "Weapon Combo",
+        "Kick",
+        "Spin Kick",
+        "Twister Kick",
+        "Punch",
+        "Heavy Punch",
+        "Wracky Combo",
+        "Necromancy",
+        "Sneak Attack",
+        "Sneak Combo",
+        "Spin Slash",
+        "Trick",
+        "Head Spike",
+        "Fire Spike",
+        "Air Shot",
+        "Blast Shot",
+        "TwisterSlash",
+        "Beat Dance",
+        "Cursed Dance",
+        "Flame",
+    ),
+    "Zilla": (
+        "Head Butt",
+        "Knocking-Up",
+        "Tail Lashes",
+        "Sneeze",
+        "Body Press",
+        "Wave Riding",
+        "Earthquake",
+        "Bubbles",
+        "Charge",
+        "Zilla Rush",
+        "Roll Assault",
+        "Tidal Wave",
+    ),
+    "Zuum": (
+        "MillionClaws",
+        "Bite",
+        "Bite-Throw",
+        "Claw Combo",
+        "MillionBites",
+        "Tail Lash",
+        "Tail Lashes",
+        "Dust Cloud",
+        "Hypnotism",
+        "Tail Combo",
+        "Jumping Claw",
+        "Diving Claw",
+        "Aerial Claw",
+        "Fire Ball",
+        "Fire Breath",
+        "Jumping Fire",
+        "Charge",
+        "Fire Charge",
+        "Roll Assault",
+        "Five Balls",
+        "Fire Bomb",
+        "Burning Roll",
+    ),
+    "Kato": (
+        "Slash Claws",
+        "Claw Combo",
+        "Smoke Breath",
+        "Oil Spray",
+        "Turn Claw",
+        "Turn Claws",
+        "Rolling Claw",
+        "Oil Fire",
+        "Oil Flame",  # Remove for explicit PSX support
+        "Drill Claw",
+        "Twister Claw",
+        "Tornado Claw",
+        "Phantom Claw",
+        "Hopping Claw",
+        "Jumping Claw",
+        "Aerial Claw",
+        "Oil Drinking",
+    ),
+}
+
+# Main breed -> mutually exclusive tech sets, one of which is picked by where a random roll falls between the thresholds
+exclusive_breed_techs: Dict[str, Tuple[Tuple[float, ...], Tuple[Tuple[str, ...], ...]]] = {
+    "Hopper": ((0.5,), (("Lightning", "Flame"), ("Phantom Claw",))),
+    "Kato": ((0.33, 0.66), (("Lick",), ("Licking",), ("Bolt",))),  # yes, these two are separate AND mutually exclusive
+    "Pixie": ((0.25, 0.5, 0.75), (("Phantom Claw",), ("Death Final",), ("1-2 Punch",), ("Fire Breath",))),
+    "Wracky": ((0.5,), (("Fire-Juggler",), ("Explosion",))),
+}
+
+# Kato has data above but is not rolled for objectives
+rolled_breeds: Tuple[str, ...] = tuple(breed for breed in breed_combinations if breed != "Kato")
+
+# (main breed, combination, required breed) for every rolled breed, flattened so filtering is a single pass
+rolled_combinations: Tuple[Tuple[str, str, Optional[str]], ...] = tuple(
+    (breed, combination, required_breed)
+    for breed in rolled_breeds
+    for combination, required_breed in breed_combinations[breed]
+)
+
+
+def smallest_tech_count(breed: str) -> int:
+    count: int = len(breed_techs[breed])
+
+    if breed in exclusive_breed_techs:
+        count += min(len(tech_set) for tech_set in exclusive_breed_techs[breed][1])
+
+    return count
+
+
+# Main breed -> how many techs its objective can list, capped by its smallest possible tech set
+tech_quantities: Dict[str, range] = {breed: range(3, min(5, smallest_tech_count(breed)) + 1) for breed in rolled_breeds}
+
+
+@functools.lru_cache(maxsize=8)
+def unlocked_monsters(unlocked: FrozenSet[str]) -> Tuple[str, ...]:
+    """
+    Every rolled combination available with the given unlocked breeds. Shared by all game instances in the process,
+    since most players in a multiworld use the same unlocks. Only the last few unlock sets are kept.
+    """
+
+    return tuple(
+        combination for breed, combination, required_breed in rolled_combinations
+        if breed in unlocked and (required_breed is None or required_breed in unlocked)
+    )
 
 
 class MonsterRancher2DXGame(Game):
@@ -34,47 +1224,9 @@ class MonsterRancher2DXGame(Game):
     def optional_game_constraint_templates(self) -> List[GameObjectiveTemplate]:
         return list()
 
+    # Tech data draws from the game's own random, so instances don't share their templates
+    @objective_catalog(shared=False)
     def game_objective_templates(self) -> List[GameObjectiveTemplate]:
-        tech_functions: Dict[str, Callable[[], List[str]]] = {
-            "Ape": self.ape_techs,
-            "Arrow Head": self.arrowhead_techs,
-            "Bajarl": self.bajarl_techs,
-            "Baku": self.baku_techs,
-            "Beaclon": self.beaclon_techs,
-            "Centaur": self.centaur_techs,
-            "ColorPandora": self.colorpandora_techs,
-            "Dragon": self.dragon_techs,
-            "Ducken": self.ducken_techs,
-            "Durahan": self.durahan_techs,
-            "Gaboo": self.gaboo_techs,
-            "Gali": self.gali_techs,
-            "Ghost": self.ghost_techs,
-            "Golem": self.golem_techs,
-            "Hare": self.hare_techs,
-            "Henger": self.henger_techs,
-            "Hopper": self.hopper_techs,
-            "Jell": self.jell_techs,
-            "Jill": self.jill_techs,
-            "Joker": self.joker_techs,
-            "Metalner": self.metalner_techs,
-            "Mew": self.mew_techs,
-            "Mocchi": self.mocchi_techs,
-            "Mock": self.mock_techs,
-            "Monol": self.monol_techs,
-            "Naga": self.naga_techs,
-            "Niton": self.niton_techs,
-            "Phoenix": self.phoenix_techs,
-            "Pixie": self.pixie_techs,
-            "Plant": self.plant_techs,
-            "Suezo": self.suezo_techs,
-            "Tiger": self.tiger_techs,
-            "Undine": self.undine_techs,
-            "Worm": self.worm_techs,
-            "Wracky": self.wracky_techs,
-            "Zilla": self.zilla_techs,
-            "Zuum": self.zuum_techs,
-        }
-
         objectives = [
             GameObjectiveTemplate(
                 label="Win the following tournaments with a MONSTER: TOURNAMENT",
@@ -152,872 +1304,37 @@ class MonsterRancher2DXGame(Game):
             ),
         ]
 
-        for monster, tech_function in tech_functions.items():
-            objectives.append(
-                GameObjectiveTemplate(
-                    label=f"Obtain two of the following techs on a {monster} main breed: TECHS",
-                    data={
-                        "TECHS": (tech_function, range(3, min(5, len(tech_function())) + 1)),
-                    },
-                    is_time_consuming=False,
-                    is_difficult=False,
-                    weight=1,
-                )
-            )
+        objectives.extend(self.tech_objective_templates)
 
         return objectives
 
-    def unlocked_monster(self, monster: str) -> bool:
-        default_mons = [
-            "Ape",
-            "Arrow Head",
-            "ColorPandora",
-            "Gaboo",
-            "Jell",
-            "Hare",
-            "Hopper",
-            "Kato",
-            "Mocchi",
-            "Monol",
-            "Naga",
-            "Pixie",
-            "Plant",
-            "Suezo",
-            "Tiger",
-            "Zuum",
-        ]
-        return (monster in default_mons or
-                monster in self.archipelago_options.monster_rancher_2_dx_unlocked_main_breeds or
-                monster in self.archipelago_options.monster_rancher_2_dx_unlocked_sub_breeds)
-
-    def apes(self) -> List[str]:
-        apes = [
-            "Ape",
-            "Bossy",
-            "Rock Ape",
-            "Gibberer",
-            "Tropical Ape",
-            "Gold Dust",
-        ]
-
-        if self.unlocked_monster("King Ape"):
-            apes.append("King Ape")
-
-        return apes
-
-    def arrowheads(self) -> List[str]:
-        arrowheads = [
-            "Arrow Head",
-            "Priarocks",
-            "Renocraft",
-            "MustardArrow",
-            "Sumopion"
-        ]
-
-        if self.unlocked_monster("Durahan"):
-            arrowheads.append("Plated Arrow")
-
-        if self.unlocked_monster("Joker"):
-            arrowheads.append("Selketo")
-
-        if self.unlocked_monster("Mock"):
-            arrowheads.append("Log Sawer")
-
-        if self.unlocked_monster("Silver Face"):
-            arrowheads.append("Silver Face")
-
-        return arrowheads
-
-    def bajarls(self) -> List[str]:
-        bajarls = [
-            "Bajarl",
-            "Boxer Bajarl",
-            "Magic Bajarl",
-            "Gym Bajarl",
-            "Ultrarl",
-        ]
-
-        if self.unlocked_monster("Joker"):
-            bajarls.append("Jaba")
-
-        return bajarls
-
-    def bakus(self) -> List[str]:
-        bakus = [
-            "Baku",
-            "Magmax",
-            "Higante",
-            "Gontar",
-            "Giga Pint",
-            "Nussie",
-            "Icebergy",
-            "Shishi",
-            "Dango"
-        ]
-
-        if self.unlocked_monster("Durahan"):
-            bakus.append("War Baku")
-
-        if self.unlocked_monster("Joker"):
-            bakus.append("Baku Clown")
-
-        return bakus
-
-    def beaclons(self) -> List[str]:
-        beaclons = [
-            "Beaclon",
-            "Bethelgeus",
-            "Rocklon",
-            "Melcarba",
-            "Sloth Beetle",
-            "Eggplantern"
-        ]
-
-        if self.unlocked_monster("Bajarl"):
-            beaclons.append("KautRoarKaut")
-
-        if self.unlocked_monster("Ducken"):
-            beaclons.append("Ducklon")
-
-        if self.unlocked_monster("Durahan"):
-            beaclons.append("Centurion")
-
-        if self.unlocked_monster("Joker"):
-            beaclons.append("Jaggernaut")
-
-        return beaclons
-
-    def centaurs(self) -> List[str]:
-        centaurs = [
-            "Centaur",
-            "Antares",
-            "Dragoon",
-            "Trojan",
-            "Ferious",
-            "Celious",
-            "Blue Thunder",
-            "Trotter"
-        ]
-
-        if self.unlocked_monster("Bajarl"):
-            centaurs.append("Bazoo")
-
-        if self.unlocked_monster("Durahan"):
-            centaurs.append("Chariot")
-
-        if self.unlocked_monster("Joker"):
-            centaurs.append("Reaper")
-
-        if self.unlocked_monster("Sniper"):
-            centaurs.append("Sniper")
-
-        return centaurs
-
-    @staticmethod
-    def colorpandoras() -> List[str]:
-        return [
-            "ColorPandora",
-            "Liquid Cube",
-            "PeachTreeBug",
-            "Dice",
-            "Tram"
-        ]
-
-    def dragons(self) -> List[str]:
-        dragons = [
-            "Dragon",
-            "Crab Dragon",
-            "Gariel",
-            "Stone Dragon",
-            "Tecno Dragon",
-            "Oscerot",
-            "Ragnaroks",
-            "Tiamat",
-            "Hound Dragon",
-            "Moo"
-        ]
-
-        if self.unlocked_monster("Bajarl"):
-            dragons.append("Dodongo")
-
-        if self.unlocked_monster("Beaclon"):
-            dragons.append("Corkasus")
-
-        if self.unlocked_monster("Durahan"):
-            dragons.append("Armor Dragon")
-
-        if self.unlocked_monster("Joker"):
-            dragons.append("Death Dragon")
-
-        if self.unlocked_monster("Metalner"):
-            dragons.append("Gidras")
-
-        if self.unlocked_monster("Magma Heart"):
-            dragons.append("Magma Heart")
-
-        return dragons
-
-    @staticmethod
-    def duckens() -> List[str]:
-        return [
-            "Ducken",
-            "Blocken",
-            "Ticken",
-            "Cawken",
-            "Watermelony",
-        ]
-
-    def durahans(self) -> List[str]:
-        durahans = [
-            "Durahan",
-            "Lorica",
-            "Vesuvius",
-            "Kelmadics",
-            "Leziena",
-            "Hound Knight",
-            "Kokushi Muso",
-            "Ruby Knight",
-            "Shogun",
-        ]
-
-        if self.unlocked_monster("Beaclon"):
-            durahans.append("Hercules")
-
-        if self.unlocked_monster("Joker"):
-            durahans.append("Genocider")
-
-        if self.unlocked_monster("Metalner"):
-            durahans.append("Metal Glory")
-
-        if self.unlocked_monster("Mock"):
-            durahans.append("Wood Knight")
-
-        if self.unlocked_monster("Phoenix"):
-            durahans.append("Garuda")
-
-        return durahans
-
-    def gaboos(self) -> List[str]:
-        gaboos = [
-            "Gaboo",
-            "Jelly Gaboo",
-            "Frozen Gaboo",
-            "GabooSoldier",
-            "Mad Gaboo",
-        ]
-
-        if self.unlocked_monster("Joker"):
-            gaboos.append("Dokoo")
-
-        return gaboos
-
-    @staticmethod
-    def galis() -> List[str]:
-        return [
-            "Gali",
-            "Stone Mask",
-            "Furred Mask",
-            "Aqua Mask",
-            "Galirous",
-            "Purple Mask",
-            "Pink Mask",
-            "Colorful",
-            "Suezo Mask",
-            "Fanged Mask",
-            "Brown Mask",
-            "Scaled Mask",
-        ]
-
-    @staticmethod
-    def ghosts() -> List[str]:
-        return ["Ghost", "Chef"]
-
-    def golems(self) -> List[str]:
-        golems = [
-            "Golem",
-            "Dagon",
-            "Tyrant",
-            "Amenhotep",
-            "Moaigon",
-            "Gobi",
-            "Poseidon",
-            "Black Golem",
-            "Marble Guy",
-            "Pink Golem",
-            "Ecologuardia",
-            "Titan",
-            "Big Blue",
-            "Magna",
-            "Scaled Golem",
-            "Forward Golem",
-            "Dream Golem",
-        ]
-
-        if self.unlocked_monster("Bajarl"):
-            golems.append("Dao")
-
-        if self.unlocked_monster("Baku"):
-            golems.append("Sleepyhead")
-
-        if self.unlocked_monster("Beaclon"):
-            golems.append("Strong Horn")
-
-        if self.unlocked_monster("Durahan"):
-            golems.append("Battle Rocks")
-
-        if self.unlocked_monster("Joker"):
-            golems.append("Angolmor")
-
-        if self.unlocked_monster("Metalner"):
-            golems.append("Astro")
-
-        if self.unlocked_monster("Mock"):
-            golems.append("Wood Golem")
-
-        if self.unlocked_monster("Wracky"):
-            golems.append("Mariomax")
-
-        if self.unlocked_monster("Zilla"):
-            golems.append("Pressure")
-
-        if self.unlocked_monster("Sand Golem"):
-            golems.append("Sand Golem")
-
-        return golems
-
-    @staticmethod
-    def hares() -> List[str]:
-        return [
-            "Hare",
-            "Prince Hare",
-            "Rocky Fur",
-            "Jelly Hare",
-            "Evil Hare",
-            "Purple Hare",
-            "Fairy Hare",
-            "Leaf Hare",
-            "Four Eyed",
-            "Blue Hare",
-            "Wild Hare",
-            "Scaled Hare",
-            "Kung Fu Hare",
-            "Tornado"
-        ]
-
-    def hengers(self) -> List[str]:
-        hengers = [
-            "Henger",
-            "Garlant",
-            "Proto",
-            "Gaia",
-            "Black Henger",
-            "Omega",
-            "Skeleton",
-        ]
-
-        if self.unlocked_monster("Joker"):
-            hengers.append("End Bringer")
-
-        if self.unlocked_monster("Metalner"):
-            hengers.append("Heuy")
-
-        if self.unlocked_monster("Mock"):
-            hengers.append("Automaton")
-
-        return hengers
-
-    def hoppers(self) -> List[str]:
-        hoppers = [
-            "Hopper",
-            "Draco Hopper",
-            "Mustachios",
-            "Pink Hopper",
-            "Fairy Hopper",
-            "Rear Eyed",
-            "Skipper",
-            "Frog Hopper",
-        ]
-
-        if self.unlocked_monster("Bajarl"):
-            hoppers.append("Emerald Eye")
-
-        if self.unlocked_monster("Jill"):
-            hoppers.append("Snow Hopper")
-
-        if self.unlocked_monster("Joker"):
-            hoppers.append("Sneak Hopper")
-
-        if self.unlocked_monster("Metalner"):
-            hoppers.append("Springer")
-
-        if self.unlocked_monster("Mock"):
-            hoppers.append("Woody Hopper")
-
-        if self.unlocked_monster("Bloody Eye"):
-            hoppers.append("Bloody Eye")
-
-        return hoppers
-
-    @staticmethod
-    def jells() -> List[str]:
-        return [
-            "Jell",
-            "Noble Jell",
-            "Wall Mimic",
-            "Muddy Jell",
-            "Clay",
-            "Purple Jell",
-            "Pink Jam",
-            "Chloro Jell",
-            "Eye Jell",
-            "Icy Jell",
-            "Worm Jell",
-            "Scaled Jell",
-            "Metal Jell"
-        ]
-
-    def jills(self) -> List[str]:
-        jills = [
-            "Jill",
-            "Wondar",
-            "Bengal",
-            "Pong Pong",
-            "Zorjil",
-            "Pierry",
-            "Pithecan"
-        ]
-
-        if self.unlocked_monster("Joker"):
-            jills.append("Skull Capped")
-
-        if self.unlocked_monster("Bighand"):
-            jills.append("Bighand")
-
-        return jills
-
-    def jokers(self) -> List[str]:
-        jokers = [
-            "Joker",
-            "Flare Death",
-            "Tombstone",
-            "Hell Heart",
-            "Blue Terror",
-            "Bloodshed",
-        ]
-
-        if self.unlocked_monster("Bajarl"):
-            jokers.append("Odium")
-
-        return jokers
-
-    def katos(self) -> List[str]:
-        katos = [
-            "Kato",
-            "Draco Kato",
-            "Gordish",
-            "Pink Kato",
-            "Citronie",
-            "Blue Kato",
-            "Ninja Kato",
-            "Axer",
-        ]
-
-        if self.unlocked_monster("Joker"):
-            katos.append("Tainted Cat")
-
-        if self.unlocked_monster("Crescent"):
-            katos.append("Crescent")
-
-        return katos
-
-    @staticmethod
-    def metalners() -> List[str]:
-        return ["Metalner", "Love Seeker", "Metazorl", "Chinois"]
-
-    @staticmethod
-    def mews() -> List[str]:
-        return ["Mew", "Eared Mew", "Aqua Mew", "Mum Mew", "Bowwow", "Swimmer"]
-
-    def mocchis(self) -> List[str]:
-        mocchis = [
-            "Mocchi",
-            "Draco Mocchi",
-            "Gelatine",
-            "Nyankoro",
-            "Manna",
-            "Fake Penguin",
-            "Caloriena",
-            "GentleMocchi",
-            "Mocchini",
-        ]
-
-        if self.unlocked_monster("Durahan"):
-            mocchis.append("KnightMocchi")
-
-        if self.unlocked_monster("Joker"):
-            mocchis.append("Hell Pierrot")
-
-        if self.unlocked_monster("White Mocchi"):
-            mocchis.append("White Mocchi")
-
-        return mocchis
-
-    def mocks(self) -> List[str]:
-        mocks = [
-            "Mock",
-            "Pole Mock",
-            "White Birch",
-        ]
-
-        if self.unlocked_monster("Joker"):
-            mocks.append("Ebony")
-
-        return mocks
-
-    def monols(self) -> List[str]:
-        monols = [
-            "Monol",
-            "Ivory Wall",
-            "Obelisk",
-            "Furred Wall",
-            "Ice Candy",
-            "Asphaultum",
-            "Romper Wall",
-            "New Leaf",
-            "Sandy",
-            "Blue Sponge",
-            "Soboros",
-            "Jura Wall",
-            "Dominos",
-            "Galaxy",
-            "Scribble",
-        ]
-
-        if self.unlocked_monster("Burning Wall"):
-            monols.append("Burning Wall")
-
-        return monols
-
-    def nagas(self) -> List[str]:
-        nagas = [
-            "Naga",
-            "Bazula",
-            "Trident",
-            "Edgehog",
-            "Aqua Cutter",
-            "Crimson Eyed",
-            "Ripper",
-            "Jungler",
-            "Cyclops",
-            "Striker",
-            "Earth Keeper",
-            "Stinger",
-            "Time Noise"
-        ]
-
-        if self.unlocked_monster("Punisher"):
-            nagas.append("Punisher")
-
-        return nagas
-
-    def nitons(self) -> List[str]:
-        nitons = [
-            "Niton",
-            "Ammon",
-            "Clear Shell",
-            "Stripe Shell",
-            "Disc Niton",
-            "Dribbler",
-            "Radial Niton",
-        ]
-
-        if self.unlocked_monster("Bajarl"):
-            nitons.append("Alabia Niton")
-
-        if self.unlocked_monster("Durahan"):
-            nitons.append("Knight Niton")
-
-        if self.unlocked_monster("Metalner"):
-            nitons.append("Metal Shell")
-
-        if self.unlocked_monster("Mock"):
-            nitons.append("Baum Kuchen")
-
-        return nitons
-
-    def phoenixes(self) -> List[str]:
-        phoenixes = [
-            "Phoenix",
-            "Cinder Bird",
-        ]
-
-        if self.unlocked_monster("Blue Phoenix"):
-            phoenixes.append("Blue Phoenix")
-
-        return phoenixes
-
-    def pixies(self) -> List[str]:
-        pixies = [
-            "Pixie",
-            "Daina",
-            "Angel",
-            "Granity",
-            "Lepus",
-            "Nagisa",
-            "Kitten",
-            "Silhouette",
-            "Allure",
-            "Serenity",
-            "Vanity",
-            "Mint",
-            "Night Flyer",
-            "Dixie",
-            "Kasumi",
-            "Mia",
-            "Poison",
-        ]
-
-        if self.unlocked_monster("Bajarl"):
-            pixies.append("Jinnee")
-
-        if self.unlocked_monster("Centaur"):
-            pixies.append("Unico")
-
-        if self.unlocked_monster("Durahan"):
-            pixies.append("Janne")
-
-        if self.unlocked_monster("Jill"):
-            pixies.append("Snowy")
-
-        if self.unlocked_monster("Joker"):
-            pixies.append("Lilim")
-
-        if self.unlocked_monster("Metalner"):
-            pixies.append("Futurity")
-
-        if self.unlocked_monster("Mock"):
-            pixies.append("Dryad")
-
-        if self.unlocked_monster("Wracky"):
-            pixies.append("Jilt")
-
-        return pixies
-
-    @staticmethod
-    def plants() -> List[str]:
-        return [
-            "Plant",
-            "Gold Plant",
-            "Rock Plant",
-            "Hare Plant",
-            "Mirage Plant",
-            "Black Plant",
-            "Weeds",
-            "Queen Plant",
-            "Usaba",
-            "Blue Plant",
-            "Fly Plant",
-            "Scaled Plant"
-        ]
-
-    def suezos(self) -> List[str]:
-        suezos = [
-            "Suezo",
-            "Orion",
-            "Rocky Suezo",
-            "Furred Suezo",
-            "Clear Suezo",
-            "Red Eye",
-            "Purple Suezo",
-            "Pink Eye",
-            "Green Suezo",
-            "Horn",
-            "Fly Eye",
-            "Melon Suezo",
-            "Birdie",
-            "Bronze Suezo",
-            "Silver Suezo",
-            "Gold Suezo",
-            # Sueki Suezo cannot be used here, Sueki lives for a single week
-        ]
-
-        if self.unlocked_monster("White Suezo"):
-            suezos.append("White Suezo")
-
-        return suezos
-
-    def tigers(self) -> List[str]:
-        tigers = [
-            "Tiger",
-            "Balon",
-            "Rock Hound",
-            "Hare Hound",
-            "Jelly Hound",
-            "Terror Dog",
-            "Cabalos",
-            "Daton",
-            "Tropical Dog",
-            "Mono Eyed",
-            "Jagd Hound",
-            "Datonare",
-            "White Hound"
-        ]
-
-        if self.unlocked_monster("Kamui"):
-            tigers.append("Kamui")
-
-        return tigers
-
-    def undines(self) -> List[str]:
-        undines = ["Undine", "Mermaid"]
+    @functools.cached_property
+    def tech_objective_templates(self) -> Tuple[GameObjectiveTemplate, ...]:
+        # Without stable tech sets, every objective rolls the breed's exclusive techs again
+        tech_data: Type[functools.partial] = functools.partial if self.stable_tech_sets else VolatilePartial
 
-        if self.unlocked_monster("Joker"):
-            undines.append("Siren")
-
-        return undines
-
-    @staticmethod
-    def worms() -> List[str]:
-        return [
-            "Worm",
-            "Mask Worm",
-            "Rock Worm",
-            "Corone",
-            "Jelly Worm",
-            "Black Worm",
-            "Purple Worm",
-            "Red Worm",
-            "Flower Worm",
-            "Eye Worm",
-            "Drill Tusk",
-            "Scaled Worm",
-            "Express Worm",
-        ]
-
-    def wrackys(self) -> List[str]:
-        wrackys = [
-            "Wracky",
-            "Draco Doll",
-            "Pebbly",
-            "Henger Doll",
-            "Baby Doll",
-            "Satan Clause",
-            "Santy"
-        ]
-
-        if self.unlocked_monster("Bajarl"):
-            wrackys.append("Bakky")
-
-        if self.unlocked_monster("Durahan"):
-            wrackys.append("Petit Knight")
-
-        if self.unlocked_monster("Joker"):
-            wrackys.append("Tricker")
-
-        if self.unlocked_monster("Metalner"):
-            wrackys.append("Metal Glay")
-
-        if self.unlocked_monster("Mock"):
-            wrackys.append("Mocky")
-
-        return wrackys
-
-    def zillas(self) -> List[str]:
-        zillas = [
-            "Zilla",
-            "Gigalon",
-            "Pink Zilla",
-            "Gooji",
-            "Deluxe Liner"
-        ]
-
-        if self.unlocked_monster("Zilla King"):
-            zillas.append("Zilla King")
-
-        return zillas
-
-    def zuums(self) -> List[str]:
-        zuums = [
-            "Zuum",
-            "Crab Saurian",
-            "Hachiro",
-            "Salamander",
-            "NobleSaurian",
-            "Rock Saurian",
-            "Spot Saurian",
-            "JellySaurian",
-            "Tasman",
-            "BlackSaurian",
-            "Naga Saurian",
-            "FairySaurian",
-            "AlohaSaurian",
-            "Mustardy",
-            "HoundSaurian",
-            "ShellSaurian",
-            "ZebraSaurian",
-        ]
-
-        if self.unlocked_monster("Bajarl"):
-            zuums.append("Sand Saurian")
-
-        if self.unlocked_monster("Joker"):
-            zuums.append("Basilisk")
-
-        if self.unlocked_monster("Mock"):
-            zuums.append("Wood Saurian")
-
-        if self.unlocked_monster("Wild Saurian"):
-            zuums.append("Wild Saurian")
-
-        return zuums
-
-    def monsters(self):
-        monster_functions: Dict[str, Callable[[], List[str]]] = {
-            "Ape": self.apes,
-            "Arrow Head": self.arrowheads,
-            "Bajarl": self.bajarls,
-            "Baku": self.bakus,
-            "Beaclon": self.beaclons,
-            "Centaur": self.centaurs,
-            "ColorPandora": self.colorpandoras,
-            "Dragon": self.dragons,
-            "Ducken": self.duckens,
-            "Durahan": self.durahans,
-            "Gaboo": self.gaboos,
-            "Gali": self.galis,
-            "Ghost": self.ghosts,
-            "Golem": self.golems,
-            "Hare": self.hares,
-            "Henger": self.hengers,
-            "Hopper": self.hoppers,
-            "Jell": self.jells,
-            "Jill": self.jills,
-            "Joker": self.jokers,
-            "Metalner": self.metalners,
-            "Mew": self.mews,
-            "Mocchi": self.mocchis,
-            "Mock": self.mocks,
-            "Monol": self.monols,
-            "Naga": self.nagas,
-            "Niton": self.nitons,
-            "Phoenix": self.phoenixes,
-            "Pixie": self.pixies,
-            "Plant": self.plants,
-            "Suezo": self.suezos,
-            "Tiger": self.tigers,
-            "Undine": self.undines,
-            "Worm": self.worms,
-            "Wracky": self.wrackys,
-            "Zilla": self.zillas,
-            "Zuum": self.zuums,
-        }
+        return tuple(
+            GameObjectiveTemplate(
+                label=f"Obtain two of the following techs on a {breed} main breed: TECHS",
+                data={
+                    "TECHS": (tech_data(self.techs, breed), tech_quantities[breed]),
+                },
+                is_time_consuming=False,
+                is_difficult=False,
+                weight=1,
+            )
+            for breed in rolled_breeds
+        )
 
-        monsters = []
-        for monster, function in monster_functions.items():
-            if self.unlocked_monster(monster):
-                monsters.extend(function())
+    @functools.cached_property
+    def unlocked_breeds(self) -> FrozenSet[str]:
+        return default_breeds.union(
+            self.archipelago_options.monster_rancher_2_dx_unlocked_main_breeds.value,
+            self.archipelago_options.monster_rancher_2_dx_unlocked_sub_breeds.value,
+        )
 
-        return monsters
+    def monsters(self) -> Tuple[str, ...]:
+        return unlocked_monsters(self.unlocked_breeds)
 
     @staticmethod
     def sueki_tournaments() -> List[str]:
@@ -1157,776 +1474,33 @@ class MonsterRancher2DXGame(Game):
     def errantries() -> List[str]:
         return ["Kawrea", "Parepare", "Torble Sea", "Mandy", "Papas"]
 
-    # Techs!
-
-    @staticmethod
-    def ape_techs() -> List[str]:
-        return [
-            "Sneeze",
-            "Swing-Throw",
-            "Blast",
-            "Boomerang",
-            "Grab-Throw",
-            "Big Banana",
-            "Roll Assault",
-            "Bomb",
-            "Big Bomb",
-            "Tasty Banana"
-        ]
-
-    @staticmethod
-    def arrowhead_techs() -> List[str]:
-        return [
-            "Claw Pinch",
-            "Bloodsuction",
-            "Somersault",
-            "Somersaults",
-            "Sting Slash",
-            "Long Punch",
-            "Sting",
-            "TripleStings",
-            "Tail Swing",
-            "Tail Swings",
-            "Death Scythe",
-            "Jumping Claw",
-            "Aerial Claw",
-            "Acrobatics",
-            "Meteor",
-            "Cyclone",
-            "Hidden Sting",
-            "Energy Shot",
-            "Energy Shots",
-            "Javelin",
-            "Roll Assault",
-            "Fist Missile",
-        ]
-
-    @staticmethod
-    def bajarl_techs() -> List[str]:
-        return [
-            "Hook",
-            "1-2-Hook",
-            "Straight",
-            "Uppercut",
-            "1-2-Uppercut",
-            "1-2-Smash",
-            "Magic Punch",
-            "Mystic Combo",
-            "Mystic Punch",
-            "Magic Pot",
-            "Mystic Pot",
-            "Miracle Pot",
-            "Bajarl Beam"
-        ]
-
-    @staticmethod
-    def baku_techs() -> List[str]:
-        return [
-            "Bite",
-            "Two Bites",
-            "Three Bites",
-            "Tongue Slap",
-            "Roar",
-            "Two Roars",
-            "MillionRoars",
-            "Diving Press",
-            "Sneeze",
-            "Mating Song",
-            "Gust Breath",
-            "Hypnotism",
-            "Nap"
-        ]
-
-    @staticmethod
-    def beaclon_techs() -> List[str]:
-        return [
-            "Heavy Punch",
-            "MaximalPunch",
-            "Horn Attack",
-            "SpinningHorn",
-            "Punch Combo",
-            "Beaclon Combo",
-            "Triple Stabs",
-            "Dive Assault",
-            "Spiral Dive",
-            "Tremor",
-            "Horn Combo",
-            "Horn Smash",
-            "Earthquake",
-            "Top Assault",
-            "Rolling Bomb",
-            "Flying Press",
-            "Horn Cannon",
-            "Frantic Horn",
-            "Fist Missile",
-        ]
-
-    @staticmethod
-    def centaur_techs() -> List[str]:
-        return [
-            "Stab Combo",
-            "Triple Stabs",
-            "Stab-Throw",
-            "Z Slash",
-            "Turn Stab",
-            "Mind Flare",
-            "Mind Blast",
-            "Cross Slash",
-            "Energy Shot",
-            "Javelin",
-            "Death Thrust",
-            "Rush Slash",
-            "Energy Shots",
-            "Jump Javelin",
-            "Meteor Drive",
-        ]
-
-    @staticmethod
-    def colorpandora_techs() -> List[str]:
-        return [
-            "Giant Whip",
-            "Two Swings",
-            "Kamikaze",
-            "Vital Ritual",
-            "Cracker",
-            "Megacracker",
-            "Triple Shots",
-            "Delta Attack",
-            "Shotgun",
-            "Megashotgun",
-            "Giant Wheel",
-            "Spiral Rush",
-            "Meteor Drive"
-        ]
-
-    @staticmethod
-    def dragon_techs() -> List[str]:
-        return [
-            "Tail Attack",
-            "Two Bites",
-            "Dragon Punch",
-            "Wing Attack",
-            "Wing Combo",
-            "Claw Combo",
-            "Claw",
-            "Spinning Claw",
-            "Flutter",
-            "Flutters",
-            "Trample",
-            "Fire Breath",
-            "Dragon Combo",
-            "Inferno",
-            "Glide Charge",
-            "SlammingDown",
-            "Flying Combo",
-        ]
-
-    @staticmethod
-    def ducken_techs() -> List[str]:
-        return [
-            "Explosion",
-            "Ducken Dance",
-            "Surprise",
-            "Bound Charge",
-            "Bound Stamp",
-            "Bound",
-            "Eye Beam",
-            "Beam Shower",
-            "Maximal Beam",
-            "Bombing",
-            "Boomerang",
-            "Missile",
-            "Two Missiles",
-            "Big Missile",
-            "Falling Beak",
-            "Frantic Beam"
-        ]
-
-    @staticmethod
-    def durahan_techs() -> List[str]:
-        return [
-            "Swing",
-            "TwisterSlash",
-            "Thunderbolt",
-            "Flash Slash",
-            "Triple Slash",
-            "Slash Combo",
-            "MillionStabs",
-            "Punch Combo",
-            "DeathBringer",
-            "Kick Combo",
-            "V Slash",
-            "Dash Slash",
-            "Charge",
-            "Air Shot",
-            "Jumping Stab",
-            "RollingSlash",
-            "Lightning",
-            "Blast Shot",
-            "Sword Throw",
-            "Gust Slash",
-        ]
-
-    @staticmethod
-    def gaboo_techs() -> List[str]:
-        return [
-            "Acid Spit",
-            "Diving Press",
-            "Chop Combo",
-            "Samurai Kick",
-            "Rolling Chop",
-            "Shock Wave",
-            "Back Blow",
-            "ElectricBlow",
-            "Ninja Kick",
-            "Straight",
-            "Cyclone",
-            "Kiss",
-            "Long Punch",
-            "Spit",
-            "Jumping Chop"
-        ]
-
-    @staticmethod
-    def gali_techs() -> List[str]:
-        return [
-            "Back Blow",
-            "Fire Wall",
-            "Blaze Wall",
-            "Napalm",
-            "Heavy Blow",
-            "Thwack",
-            "Whirlwind",
-            "Typhoon",
-            "Hurricane",
-            "Spirit Blow",
-            "Smash Whack",
-            "Red Wisp",
-            "Blue Wisp",
-            "Flying Mask",
-            "Spirit Punch",
-            "Giant Blow",
-            "Giant Thwack",
-            "Cutting Mask",
-            "Hashing Mask",
-            "Spirit Smash",
-        ]
-
-    @staticmethod
-    def ghost_techs() -> List[str]:
-        return [
-            "Uppercut",
-            "Combination",
-            "Energy Shot",
-            "Surprise",
-            "Astonishment",
-            "Necromancy",
-            "Dove Bomb",
-            "Pigeon Bomb",
-            "Magic Card",
-            "Magic Cards",
-        ]
-
-    @staticmethod
-    def golem_techs() -> List[str]:
-        return [
-            "Heavy Punch",
-            "Heavy Kick",
-            "Slap",
-            "Uppercut",
-            "Thwack",
-            "Brow Hit",
-            "Smash Thwack",
-            "Clap Attack",
-            "Palm Strike",
-            "Double Palms",
-            "Heavy Slap",
-            "Diving Press",
-            "Charge",
-            "Roll Assault",
-            "Brow Smash",
-            "Earthquake",
-            "Giant Clap",
-            "Fist Shot",
-            "Fist Missile",
-            "Cyclone"
-        ]
-
-    @staticmethod
-    def hare_techs() -> List[str]:
-        return [
-            "Straight",
-            "HardStraight",
-            "Kung Fu Fist",
-            "Kung Fu Blow",
-            "Bang",
-            "Big Bang",
-            "Back Blow",
-            "Rolling Blow"
-            "Smash",
-            "Heavy Smash",
-            "High Kick",
-            "Spin Kick",
-            "Foul Gas",
-            "Kung Fu Kick",
-            "Stinking Gas",
-        ]
-
-    @staticmethod
-    def henger_techs() -> List[str]:
-        return [
-            "Kick",
-            "Heavy Chop",
-            "Laser Cutter",
-            "Yoyo",
-            "Laser Sword",
-            "Laser Swords",
-            "Two Cutters",
-            "Two Yoyos",
-            "Arm Cannon",
-            "Napalm Shot",
-            "Hammer Fall",
-            "Burst Cannon",
-            "Sledge Fall",
-            "Sound Wave",
-            "Fist Missile",
-            "Drill Shot",
-            "Drill Shots",
-            "Eye Beam"
-        ]
-
-    def hopper_techs(self) -> List[str]:
-        techs = [
-            "Jump Blow",
-            "2 Jump Blows",
-            "3 Jump Blows",
-            "1-2 Jump Blow",
-            "Hopper Combo",
-            "Flick",
-            "Rapid Flick",
-            "Flick Combo",
-        ]
-
-        # Hopper has two mutually exclusive tech sets
-        if self.random.random() > 0.5:
-            techs.append("Phantom Claw")
-        else:
-            techs.extend(["Lightning", "Flame"])
-
-        return techs
-
-    @staticmethod
-    def jell_techs() -> List[str]:
-        return [
-            "Pierce",
-            "Suffocation",
-            "Bloodsuction",
-            "Two Whips",
-            "Jell Press",
-            "Jell Cube",
-            "Three Cubes",
-            "Jell Top",
-            "Spiked Top",
-            "Fly Swatter",
-            "Fly Smasher",
-            "Beam Gun",
-            "Beam Cannon",
-            "Cannon",
-            "Slingshot",
-            "Pyramid",
-            "Gatling Gun",
-            "Jell Copter",
-        ]
-
-    @staticmethod
-    def jill_techs() -> List[str]:
-        return [
-            "Ice Spikes",
-            "Clap Attack",
-            "Punch Combo",
-            "Slap Combo",
-            "Cold Breath",
-            "Ice Wave",
-            "Frantic Rush",
-            "Jill Combo",
-            "Ice Meteor",
-            "Snowstorm",
-        ]
-
-    @staticmethod
-    def joker_techs() -> List[str]:
-        return [
-            "Death Slash",
-            "Death Cutter",
-            "Death Energy",
-            "Death Final",
-        ]
-
-    def kato_techs(self) -> List[str]:
-        techs = [
-            "Slash Claws",
-            "Claw Combo",
-            "Smoke Breath",
-            "Oil Spray",
-            "Turn Claw",
-            "Turn Claws",
-            "Rolling Claw",
-            "Oil Fire",
-            "Oil Flame",  # Remove for explicit PSX support
-            "Drill Claw",
-            "Twister Claw",
-            "Tornado Claw",
-            "Phantom Claw",
-            "Hopping Claw",
-            "Jumping Claw",
-            "Aerial Claw",
-            "Oil Drinking"
-        ]
-
-        rand_num = self.random.random()
-        if rand_num < 0.33:
-            techs.append("Lick")
-        elif rand_num < 0.66:
-            techs.append("Licking")  # yes, these two are separate AND mutually exclusive
-        else:
-            techs.append("Bolt")
-
-        return techs
-
-    @staticmethod
-    def metalner_techs() -> List[str]:
-        return [
-            "Back Charge",
-            "Straight",
-            "High Kick",
-            "Double Kicks",
-            "Dash Straight",
-            "Elbow Strike",
-            "Double Palms",
-            "Palm Strike",
-            "Metalner Ray",
-            "Burning Palms",
-            "UFO Attack"
-        ]
-
-    @staticmethod
-    def mew_techs() -> List[str]:
-        return [
-            "Head Butt",
-            "Head Assault",
-            "Scratch",
-            "Stab",
-            "RushingPunch",
-            "Diving Press",
-            "HundredBlows",
-            "MillionBlows",
-            "Twiddling",
-            "Twiddling-2",
-            "Twiddling-Z",
-            "Miaow",
-            "Song of Mew",
-            "Recital",
-            "Zap",
-            "Maximal Zap"
-        ]
-
-    @staticmethod
-    def mocchi_techs() -> List[str]:
-        return [
-            "Thrust",
-            "1-2 Thrust",
-            "Thrusts",
-            "Licking",
-            "Press",
-            "Diving Press",
-            "Giant Press",
-            "Roll Attack",
-            "DazzlingRoll",
-            "Petal Swirl",
-            "Petal Vortex",
-            "Petal Storm",
-            "Mocchi Ray",
-            "Mocchi Beam",
-            "MocchiCannon",
-            "Flame",  # Mocchi/Dragon only
-            "Roll Assault",
-            "Petal Roll"
-        ]
-
-    @staticmethod
-    def mock_techs() -> List[str]:
-        return [
-            "Leaf Cutter",
-            "Leaf Gatling",
-            "Twig Gun",
-            "Twig Gatling",
-            "Energy Steal",
-            "Twister",
-            "Twisters",
-        ]
-
-    @staticmethod
-    def monol_techs() -> List[str]:
-        return [
-            "Needle Stabs",
-            "Spike Stabs",
-            "Ray",
-            "Double Rays",
-            "Triple Rays",
-            "Spike Bite",
-            "Scratch",
-            "Knock",
-            "Two Knocks",
-            "Three Knocks",
-            "Flattening-L",
-            "Screech",
-            "StrangeLight",
-            "Flattening-X",
-            "Sound Wave",
-            "Tentacles",
-            "Beam",
-            "Double Beams",
-            "Triple Beams",
-        ]
-
-    @staticmethod
-    def naga_techs() -> List[str]:
-        return [
-            "Stab",
-            "Pierce",
-            "Tail Assault",
-            "Life Steal",
-            "Poison Gas",
-            "Energy Shot",
-            "Turn Assault",
-            "Drill Attack",
-            "Eye Beam",
-            "Energy Shots",
-        ]
-
-    @staticmethod
-    def niton_techs() -> List[str]:
-        return [
-            "Numbing Stab",
-            "ElectricStab",
-            "Sound Wave",
-            "Sound Wave-L",
-            "Sound Wave-X",
-            "Shock",
-            "Severe Shock",
-            "MaximalShock",
-            "Niton Ink",
-            "Shell Attack",
-            "Spiked Shell",
-            "ViolentShell",
-        ]
+    @property
+    def stable_tech_sets(self) -> bool:
+        return bool(self.archipelago_options.monster_rancher_2_dx_stable_tech_sets.value)
 
-    @staticmethod
-    def phoenix_techs() -> List[str]:
-        return [
-            "Rapid Beaks",
-            "Flame Shot",
-            "Flame Cannon",
-            "Fire Twister",
-            "Fire Tornado",
-            "Heat Beam",
-            "Fire Stream",
-            "Fire Wave",
-        ]
+    @functools.cached_property
+    def stable_techs(self) -> Dict[str, Tuple[str, ...]]:
+        # Drawn from a sub-stream so picking the tech sets costs the game's RNG a single draw, however often it's used
+        tech_random: Random = Random(self.random.getrandbits(64))
+        techs: Dict[str, Tuple[str, ...]] = dict(breed_techs)
 
-    def pixie_techs(self) -> List[str]:
-        techs = [
-            "Slap",
-            "High Kick",
-            "Heel Raid",
-            "Bang",
-            "Big Bang",
-            "Bolt",
-            "Lightning",
-            "Kiss",
-            "Life Steal",
-            "Refreshment",
-            "Flame",
-            "Gigaflame",
-            "Ray",
-            "Megaray",
-            "Gigaray",
-        ]
-
-        rand_num = self.random.random()
-        if rand_num < 0.25:
-            techs.append("Phantom Claw")
-        elif rand_num < 0.5:
-            techs.append("Death Final")
-        elif rand_num < 0.75:
-            techs.append("1-2 Punch")
-        else:
-            techs.append("Fire Breath")
+        for breed, (thresholds, tech_sets) in exclusive_breed_techs.items():
+            techs[breed] += tech_sets[bisect.bisect_right(thresholds, tech_random.random())]
 
         return techs
 
-    @staticmethod
-    def plant_techs() -> List[str]:
-        return [
-            "Root Attack",
-            "Root Combo",
-            "Life Steal",
-            "Jab Combo",
-            "Plant Combo",
-            "Toxic Nectar",
-            "Toxic Pollen",
-            "Face Drill",
-            "Seed Gun",
-            "Seed Gatling"
-        ]
-
-    @staticmethod
-    def suezo_techs() -> List[str]:
-        return [
-            "Tongue Slap",
-            "Kiss",
-            "Bite",
-            "Lick",
-            "Chewing",
-            "Teleport",
-            "Telekinesis",
-            "Telepathy",
-            "Eye Beam",
-            "Yodel"
-        ]
-
-    @staticmethod
-    def tiger_techs() -> List[str]:
-        return [
-            "Bolt",
-            "One-Two",
-            "Lightning",
-            "Charge",
-            "Combination",
-            "Ice Bomb",
-            "Stab",
-            "Roll Assault",
-            "Blizzard",
-            "Roar",
-        ]
-
-    @staticmethod
-    def undine_techs() -> List[str]:
-        return [
-            "Ice Swords",
-            "Dolphin Blow",
-            "Splash",
-            "Aqua Whip",
-            "Two Whips",
-            "Kiss",
-            "Arrow",
-            "Aqua Wave",
-            "Aqua Waves",
-            "Ice Coffin",
-            "Ice Arrow",
-            "Aqua Whirl",
-            "Water Gun",
-            "Icicle Arrow",
-            "Hailstorm",
-            "Cold Storm",
-            "Vitalization",
-            "Cold Geyser",
-            "Water Cannon",
-        ]
-
-    @staticmethod
-    def worm_techs() -> List[str]:
-        return [
-            "Somersault",
-            "Somersaults",
-            "Tail Lash",
-            "Two Lashes",
-            "Three Lashes",
-            "Roll Assault",
-            "Pierce-Throw",
-            "Pinch-Throw",
-            "Pierce",
-            "Tusk Slash",
-            "Injection",
-            "Poison Gas",
-            "Wheel Attack",
-        ]
+    def techs(self, breed: str) -> Tuple[str, ...]:
+        if self.stable_tech_sets:
+            return self.stable_techs[breed]
 
-    def wracky_techs(self) -> List[str]:
-        techs = [
-            "Weapon Combo",
-            "Kick",
-            "Spin Kick",
-            "Twister Kick",
-            "Punch",
-            "Heavy Punch",
-            "Wracky Combo",
-            "Necromancy",
-            "Sneak Attack",
-            "Sneak Combo",
-            "Spin Slash",
-            "Trick",
-            "Head Spike",
-            "Fire Spike",
-            "Air Shot",
-            "Blast Shot",
-            "TwisterSlash",
-            "Beat Dance",
-            "Cursed Dance",
-            "Flame"
-        ]
+        techs: Tuple[str, ...] = breed_techs[breed]
 
-        if self.random.random() > 0.5:
-            techs.append("Explosion")
-        else:
-            techs.append("Fire-Juggler")
+        if breed in exclusive_breed_techs:
+            thresholds, tech_sets = exclusive_breed_techs[breed]
+            techs += tech_sets[bisect.bisect_right(thresholds, self.random.random())]
 
         return techs
 
-    @staticmethod
-    def zilla_techs() -> List[str]:
-        return [
-            "Head Butt",
-            "Knocking-Up",
-            "Tail Lashes",
-            "Sneeze",
-            "Body Press",
-            "Wave Riding",
-            "Earthquake",
-            "Bubbles",
-            "Charge",
-            "Zilla Rush",
-            "Roll Assault",
-            "Tidal Wave",
-        ]
-
-    @staticmethod
-    def zuum_techs() -> List[str]:
-        return [
-            "MillionClaws",
-            "Bite",
-            "Bite-Throw",
-            "Claw Combo",
-            "MillionBites",
-            "Tail Lash",
-            "Tail Lashes",
-            "Dust Cloud",
-            "Hypnotism",
-            "Tail Combo",
-            "Jumping Claw",
-            "Diving Claw",
-            "Aerial Claw",
-            "Fire Ball",
-            "Fire Breath",
-            "Jumping Fire",
-            "Charge",
-            "Fire Charge",
-            "Roll Assault",
-            "Five Balls",
-            "Fire Bomb",
-            "Burning Roll",
-        ]
-
 
 class MonsterRancher2DXUnlockedMainBreeds(OptionSet):
     """
@@ -1985,3 +1559,12 @@ class MonsterRancher2DXUnlockedSubBreeds(OptionSet):
     }
 
     default = sorted(valid_keys)
+
+
+class MonsterRancher2DXStableTechSets(Toggle):
+    """
+    Whether Hopper, Pixie and Wracky objectives should use one of their mutually exclusive tech sets for the whole
+    generation, rather than picking a tech set again every time an objective is rolled
+    """
+
+    display_name = "Monster Rancher 2 DX Stable Tech Sets"
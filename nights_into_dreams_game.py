@@ -9,6 +9,8 @@ from ..game_objective_template import GameObjectiveTemplate
 
 from ..enums import KeymastersKeepGamePlatforms
 
+from .objective_catalog import objective_catalog
+
 from Options import Toggle
 
 
@@ -36,6 +38,7 @@ class NightsIntoDreamsGame(Game):
             GameObjectiveTemplate(label="No Acrobatics!", data={})
         ]
 
+    @objective_catalog
     def game_objective_templates(self) -> List[GameObjectiveTemplate]:
         return [
             GameObjectiveTemplate(
@@ -0,0 +1,311 @@
+from __future__ import annotations
+
+import bisect
+import dataclasses
+import functools
+import itertools
+import json
+
+from collections import OrderedDict
+from random import Random
+from types import FunctionType, MappingProxyType
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Type, Union
+
+from ..game import Game
+from ..game_objective_template import GameObjectiveTemplate
+
+
+# Keymaster's Keep options read by games next to their own options, with their defaults
+keep_options: Dict[str, int] = {
+    "include_adult_only_or_unrated_games": 0,
+    "include_modern_console_games": 1,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def option_names(options_cls: Optional[Type[Any]]) -> Tuple[str, ...]:
+    if options_cls is None:
+        return tuple(keep_options)
+
+    return tuple(keep_options) + tuple(field.name for field in dataclasses.fields(options_cls))
+
+
+def option_fingerprint(value: Any) -> Hashable:
+    # Most options are toggles and choices, only sets, lists and dicts need converting
+    if isinstance(value, (set, frozenset)):
+        return frozenset(value)
+
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, sort_keys=True, default=sorted)
+
+    return value
+
+
+def options_fingerprint(game: Game) -> Tuple[Hashable, ...]:
+    """
+    Every option a game's templates can depend on, in a form that can be compared and hashed. Games without options
+    share a single fingerprint.
+    """
+
+    options: Any = game.archipelago_options
+
+    if options is None:
+        return tuple()
+
+    return tuple(
+        option_fingerprint(getattr(getattr(options, name, None), "value", None))
+        for name in option_names(game.options_cls)
+    )
+
+
+class ObjectiveCatalog:
+    """
+    The objective templates of a game and option set, built once and frozen. Template data can't be modified,
+    callers rewriting templates, like custom medleys, make their own copies with `thaw`.
+    """
+
+    templates: Tuple[GameObjectiveTemplate, ...]
+
+    # (include difficult, include time consuming) -> sampler
+    samplers: Dict[Tuple[bool, bool], TemplateSampler]
+
+    def __init__(self, templates: List[GameObjectiveTemplate]) -> None:
+        for template in templates:
+            if not isinstance(template.data, MappingProxyType):
+                template.data = MappingProxyType(template.data)
+
+        self.templates = tuple(templates)
+        self.samplers = dict()
+
+    def sampler(self, include_difficult: bool, include_time_consuming: bool) -> TemplateSampler:
+        key: Tuple[bool, bool] = (include_difficult, include_time_consuming)
+
+        if key not in self.samplers:
+            self.samplers[key] = TemplateSampler(tuple(
+                template for template in self.templates
+                if (include_difficult or not template.is_difficult)
+                and (include_time_consuming or not template.is_time_consuming)
+            ))
+
+        return self.samplers[key]
+
+
+class TemplateSampler:
+    """
+    Weighted choice among the templates a game can draw, filtered once. Each draw bisects a cumulative weight
+    table instead of summing the weights again.
+    """
+
+    templates: Tuple[GameObjectiveTemplate, ...]
+    cumulative_weights: Tuple[int, ...]
+
+    def __init__(self, templates: Tuple[GameObjectiveTemplate, ...]) -> None:
+        self.templates = templates
+        self.cumulative_weights = tuple(itertools.accumulate(template.weight for template in templates))
+
+    def sample(self, random: Random) -> GameObjectiveTemplate:
+        if not self.templates:
+            raise IndexError("No objective templates to sample from")
+
+        total: int = self.cumulative_weights[-1]
+
+        return self.templates[
+            bisect.bisect_right(self.cumulative_weights, random.random() * total, 0, len(self.templates) - 1)
+        ]
+
+
+# How many option sets of every game keep a shared catalog, the least recently used ones are dropped first
+CATALOG_CACHE_SIZE: int = 64
+
+
+def data_name(data_callable: Callable[[], Any], game_cls: Optional[Type[Game]] = None) -> str:
+    """
+    A readable name for a data callable, methods named after the class of their instance rather than the class
+    defining them. Static methods of a base class of `game_cls` are named after `game_cls`.
+    """
+
+    if isinstance(data_callable, functools.partial):
+        arguments: str = ", ".join(str(arg) for arg in data_callable.args)
+
+        return f"{data_name(data_callable.func, game_cls)}({arguments})"
+
+    owner: Any = getattr(data_callable, "__self__", None)
+
+    if owner is not None and hasattr(data_callable, "__func__"):
+        owner_cls: Type[Any] = owner if isinstance(owner, type) else type(owner)
+
+        return f"{owner_cls.__name__}.{data_callable.__func__.__name__}"
+
+    name: str = getattr(data_callable, "__qualname__", repr(data_callable))
+
+    if game_cls is not None and isinstance(data_callable, FunctionType):
+        owner_name, _, attribute = name.rpartition(".")
+
+        if any(base.__qualname__ == owner_name for base in game_cls.__mro__):
+            return f"{game_cls.__name__}.{attribute}"
+
+    return name
+
+
+class SharedPool:
+    """
+    The values a data callable returned for one option set, standing in for it in shared templates. Holds no reference
+    to the instance that built it, so any instance with the same options can draw from it.
+    """
+
+    name: str
+    values: Tuple[Any, ...]
+
+    def __init__(self, name: str, values: Tuple[Any, ...]) -> None:
+        self.name = name
+        self.values = values
+
+    def __call__(self) -> Tuple[Any, ...]:
+        return self.values
+
+
+def share_templates(game: Game, templates: List[GameObjectiveTemplate]) -> Optional[List[GameObjectiveTemplate]]:
+    """
+    The templates with each data callable called once and replaced by a pool of its values. None when a data callable
+    is volatile, its values can't be shared.
+    """
+
+    pools: Dict[Callable[[], Any], SharedPool] = dict()
+    shared: List[GameObjectiveTemplate] = list()
+
+    for template in templates:
+        data: Dict[str, Tuple[SharedPool, Union[int, range]]] = dict()
+
+        for key, (collection_callable, quantity) in template.data.items():
+            if getattr(collection_callable, "volatile", False):
+                return None
+
+            if collection_callable not in pools:
+                pools[collection_callable] = SharedPool(
+                    data_name(collection_callable, type(game)), tuple(collection_callable())
+                )
+
+            data[key] = (pools[collection_callable], quantity)
+
+        shared.append(GameObjectiveTemplate(
+            label=template.label,
+            data=data,
+            is_time_consuming=template.is_time_consuming,
+            is_difficult=template.is_difficult,
+            weight=template.weight,
+        ))
+
+    return shared
+
+
+# (game class, template method, options fingerprint) -> catalog shared by every instance, None when the templates
+# have volatile data
+shared_catalogs: OrderedDict[Tuple[Type[Game], str, Tuple[Hashable, ...]], Optional[ObjectiveCatalog]] = OrderedDict()
+
+
+def objective_catalog(
+    build: Callable[[Game], List[GameObjectiveTemplate]] = None,
+    *,
+    shared: bool = True,
+) -> Callable[[Game], List[GameObjectiveTemplate]]:
+    """
+    Decorates a game's `game_objective_templates` so its templates are built once per game class and options, every
+    later call returning the same frozen templates in a new list. Each data callable is called once when the templates
+    are built, and the shared templates draw from its values, so they hold no instance and any instance with the same
+    options can use them. Games whose data callables use the instance's own random, like Monster Rancher 2 DX techs,
+    pass `shared=False` to only keep a catalog per instance.
+    """
+
+    if build is None:
+        return functools.partial(objective_catalog, shared=shared)
+
+    @functools.wraps(build)
+    def game_objective_templates(self: Game) -> List[GameObjectiveTemplate]:
+        return list(catalog_for(self, build, shared).templates)
+
+    game_objective_templates.build = build
+    game_objective_templates.shared = shared
+
+    return game_objective_templates
+
+
+def catalog_for(
+    game: Game,
+    build: Callable[[Game], List[GameObjectiveTemplate]],
+    shared: bool = True,
+) -> ObjectiveCatalog:
+    # Options don't change during generation, each instance looks its catalog up once
+    instance_catalogs: Dict[str, ObjectiveCatalog] = vars(game).setdefault("objective_catalogs", dict())
+
+    try:
+        return instance_catalogs[build.__qualname__]
+    except KeyError:
+        pass
+
+    if shared:
+        key: Tuple[Type[Game], str, Tuple[Hashable, ...]] = (type(game), build.__qualname__, options_fingerprint(game))
+
+        try:
+            catalog: Optional[ObjectiveCatalog] = shared_catalogs[key]
+        except KeyError:
+            templates: List[GameObjectiveTemplate] = build(game)
+            shared_templates: Optional[List[GameObjectiveTemplate]] = share_templates(game, templates)
+
+            catalog = shared_catalogs[key] = None if shared_templates is None else ObjectiveCatalog(shared_templates)
+
+            if len(shared_catalogs) > CATALOG_CACHE_SIZE:
+                shared_catalogs.popitem(last=False)
+
+            if catalog is None:
+                catalog = ObjectiveCatalog(templates)
+        else:
+            shared_catalogs.move_to_end(key)
+
+            if catalog is None:
+                catalog = ObjectiveCatalog(build(game))
+
+        instance_catalogs[build.__qualname__] = catalog
+    else:
+        instance_catalogs[build.__qualname__] = ObjectiveCatalog(build(game))
+
+    return instance_catalogs[build.__qualname__]
+
+
+def thaw(template: GameObjectiveTemplate, **changes: Any) -> GameObjectiveTemplate:
+    """
+    A copy of a catalog template with the given attributes replaced. Its data is only copied when it isn't replaced,
+    so callers passing a dict of their own, or the template's unchanged data to share it, don't pay for a copy.
+    """
+
+    attributes: Dict[str, Any] = {
+        "label": template.label,
+        "data": template.data,
+        "is_time_consuming": template.is_time_consuming,
+        "is_difficult": template.is_difficult,
+        "weight": template.weight,
+    }
+
+    if "data" not in changes:
+        attributes["data"] = dict(template.data)
+
+    attributes.update(changes)
+
+    return GameObjectiveTemplate(**attributes)
+
+
+def game_catalog(game: Game) -> ObjectiveCatalog:
+    """
+    The catalog behind a game's objective templates. Games without one, like custom medleys whose templates follow the
+    current medley, get a catalog of their current templates that isn't kept.
+    """
+
+    method: Callable[[Game], List[GameObjectiveTemplate]] = type(game).game_objective_templates
+
+    if hasattr(method, "build"):
+        return catalog_for(game, method.build, method.shared)
+
+    return ObjectiveCatalog(game.game_objective_templates())
+
+
+def sampler_for(game: Game) -> TemplateSampler:
+    return game_catalog(game).sampler(game.include_difficult_objectives, game.include_time_consuming_objectives)
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import functools
+
+from collections import deque
+from random import Random
+from typing import Any, Callable, Deque, Dict, Iterator, List, Set, Tuple
+
+from ..game import Game
+from ..game_objective_template import GameObjectiveTemplate
+
+from .objective_catalog import TemplateSampler, sampler_for
+
+
+# Data callable -> the pool it returned, kept for as long as its results can't change
+Pools = Dict[Callable[[], Any], Tuple[Any, ...]]
+
+# How many recent objectives a stream keeps out of its output, and how many rolls it tries for a new one
+STREAM_WINDOW: int = 100
+STREAM_ATTEMPTS: int = 50
+
+
+class VolatilePartial(functools.partial):
+    """
+    A functools.partial marked volatile, for data callables built in bulk
+    """
+
+    volatile = True
+
+
+def volatile(data_callable: Callable[[], Any]) -> VolatilePartial:
+    """
+    Marks a data callable whose results change from call to call, like one drawing from the game's random, so its
+    results are never reused between objectives. The callable is wrapped rather than changed, so bound methods like
+    `volatile(self.techs)` can be marked when building templates.
+    """
+
+    return VolatilePartial(data_callable)
+
+
+def pool_for(collection_callable: Callable[[], Any], pools: Pools) -> Tuple[Any, ...]:
+    try:
+        return pools[collection_callable]
+    except KeyError:
+        collection: Tuple[Any, ...] = tuple(collection_callable())
+
+        if not getattr(collection_callable, "volatile", False):
+            pools[collection_callable] = collection
+
+        return collection
+
+
+def render_objective(template: GameObjectiveTemplate, random: Random, pools: Pools) -> str:
+    """
+    Fills in a template like GameObjectiveTemplate.generate_game_objective, drawing the same values from the same
+    random, but only calls data callables missing from `pools`. Volatile data callables are called every time.
+    """
+
+    label: str = template.label
+
+    for key, (collection_callable, quantity) in template.data.items():
+        collection: Tuple[Any, ...] = pool_for(collection_callable, pools)
+
+        if isinstance(quantity, range):
+            quantity = random.choice(quantity)
+
+        quantity = min(quantity, len(collection))
+        values: List[Any] = random.sample(collection, quantity)
+
+        label = label.replace(key, ", ".join(str(value) for value in values))
+
+    return label
+
+
+class GenerationSession:
+    """
+    Objective generation for the games of one keep. Options don't change during a session, so every data callable
+    is called once and its pool handed out again for every later objective, of any batch and any game instance
+    sharing the callable.
+    """
+
+    pools: Pools
+
+    def __init__(self) -> None:
+        self.pools = dict()
+
+    def generate_objectives(self, game: Game, count: int = 1) -> Tuple[List[str], List[str]]:
+        """
+        The batch form of Game.generate_objectives, with the same results for the same random. Templates are sampled
+        from the game's catalog, and data callables are only called the first time the session needs them.
+        """
+
+        optional_constraints: List[str] = list()
+        constraint_templates: List[GameObjectiveTemplate] = game.optional_game_constraint_templates()
+
+        if constraint_templates:
+            constraint_template: GameObjectiveTemplate = game.random.choice(constraint_templates)
+            optional_constraints.append(constraint_template.generate_game_objective(game.random))
+
+        sampler: TemplateSampler = sampler_for(game)
+
+        objectives: List[str] = [
+            render_objective(sampler.sample(game.random), game.random, self.pools) for _ in range(count)
+        ]
+
+        return optional_constraints, objectives
+
+    def stream_objectives(
+        self,
+        game: Game,
+        window: int = STREAM_WINDOW,
+        attempts: int = STREAM_ATTEMPTS,
+    ) -> Iterator[str]:
+        """
+        Objectives of a game for as long as they are pulled, weight-sampled from its catalog and rendered one at a
+        time. An objective isn't repeated within `window` objectives of itself, so only the window is ever kept.
+        The stream ends when `attempts` rolls in a row only give repeats, the game running out of objectives.
+        """
+
+        sampler: TemplateSampler = sampler_for(game)
+
+        recent: Deque[str] = deque()
+        seen: Set[str] = set()
+
+        if not sampler.templates:
+            return
+
+        while True:
+            for _ in range(attempts):
+                objective: str = render_objective(sampler.sample(game.random), game.random, self.pools)
+
+                if objective not in seen:
+                    break
+            else:
+                return
+
+            yield objective
+
+            recent.append(objective)
+            seen.add(objective)
+
+            if len(recent) > window:
+                seen.discard(recent.popleft())
+
+
+def generate_objectives(game: Game, count: int = 1) -> Tuple[List[str], List[str]]:
+    # A batch on its own, data callables are called once per batch
+    return GenerationSession().generate_objectives(game, count)
+
+
+def stream_objectives(game: Game, window: int = STREAM_WINDOW, attempts: int = STREAM_ATTEMPTS) -> Iterator[str]:
+    return GenerationSession().stream_objectives(game, window, attempts)
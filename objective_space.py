@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import math
+
+from dataclasses import dataclass
+from typing import Any, List, Set, Tuple, Union
+
+from ..game import Game
+from ..game_objective_template import GameObjectiveTemplate
+
+from .objective_catalog import sampler_for
+from .objective_generation import Pools, pool_for
+
+
+@dataclass(frozen=True)
+class TemplateSpace:
+    template: GameObjectiveTemplate
+    combinations: int  # distinct objectives, values in any order counting once
+    renderings: int  # distinct labels, every order of the values counting
+
+
+def placeholder_space(pool_size: int, distinct_values: int, quantity: Union[int, range]) -> Tuple[int, int]:
+    """
+    Combinations and orderings of the values one placeholder can take. Quantities are capped by the pool size like
+    when objectives are generated, quantities capped to the same count only count once.
+    """
+
+    quantities: Set[int] = {
+        min(count, pool_size, distinct_values) for count in (quantity if isinstance(quantity, range) else (quantity,))
+    }
+
+    combinations: int = sum(math.comb(distinct_values, count) for count in quantities)
+    renderings: int = sum(math.comb(distinct_values, count) * math.factorial(count) for count in quantities)
+
+    return combinations, renderings
+
+
+def template_space(template: GameObjectiveTemplate, pools: Pools) -> TemplateSpace:
+    """
+    How many objectives a template can yield, from the sizes of its pools and its quantities rather than by rolling
+    it. Pools with repeated values count each value once, and volatile data is counted from a single call, so for
+    those templates the count is a lower bound.
+    """
+
+    combinations: int = 1
+    renderings: int = 1
+
+    for collection_callable, quantity in template.data.values():
+        pool: Tuple[Any, ...] = pool_for(collection_callable, pools)
+        placeholder_combinations, placeholder_renderings = placeholder_space(len(pool), len(set(pool)), quantity)
+
+        combinations *= placeholder_combinations
+        renderings *= placeholder_renderings
+
+    return TemplateSpace(template, combinations, renderings)
+
+
+def objective_space(game: Game, pools: Pools = None) -> List[TemplateSpace]:
+    """
+    The objective space of every template a game can draw, with its difficult and time consuming settings
+    """
+
+    if pools is None:
+        pools = dict()
+
+    return [template_space(template, pools) for template in sampler_for(game).templates]
+
+
+def unique_objective_count(game: Game) -> int:
+    """
+    How many distinct objectives a game can yield before repeating itself, values in any order counting once
+    """
+
+    return sum(space.combinations for space in objective_space(game))
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from typing import List
+import functools
+
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Tuple
 from math import ceil
 
 from dataclasses import dataclass
@@ -10,6 +13,8 @@ from ..game_objective_template import GameObjectiveTemplate
 
 from ..enums import KeymastersKeepGamePlatforms
 
+from .objective_catalog import objective_catalog
+
 from Options import Choice, OptionSet
 
 
@@ -66,7 +71,16 @@ nightcord_at_2500 = [
     "Mizuki Akiyama"
 ]
 
-pairs = [
+group_members = {
+    "VIRTUAL SINGERs": virtual_singers,
+    "Leo/need": leo_need,
+    "MORE MORE JUMP!": more_more_jump,
+    "Vivid BAD Squad": vivid_bad_squad,
+    "Wonderlands X Showtime": wonderlands_x_showtime,
+    "Nightcord at 25:00": nightcord_at_2500,
+}
+
+fixed_pairs = (
     # intra-group pairs
     "Shiho Hinomori and Shizuku Hinomori",
     "Saki Tenma and Tsukasa Tenma",
@@ -83,15 +97,47 @@ pairs = [
     "Kohane Azusawa and Kanade Yoisaki",
     "Tsukasa Tenma and Kanade Yoisaki",
     # one singular song, not including April Fools for now
-    "Robo-Nene and Mikudayo"
-]
-for group in [leo_need, more_more_jump, vivid_bad_squad, wonderlands_x_showtime, nightcord_at_2500, virtual_singers]:
-    for member in group:
-        for secondary in sorted({*group, *virtual_singers}):
-            if member == secondary:
-                pairs.append(member)
-            else:
-                pairs.append(f"{member} and {secondary}")
+    "Robo-Nene and Mikudayo",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def pairs() -> Tuple[str, ...]:
+    # Built on first use rather than at import, most processes importing the games never roll a pair
+    pair_list = list(fixed_pairs)
+
+    for group in [leo_need, more_more_jump, vivid_bad_squad, wonderlands_x_showtime, nightcord_at_2500, virtual_singers]:
+        for member in group:
+            for secondary in sorted({*group, *virtual_singers}):
+                if member == secondary:
+                    pair_list.append(member)
+                else:
+                    pair_list.append(f"{member} and {secondary}")
+
+    return tuple(pair_list)
+
+
+@functools.lru_cache(maxsize=None)
+def pairs_by_group() -> Mapping[str, Tuple[str, ...]]:
+    # group -> every pair featuring one of its members, in pair table order. Fixed pairs of characters outside
+    # the groups (Robo-Nene and Mikudayo) are in no group.
+    member_groups = {member: group for group, members in group_members.items() for member in members}
+    index: Dict[str, List[str]] = {group: list() for group in group_members}
+
+    for pair in pairs():
+        pair_groups = dict.fromkeys(member_groups[member] for member in pair.split(" and ") if member in member_groups)
+
+        for group in pair_groups:
+            index[group].append(pair)
+
+    return MappingProxyType({group: tuple(group_pairs) for group, group_pairs in index.items()})
+
+
+@functools.lru_cache(maxsize=8)
+def song_index(songs: FrozenSet[str]) -> Tuple[str, ...]:
+    # Sorted once per song catalog, worlds pasting the same catalog share it. Only the last few catalogs are kept,
+    # instances keep their own in song_pool.
+    return tuple(sorted(songs))
 
 
 class ProjectSekaiColorfulStageGame(Game):
@@ -107,6 +153,7 @@ class ProjectSekaiColorfulStageGame(Game):
     def optional_game_constraint_templates(self) -> List[GameObjectiveTemplate]:
         return list()
 
+    @objective_catalog
     def game_objective_templates(self) -> List[GameObjectiveTemplate]:
         objectives = [
             GameObjectiveTemplate(
@@ -204,16 +251,18 @@ class ProjectSekaiColorfulStageGame(Game):
             ))
 
         if self.archipelago_options.project_sekai_colorful_stage_additional_songs:
+            song_count = len(self.songs())
+
             objectives.extend([
                 GameObjectiveTemplate(
                     label="Play SONG on DIFF difficulty (or higher)",
                     data={"SONG": (self.songs, 1), "DIFF": (self.difficulties, 1)},
-                    weight=min(10, max(1, ceil(len(self.songs()) / 4)))
+                    weight=min(10, max(1, ceil(song_count / 4)))
                 ),
                 GameObjectiveTemplate(
                     label="Play SONG on DIFF difficulty (or higher) with 7 or less GOOD/BAD/MISS",
                     data={"SONG": (self.songs, 1), "DIFF": (self.difficulties, 1)},
-                    weight=min(10, max(1, ceil(len(self.songs()) / 4) - 2))
+                    weight=min(10, max(1, ceil(song_count / 4) - 2))
                 ),
             ])
 
@@ -221,7 +270,7 @@ class ProjectSekaiColorfulStageGame(Game):
 
     @staticmethod
     def characters():
-        return pairs
+        return pairs()
 
     def difficulties(self):
         difficulties = [
@@ -234,19 +283,16 @@ class ProjectSekaiColorfulStageGame(Game):
         return difficulties[self.archipelago_options.project_sekai_colorful_stage_minimum_difficulty.value:
                             self.archipelago_options.project_sekai_colorful_stage_maximum_difficulty.value + 1]
 
+    @functools.cached_property
+    def song_pool(self) -> Tuple[str, ...]:
+        return song_index(frozenset(self.archipelago_options.project_sekai_colorful_stage_additional_songs.value))
+
     def songs(self):
-        return sorted(self.archipelago_options.project_sekai_colorful_stage_additional_songs.value)
+        return self.song_pool
 
     @staticmethod
     def groups():
-        return [
-            "VIRTUAL SINGERs",
-            "Leo/need",
-            "MORE MORE JUMP!",
-            "Vivid BAD Squad",
-            "Wonderlands X Showtime",
-            "Nightcord at 25:00"
-        ]
+        return list(group_members)
 
 
 class ProjectSekaiColorfulStageAdditionalSongs(OptionSet):
@@ -13,6 +13,8 @@ from ..game_objective_template import GameObjectiveTemplate
 
 from ..enums import KeymastersKeepGamePlatforms
 
+from .objective_catalog import objective_catalog
+
 
 @dataclass
 class RabbitAndSteelArchipelagoOptions:
@@ -31,6 +33,7 @@ class RabbitAndSteelGame(Game):
     def optional_game_constraint_templates(self) -> List[GameObjectiveTemplate]:
         return list()
 
+    @objective_catalog
     def game_objective_templates(self) -> List[GameObjectiveTemplate]:
         return [
             GameObjectiveTemplate(
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from typing import List
+import functools
+import operator
+
+from typing import Dict, FrozenSet, List, Tuple
 
 from dataclasses import dataclass
 
@@ -9,6 +12,8 @@ from ..game_objective_template import GameObjectiveTemplate
 
 from ..enums import KeymastersKeepGamePlatforms
 
+from .objective_catalog import objective_catalog
+
 from Options import OptionSet
 
 
@@ -36,28 +41,77 @@ GEN_8_SECONDARY = "Legends Arceus"
 GEN_9_PRIMARY = "Scarlet/Violet"
 GEN_9_DLC = "Scarlet/Violet - The Treasure of Area Zero"
 
-masuda_games = [
-    GEN_4_PRIMARY,
-    GEN_4_REMAKE,
-    GEN_5_PRIMARY,
-    GEN_6_PRIMARY,
-    GEN_6_REMAKE,
-    GEN_7_PRIMARY,
-    GEN_7_SECONDARY,
-    GEN_8_PRIMARY,
-    GEN_8_DLC,
-    GEN_8_REMAKE,
-    GEN_9_PRIMARY,
-    GEN_9_DLC,
-]
-
-poke_radar = [GEN_4_PRIMARY, GEN_6_PRIMARY]
-
-chain_fishing = [GEN_6_PRIMARY, GEN_6_REMAKE]
-
-sos_chaining = [GEN_7_PRIMARY, GEN_7_SECONDARY]
-
-outbreaks = [GEN_8_SECONDARY, GEN_9_PRIMARY, GEN_9_DLC]
+# Hunting methods, as bits of a method mask
+METHOD_MASUDA = 1 << 0
+METHOD_POKE_RADAR = 1 << 1
+METHOD_CHAIN_FISHING = 1 << 2
+METHOD_FRIEND_SAFARI = 1 << 3
+METHOD_DEXNAV = 1 << 4
+METHOD_SOS_CHAINING = 1 << 5
+METHOD_ULTRA_WORMHOLE = 1 << 6
+METHOD_CATCH_COMBO = 1 << 7
+METHOD_DYNAMAX_ADVENTURE = 1 << 8
+METHOD_OUTBREAK = 1 << 9
+
+# game -> hunting methods it offers
+game_methods: Dict[str, int] = {
+    GEN_4_PRIMARY: METHOD_MASUDA | METHOD_POKE_RADAR,
+    GEN_4_REMAKE: METHOD_MASUDA,
+    GEN_5_PRIMARY: METHOD_MASUDA,
+    GEN_6_PRIMARY: METHOD_MASUDA | METHOD_POKE_RADAR | METHOD_CHAIN_FISHING | METHOD_FRIEND_SAFARI,
+    GEN_6_REMAKE: METHOD_MASUDA | METHOD_CHAIN_FISHING | METHOD_DEXNAV,
+    GEN_7_PRIMARY: METHOD_MASUDA | METHOD_SOS_CHAINING,
+    GEN_7_SECONDARY: METHOD_MASUDA | METHOD_SOS_CHAINING | METHOD_ULTRA_WORMHOLE,
+    GEN_8_PRIMARY: METHOD_MASUDA,
+    GEN_8_DLC: METHOD_MASUDA,
+    GEN_8_REMAKE: METHOD_MASUDA,
+    GEN_9_PRIMARY: METHOD_MASUDA,
+    GEN_9_DLC: METHOD_MASUDA,
+}
+
+# game -> hunting methods it only offers when modern console games are included
+modern_console_game_methods: Dict[str, int] = {
+    GEN_7_REMAKE: METHOD_CATCH_COMBO,
+    GEN_8_DLC: METHOD_DYNAMAX_ADVENTURE,
+    GEN_8_REMAKE: METHOD_POKE_RADAR,
+    GEN_8_SECONDARY: METHOD_OUTBREAK,
+    GEN_9_PRIMARY: METHOD_OUTBREAK,
+    GEN_9_DLC: METHOD_OUTBREAK,
+}
+
+# hunting method -> objective labels it adds, in the order they are listed
+method_labels: Dict[int, Tuple[str, ...]] = {
+    METHOD_MASUDA: ("Hatch a Shiny Pokémon from an Egg",),
+    METHOD_POKE_RADAR: ("Encounter and capture a Shiny Pokémon using the Poké Radar",),
+    METHOD_CHAIN_FISHING: (
+        "Encounter and capture a Shiny Pokémon by chain fishing",
+        "Encounter and capture a Shiny Pokémon during a horde encounter",
+    ),
+    METHOD_FRIEND_SAFARI: ("Encounter and capture a Shiny Pokémon in the Friend Safari",),
+    METHOD_DEXNAV: ("Encounter and capture a Shiny Pokémon by using DexNav",),
+    METHOD_SOS_CHAINING: ("Encounter and capture a Shiny Pokémon by chaining SOS calls",),
+    METHOD_ULTRA_WORMHOLE: ("Encounter and capture a Shiny Pokémon within an Ultra Wormhole",),
+    METHOD_CATCH_COMBO: ("Encounter and capture a Shiny Pokémon by maintaining a catch combo",),
+    METHOD_DYNAMAX_ADVENTURE: ("Encounter and capture a Shiny Pokémon within a Dynamax Adventure",),
+    METHOD_OUTBREAK: ("Encounter and capture a Shiny Pokémon within a mass outbreak",),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def available_method_labels(owned_games: FrozenSet[str], include_modern_console_games: bool) -> Tuple[str, ...]:
+    """
+    Objective labels for every hunting method offered by the owned games. Shared by all game instances in the
+    process, since most players own the same games.
+    """
+
+    masks = [game_methods.get(game, 0) for game in owned_games]
+
+    if include_modern_console_games:
+        masks.extend(modern_console_game_methods.get(game, 0) for game in owned_games)
+
+    methods: int = functools.reduce(operator.or_, masks, 0)
+
+    return tuple(label for method, labels in method_labels.items() if method & methods for label in labels)
 
 
 class ShinyPokemonHuntGame(Game):
@@ -80,9 +134,8 @@ class ShinyPokemonHuntGame(Game):
             ),
         ]
 
+    @objective_catalog
     def game_objective_templates(self) -> List[GameObjectiveTemplate]:
-        games: List[str] = self.games()
-
         objectives = [
             GameObjectiveTemplate(
                 label="Encounter and capture a Shiny Pokémon",
@@ -100,54 +153,12 @@ class ShinyPokemonHuntGame(Game):
             ),
         ]
 
-        if any(game in masuda_games for game in games):
-            objectives.append(
-                GameObjectiveTemplate(
-                    label="Hatch a Shiny Pokémon from an Egg",
-                    data=dict(),
-                    is_time_consuming=True,
-                    is_difficult=False,
-                    weight=1,
-                )
-            )
-
-        if any(game in poke_radar for game in games) or (
-            bool(self.archipelago_options.include_modern_console_games.value) and GEN_8_REMAKE in games
-        ):
-            objectives.append(
-                GameObjectiveTemplate(
-                    label="Encounter and capture a Shiny Pokémon using the Poké Radar",
-                    data=dict(),
-                    is_time_consuming=True,
-                    is_difficult=False,
-                    weight=1,
-                )
-            )
-
-        if any(game in chain_fishing for game in games):
-            objectives.extend(
-                [
-                    GameObjectiveTemplate(
-                        label="Encounter and capture a Shiny Pokémon by chain fishing",
-                        data=dict(),
-                        is_time_consuming=True,
-                        is_difficult=False,
-                        weight=1,
-                    ),
-                    GameObjectiveTemplate(
-                        label="Encounter and capture a Shiny Pokémon during a horde encounter",
-                        data=dict(),
-                        is_time_consuming=True,
-                        is_difficult=False,
-                        weight=1,
-                    ),
-                ]
-            )
+        include_modern_console_games = bool(self.archipelago_options.include_modern_console_games.value)
 
-        if GEN_6_PRIMARY in games:
+        for label in available_method_labels(self.owned_games, include_modern_console_games):
             objectives.append(
                 GameObjectiveTemplate(
-                    label="Encounter and capture a Shiny Pokémon in the Friend Safari",
+                    label=label,
                     data=dict(),
                     is_time_consuming=True,
                     is_difficult=False,
@@ -155,77 +166,18 @@ class ShinyPokemonHuntGame(Game):
                 )
             )
 
-        if GEN_6_REMAKE in games:
-            objectives.append(
-                GameObjectiveTemplate(
-                    label="Encounter and capture a Shiny Pokémon by using DexNav",
-                    data=dict(),
-                    is_time_consuming=True,
-                    is_difficult=False,
-                    weight=1,
-                )
-            )
-
-        if any(game in sos_chaining for game in games):
-            objectives.append(
-                GameObjectiveTemplate(
-                    label="Encounter and capture a Shiny Pokémon by chaining SOS calls",
-                    data=dict(),
-                    is_time_consuming=True,
-                    is_difficult=False,
-                    weight=1,
-                )
-            )
-
-        if GEN_7_SECONDARY in games:
-            objectives.append(
-                GameObjectiveTemplate(
-                    label="Encounter and capture a Shiny Pokémon within an Ultra Wormhole",
-                    data=dict(),
-                    is_time_consuming=True,
-                    is_difficult=False,
-                    weight=1,
-                )
-            )
-
-        if bool(self.archipelago_options.include_modern_console_games.value):
-            if GEN_7_REMAKE in games:
-                objectives.append(
-                    GameObjectiveTemplate(
-                        label="Encounter and capture a Shiny Pokémon by maintaining a catch combo",
-                        data=dict(),
-                        is_time_consuming=True,
-                        is_difficult=False,
-                        weight=1,
-                    )
-                )
-
-            if GEN_8_DLC in games:
-                objectives.append(
-                    GameObjectiveTemplate(
-                        label="Encounter and capture a Shiny Pokémon within a Dynamax Adventure",
-                        data=dict(),
-                        is_time_consuming=True,
-                        is_difficult=False,
-                        weight=1,
-                    )
-                )
+        return objectives
 
-            if any(game in outbreaks for game in games):
-                objectives.append(
-                    GameObjectiveTemplate(
-                        label="Encounter and capture a Shiny Pokémon within a mass outbreak",
-                        data=dict(),
-                        is_time_consuming=True,
-                        is_difficult=False,
-                        weight=1,
-                    )
-                )
+    @functools.cached_property
+    def owned_games(self) -> FrozenSet[str]:
+        return frozenset(self.archipelago_options.shiny_pokemon_hunt_owned_games.value)
 
-        return objectives
+    @functools.cached_property
+    def sorted_owned_games(self) -> Tuple[str, ...]:
+        return tuple(sorted(self.owned_games))
 
-    def games(self) -> List[str]:
-        return sorted(self.archipelago_options.shiny_pokemon_hunt_owned_games.value)
+    def games(self) -> Tuple[str, ...]:
+        return self.sorted_owned_games
 
 
 class ShinyPokemonHuntOwnedGames(OptionSet):
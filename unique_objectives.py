@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import itertools
+
+from random import Random
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from ..game import Game
+from ..game_objective_template import GameObjectiveTemplate
+
+from .objective_catalog import TemplateSampler
+from .objective_generation import GenerationSession, Pools, pool_for
+from .objective_space import objective_space
+
+
+# Rolls tried for an unused objective of a template, and the share of its objectives used before the unused ones
+# are listed instead of rolled. Templates with more objectives than the limit are never listed.
+ROLL_ATTEMPTS: int = 20
+ENUMERATION_SHARE: float = 0.5
+ENUMERATION_LIMIT: int = 10000
+
+# Placeholder -> the text of every value filled into it
+Fills = List[Tuple[str, List[str]]]
+
+
+def fill_label(label: str, fills: Fills) -> str:
+    for key, texts in fills:
+        label = label.replace(key, ", ".join(texts))
+
+    return label
+
+
+def objective_key(template: GameObjectiveTemplate, fills: Fills) -> str:
+    """
+    The label of an objective with the values of each placeholder sorted, the same for every order they were drawn in
+    """
+
+    return fill_label(template.label, [(key, sorted(texts)) for key, texts in fills])
+
+
+def draw_fills(template: GameObjectiveTemplate, random: Random, pools: Pools) -> Fills:
+    # The same draws as render_objective
+    fills: Fills = list()
+
+    for key, (collection_callable, quantity) in template.data.items():
+        collection: Tuple[Any, ...] = pool_for(collection_callable, pools)
+
+        if isinstance(quantity, range):
+            quantity = random.choice(quantity)
+
+        quantity = min(quantity, len(collection))
+        fills.append((key, [str(value) for value in random.sample(collection, quantity)]))
+
+    return fills
+
+
+def enumerate_objectives(template: GameObjectiveTemplate, pools: Pools) -> Iterator[str]:
+    """
+    The key of every objective a template can yield, each combination of values once
+    """
+
+    placeholders: List[Tuple[str, List[Tuple[str, ...]]]] = list()
+
+    for key, (collection_callable, quantity) in template.data.items():
+        pool: Tuple[Any, ...] = pool_for(collection_callable, pools)
+        texts: List[str] = sorted({str(value) for value in pool})
+        quantities: List[int] = sorted({
+            min(count, len(pool), len(texts)) for count in (quantity if isinstance(quantity, range) else (quantity,))
+        })
+
+        placeholders.append((key, [
+            values for count in quantities for values in itertools.combinations(texts, count)
+        ]))
+
+    keys: List[str] = [key for key, _ in placeholders]
+
+    for values in itertools.product(*(combinations for _, combinations in placeholders)):
+        yield fill_label(template.label, list(zip(keys, values)))
+
+
+class UniqueObjectiveRoller:
+    """
+    Rolls objectives of a game without ever repeating one. Objectives are told apart by their keys, so the same values
+    drawn in another order are a repeat, and kept in a set. A template is rolled again while most of its objectives
+    are unused. Once half of them are used, retries would pile up, so its unused objectives are listed once and drawn
+    from instead, keeping every roll bounded until the game runs out. Templates too large to list are rolled until
+    ROLL_ATTEMPTS rolls in a row only give repeats, and are then treated as used up.
+    """
+
+    game: Game
+    session: GenerationSession
+
+    seen: Set[str]
+
+    combinations: Dict[GameObjectiveTemplate, int]
+    used: Dict[GameObjectiveTemplate, int]
+    unused: Dict[GameObjectiveTemplate, List[str]]
+
+    sampler: TemplateSampler
+
+    def __init__(self, game: Game, session: GenerationSession = None) -> None:
+        self.game = game
+        self.session = session or GenerationSession()
+
+        self.seen = set()
+
+        self.combinations = {
+            space.template: space.combinations for space in objective_space(game, self.session.pools)
+        }
+
+        self.used = dict.fromkeys(self.combinations, 0)
+        self.unused = dict()
+
+        self.sampler = TemplateSampler(tuple(self.combinations))
+
+    def roll(self) -> Optional[str]:
+        """
+        An objective that wasn't rolled before, or None once every objective of the game was rolled
+        """
+
+        while self.sampler.templates:
+            template: GameObjectiveTemplate = self.sampler.sample(self.game.random)
+            rolled: Optional[Tuple[str, str]] = self.roll_template(template)
+
+            if rolled is None:
+                self.sampler = TemplateSampler(tuple(t for t in self.sampler.templates if t is not template))
+                continue
+
+            objective, key = rolled
+
+            self.seen.add(key)
+            self.used[template] += 1
+
+            return objective
+
+        return None
+
+    def roll_objectives(self, count: int) -> List[str]:
+        """
+        Up to `count` objectives that weren't rolled before, fewer when the game runs out
+        """
+
+        objectives: List[str] = list()
+
+        for _ in range(count):
+            objective: Optional[str] = self.roll()
+
+            if objective is None:
+                break
+
+            objectives.append(objective)
+
+        return objectives
+
+    def roll_template(self, template: GameObjectiveTemplate) -> Optional[Tuple[str, str]]:
+        # An unused objective of the template with its key, None once it has none left
+        combinations: int = self.combinations[template]
+        listable: bool = combinations <= ENUMERATION_LIMIT
+
+        if template not in self.unused and (not listable or self.used[template] < combinations * ENUMERATION_SHARE):
+            for _ in range(ROLL_ATTEMPTS):
+                fills: Fills = draw_fills(template, self.game.random, self.session.pools)
+                key: str = objective_key(template, fills)
+
+                if key not in self.seen:
+                    return fill_label(template.label, fills), key
+
+        if not listable:
+            return None
+
+        if template not in self.unused:
+            self.unused[template] = [
+                key for key in dict.fromkeys(enumerate_objectives(template, self.session.pools))
+                if key not in self.seen
+            ]
+
+        unused: List[str] = self.unused[template]
+
+        # Other templates can yield the same key, so listed objectives are checked again when drawn
+        while unused:
+            i: int = self.game.random.randrange(len(unused))
+            unused[i], unused[-1] = unused[-1], unused[i]
+
+            key = unused.pop()
+
+            if key not in self.seen:
+                return key, key
+
+        return None